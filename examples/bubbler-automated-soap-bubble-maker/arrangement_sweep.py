@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Bubbler arrangement sweep — hundreds of variants, Pareto-optimal ones drawn as small multiples.
+
+arrangement_viz.py draws one arrangement from fixed dimensions. This sweeps
+the same dimensions over ranges, scores every variant with the same geometry
+(bubbler_dims.py, evaluated over the whole grid at once), and draws the side cross-section of each
+Pareto-optimal variant:
+
+  - footprint   base_short × base_long (cm², minimised)
+  - height      tallest of loop top and protrusion top (mm, minimised)
+  - margin      smallest clearance margin (mm, maximised):
+      vat fit     loop lies flat in the vat: min(vat_long, vat_short) - loop_diam
+      taper       protrusion still tapers: prot_base_w - (duct_diam + 2 × duct_clearance)
+      fan fit     protrusion width at fan height - 2 mm rim - duct_diam
+      battery     battery bay width - 2×2 AA holder
+      dip         loop tip below solution surface at the 265° dip angle
+
+Variants with a negative margin are infeasible and never reach the front.
+Each panel also gives the smallest tip-over angle over wand up / down and
+vat full / empty (stability.py's lumped mass model), reported, not scored.
+The panels are one scripts/multiples.py sheet on a shared scale; -n sets
+how many, and --feasible spreads them over every feasible variant instead
+of the front.
+
+Usage:
+    python3 arrangement_sweep.py                          # default ranges
+    python3 arrangement_sweep.py vat_short=160:200:10 arm_len=25,30,35 -j 4
+    python3 arrangement_sweep.py --feasible -n 48         # 48 feasible variants on one sheet
+"""
+
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.patches import Polygon
+import numpy as np
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+import sweep  # noqa: E402
+from bubbler_dims import DIMS  # noqa: E402
+from multiples import Sheet  # noqa: E402
+from primitives import box  # noqa: E402
+from stability import worst_tip  # noqa: E402
+
+MECH = "#1a5276"; POWER = "#27ae60"; FLOW = "#2e86c1"
+STRUCT = "#5d6d7e"; TEXT = "#1a1a1a"; ACCENT = "#d35400"; WAND_C = "#2471a3"
+LOOP_C = "#1a5276"; DUCT_C = "#1a5276"
+
+# ── Fixed dimensions come from bubbler_dims.py; the AA holder is not part of that model ──
+HOLDER_W = 31   # 2×2 AA holder
+
+# ── Swept dimensions: arrangement_viz.py's values sit inside each range ──
+RANGES = {
+    "vat_long":       "180:220:10",
+    "vat_short":      "160:190:10",
+    "loop_diam":      "160",
+    "duct_diam":      "30:45:5",
+    "duct_clearance": "5:15:5",
+    "prot_base_w":    "45:70:5",
+    "arm_len":        "25:40:5",
+}
+MAX_PANELS = 12
+
+
+def model(p):
+    """Geometry and fit metrics for every variant in p ({name: array})."""
+    d = DIMS.evaluate(**p)
+    margins = np.stack([
+        np.minimum(d["vat_long"], d["vat_short"]) - d["loop_diam"],
+        d["prot_base_w"] - d["prot_top_w"],
+        d["fan_bay_w"] - 2 - d["duct_diam"],
+        (d["bay_w"] - 2) - HOLDER_W,
+        d["sol_surface"] - d["dip_tip_y"],
+    ])
+    return {
+        "base_short": d["base_short"],
+        "base_long": d["base_long"],
+        "footprint": d["footprint"],
+        "height": d["height"],
+        "loop_top": d["loop_top"],
+        "prot_top_y": d["prot_top_y"],
+        "margin": margins.min(axis=0),
+        "limit": margins.argmin(axis=0),
+        "tip": worst_tip(d),
+    }
+
+
+LIMITS = ["vat fit", "taper", "fan fit", "battery", "dip"]
+
+
+def front(params, metrics):
+    """Indices of the feasible, Pareto-optimal variants (footprint, height, -margin)."""
+    feasible = np.flatnonzero(metrics["margin"] >= 0)
+    costs = np.column_stack([metrics["footprint"][feasible], metrics["height"][feasible],
+                             -metrics["margin"][feasible]])
+    return feasible[sweep.pareto(costs)]
+
+
+def draw_variant(panel, p, m):
+    """Side cross-section of one variant: base, vat, tapered protrusion, wand, loop, duct."""
+    d = DIMS.evaluate(**p)
+    vat_y, vat_ext = d["vat_y"], d["vat_ext"]
+    vat_right = 3 + vat_ext
+    shaft_x = vat_right - 5
+    shaft_y = d["shaft_y"]
+    loop_bot = d["arm_tip_y"]
+    loop_cy = d["loop_center_y"]
+    duct_r = d["duct_r"]
+
+    panel.add(box(0, d["foot_h"], m["base_short"], d["base_thick"],
+                  boxstyle="square,pad=0", facecolor=STRUCT, edgecolor="#444444",
+                  linewidth=0.8, alpha=0.85))
+    panel.add(box(3, vat_y, vat_ext, d["vat_depth"], boxstyle="square,pad=0",
+                  facecolor=FLOW, edgecolor=FLOW, linewidth=0.8, alpha=0.5))
+    left, right = vat_right + 2, m["base_short"] - 2
+    cx, half = (left + right) / 2, d["prot_top_w"] / 2
+    top = m["prot_top_y"]
+    panel.add(Polygon([(left, vat_y), (right, vat_y), (cx + half, top), (cx - half, top)],
+                      closed=True, facecolor="#E0E0E0", edgecolor=STRUCT, linewidth=1.2, alpha=0.5))
+    panel.add(box(left + 1, vat_y + 2, right - left - 2, 15, boxstyle="round,pad=0.5",
+                  facecolor=POWER, edgecolor="#667788", linewidth=0.6, alpha=0.85))
+    panel.add(box(left + 1, shaft_y - 6, d["motor_depth"], 12, boxstyle="round,pad=0.5",
+                  facecolor=MECH, edgecolor="#667788", linewidth=0.6, alpha=0.85))
+    panel.add(box(shaft_x + 3, loop_cy - duct_r, cx - half - shaft_x - 3, p["duct_diam"],
+                  boxstyle="square,pad=0", facecolor="#d5e8f0", edgecolor=DUCT_C,
+                  linewidth=0.8, alpha=0.6))
+    panel.plot([shaft_x, shaft_x], [shaft_y, loop_bot], color=WAND_C, lw=2.5)
+    panel.plot([shaft_x, shaft_x], [loop_bot, loop_bot + p["loop_diam"]], color=LOOP_C, lw=2)
+    panel.point(shaft_x, shaft_y, color=ACCENT, ms=4)
+
+
+def render(params, metrics, picks, path, title=None):
+    """Small multiples of the picked variants, on one scale so sizes compare by eye."""
+    extent = (-10, metrics["base_short"][picks].max() + 10, -10, metrics["height"][picks].max() + 10)
+    title = title or "Bubbler — Pareto-Optimal Arrangements (footprint · height · clearance margin)"
+    sheet = Sheet(len(picks), extent, cols=4 if len(picks) <= 16 else 8, title=title)
+    sheet.static([plt.Rectangle((extent[0], -1), extent[1] - extent[0], 1, facecolor="#999999")])  # ground
+    for k, i in enumerate(picks):
+        p = {name: v[i] for name, v in params.items()}
+        m = {name: v[i] for name, v in metrics.items()}
+        panel = sheet.panel(k)
+        draw_variant(panel, p, m)
+        panel.title(f"#{k + 1}   {m['footprint']:.0f} cm²  ·  {m['height']:.0f} mm tall")
+        panel.text(0.02, 0.98,
+                   f"vat {p['vat_long']:.0f}×{p['vat_short']:.0f}  loop Ø{p['loop_diam']:.0f}\n"
+                   f"duct Ø{p['duct_diam']:.0f} +{p['duct_clearance']:.0f}  base w {p['prot_base_w']:.0f}"
+                   f"  arm {p['arm_len']:.0f}\n"
+                   f"margin {m['margin']:.1f} mm ({LIMITS[int(m['limit'])]})  tip {m['tip']:.0f}°",
+                   color=TEXT, fontsize=6.5, va="top", family="monospace")
+    sheet.save(path)
+
+
+def main():
+    ranges, workers, panels, feasible_only = dict(RANGES), 0, MAX_PANELS, False
+    args = sys.argv[1:]
+    while args:
+        arg = args.pop(0)
+        if arg == "-j":
+            workers = int(args.pop(0))
+        elif arg == "-n":
+            panels = int(args.pop(0))
+            if panels < 1:
+                raise SystemExit(f"-n must be at least 1, not {panels}")
+        elif arg == "--feasible":
+            feasible_only = True
+        else:
+            name, _, spec = arg.partition("=")
+            if name not in RANGES:
+                raise SystemExit(f"Unknown parameter {name!r}; sweepable: {', '.join(RANGES)}")
+            ranges[name] = spec
+
+    params = sweep.grid(ranges)
+    metrics = sweep.evaluate(model, params, workers)
+    best = front(params, metrics)
+    feasible = int((metrics["margin"] >= 0).sum())
+    print(f"{len(metrics['margin'])} variants, {feasible} feasible, {len(best)} Pareto-optimal")
+    if not len(best):
+        raise SystemExit("No feasible variant in these ranges")
+    title = None
+    if feasible_only:
+        best = np.flatnonzero(metrics["margin"] >= 0)
+        title = "Bubbler — Feasible Arrangements by Footprint (height · clearance margin · tip angle)"
+    picks = best[sweep.spread(metrics["footprint"][best], panels)]
+    out = os.path.join(_DIR, "arrangement_sweep.png")
+    start = time.perf_counter()
+    render(params, metrics, picks, out, title)
+    print(f"Saved: {out} ({len(picks)} panels, {time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,41 @@
 #!/usr/bin/env python3
-"""Bubbler arrangement — shaft on right by protrusion, trapezoid protrusion tapers to duct exit."""
+"""Bubbler arrangement — shaft on right by protrusion, trapezoid protrusion tapers to duct exit.
+
+Boxes and arrows go through scripts/batch.py, so each view draws them as a
+handful of collections rather than one artist per shape. The side view's parts
+are checked against the stated clearances (scripts/clearance.py); violations
+are printed and marked in red on the figure, and the wand's 175° swing is
+swept against the vat, protrusion and rim (scripts/kinematics.py). With
+--animate [path.gif|.mp4] the swing is also written as an animation, the wand
+blitted over the static figure (scripts/animate.py).
+"""
+
+import os
+import sys
 
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, Arc, Polygon
+from matplotlib.patches import Arc, Polygon
+from matplotlib.transforms import Affine2D
 import numpy as np
 
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+from batch import Batch  # noqa: E402
+import clearance as interference  # noqa: E402  (the name "clearance" is a dimension below)
+import animate  # noqa: E402
+import labels  # noqa: E402
+import primitives  # noqa: E402
+from primitives import box  # noqa: E402
+import kinematics  # noqa: E402
+from bubbler_dims import DIMS  # noqa: E402
+
 fig, (ax_side, ax_front) = plt.subplots(1, 2, figsize=(18, 13),
                                          gridspec_kw={"width_ratios": [1.0, 1.0]})
 fig.patch.set_facecolor("#F0F0F0")
+batches = {ax_side: Batch(ax_side), ax_front: Batch(ax_front)}
 
 MECH = "#1a5276"; ELEC = "#c0392b"; SENSE = "#7d3c98"; POWER = "#27ae60"
 FLOW = "#2e86c1"; STRUCT = "#5d6d7e"; TEXT = "#1a1a1a"; DIM = "#d35400"
@@ -17,69 +43,48 @@ ACCENT = "#d35400"; AIR = "#0e6655"; WAND_C = "#2471a3"; LOOP_C = "#1a5276"
 DUCT_C = "#1a5276"; WIRE_C = "#b9770e"
 
 S = 1 / 12  # 1 unit = 12mm
+dim_labels = []  # dimension text, moved off other text once the layout is final
 
+# The shapes come from scripts/primitives.py; these bind this figure's palette and batches.
 def setup(ax, title, sub, xlim, ylim):
-    ax.set_facecolor("#FFFFFF"); ax.set_xlim(*xlim); ax.set_ylim(*ylim)
-    ax.set_aspect("equal"); ax.axis("off")
-    ax.text((xlim[0]+xlim[1])/2, ylim[1]-0.3, title, color=ACCENT, fontsize=13,
-            fontweight="bold", ha="center")
-    ax.text((xlim[0]+xlim[1])/2, ylim[1]-0.9, sub, color="#555555", fontsize=8,
-            ha="center", style="italic")
+    primitives.setup(ax, title, sub, xlim, ylim, ACCENT)
 
 def rbox(ax, x, y, w, h, label, sub, fill, border=None, fs=7.5, alpha=0.85):
-    r = FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.04",
-                        facecolor=fill, edgecolor=border or "#667788", linewidth=1.2, alpha=alpha)
-    ax.add_patch(r)
-    ax.text(x+w/2, y+h/2+0.1, label, color=TEXT, fontsize=fs,
-            fontweight="bold", ha="center", va="center")
-    if sub:
-        ax.text(x+w/2, y+h/2-0.2, sub, color="#666666", fontsize=5,
-                ha="center", va="center")
+    primitives.rbox(ax, batches[ax], x, y, w, h, label, sub, fill, border, fs, alpha)
+
+def arrow(ax, x1, y1, x2, y2, style, color, lw, alpha=None):
+    primitives.arrow(batches[ax], x1, y1, x2, y2, style, color, lw, alpha)
 
 def dimline(ax, x1, y1, x2, y2, label, off=0.2, side="auto"):
-    ax.annotate("", xy=(x2, y2), xytext=(x1, y1),
-                arrowprops=dict(arrowstyle="<->", color=DIM, lw=0.9))
-    mx, my = (x1+x2)/2, (y1+y2)/2
-    if side == "left":
-        ax.text(mx-off-0.1, my, label, color=DIM, fontsize=6, ha="right", va="center")
-    elif side == "right":
-        ax.text(mx+off+0.1, my, label, color=DIM, fontsize=6, ha="left", va="center")
-    else:
-        if abs(x2-x1) > abs(y2-y1):
-            ax.text(mx, my+off, label, color=DIM, fontsize=6, ha="center")
-        else:
-            ax.text(mx+off+0.1, my, label, color=DIM, fontsize=6, ha="left", va="center")
+    dim_labels.append(primitives.dimline(ax, batches[ax], x1, y1, x2, y2, label, DIM, off, side))
 
 def farrow(ax, x1, y1, x2, y2, label="", col=AIR):
-    ax.annotate("", xy=(x2, y2), xytext=(x1, y1),
-                arrowprops=dict(arrowstyle="-|>", color=col, lw=1.8))
-    if label:
-        mx, my = (x1+x2)/2, (y1+y2)/2
-        ax.text(mx, my+0.25, label, color=col, fontsize=5.5, ha="center")
-
-# ── Dimensions (mm) ──
-base_thick = 10 * S
-vat_depth  = 20 * S
-vat_wall   = 3 * S
-vat_long   = 200 * S
-vat_short  = 170 * S
-clearance  = 5 * S
-arm_len    = 30 * S
-loop_diam  = 160 * S
-loop_r     = 80 * S
-duct_diam  = 40 * S
-duct_r     = 20 * S
-duct_clearance = 10 * S  # 10mm radial clearance around duct
-sol_depth  = 12 * S
-foot_h     = 5 * S
-motor_depth = 15 * S
+    primitives.farrow(ax, batches[ax], x1, y1, x2, y2, label, col)
+
+# ── Dimensions: declared once in bubbler_dims.py, read here in drawing units ──
+d = DIMS.view(S)
+base_thick = d.base_thick
+vat_depth  = d.vat_depth
+vat_wall   = d.vat_wall
+vat_long   = d.vat_long
+vat_short  = d.vat_short
+clearance  = d.clearance
+arm_len    = d.arm_len
+loop_diam  = d.loop_diam
+loop_r     = d.loop_r
+duct_diam  = d.duct_diam
+duct_r     = d.duct_r
+duct_clearance = d.duct_clearance  # 10mm radial clearance around duct
+sol_depth  = d.sol_depth
+foot_h     = d.foot_h
+motor_depth = d.motor_depth
 
 # Protrusion: base width = full motor bay width, top = duct_diam + 2*clearance
-prot_base_w = 60 * S   # ~60mm at base (battery + motor + clearances)
-prot_top_w  = (duct_diam + 2*duct_clearance)  # 60mm at top (40mm duct + 20mm clearance)
+prot_base_w = d.prot_base_w  # ~60mm at base (battery + motor + clearances)
+prot_top_w  = d.prot_top_w   # 60mm at top (40mm duct + 20mm clearance)
 
-base_short = vat_short + 2*vat_wall + prot_base_w + 10*S  # base width
-base_long  = 215 * S
+base_short = d.base_short
+base_long  = d.base_long
 
 # ══════════════════════════════════════════
 #  SIDE CROSS-SECTION: looking along LONG axis (200mm)
@@ -94,19 +99,20 @@ base_x = 0.5; base_y = foot_h
 
 # Rubber feet
 for fx in [base_x + 0.3, base_x + base_short - 0.3]:
-    ax_side.add_patch(FancyBboxPatch((fx - 0.25, 0), 0.5, foot_h,
+    batches[ax_side].add(box(fx - 0.25, 0, 0.5, foot_h,
         boxstyle="round,pad=0.02", facecolor="#888888", edgecolor="#555555", linewidth=1))
 
 # Base plate
-ax_side.add_patch(FancyBboxPatch((base_x, base_y), base_short, base_thick,
+batches[ax_side].add(box(base_x, base_y, base_short, base_thick,
     boxstyle="square,pad=0", facecolor=STRUCT, edgecolor="#444444", linewidth=1.2, alpha=0.85))
+batches[ax_side].flush()   # the vat and protrusion below draw over the base
 ax_side.text(base_x + base_short/2, base_y + base_thick/2, "BASE",
              color=TEXT, fontsize=6, ha="center")
 
 # ── VAT (left portion) ──
-vat_ext = vat_short + 2*vat_wall
+vat_ext = d.vat_ext
 vat_x = base_x + 3*S
-vat_y = base_y + base_thick
+vat_y = d.vat_y
 vat_right = vat_x + vat_ext
 
 ax_side.fill([vat_x, vat_right, vat_right, vat_right-vat_wall,
@@ -121,7 +127,7 @@ ax_side.text((vat_x+vat_right)/2, vat_y+vat_depth/2, "VAT (170mm)",
              color=TEXT, fontsize=6, ha="center", fontweight="bold")
 
 # ── SHAFT on RIGHT side, next to protrusion ──
-shaft_y = vat_y + vat_depth + clearance
+shaft_y = d.shaft_y
 shaft_x = vat_right - 5*S  # shaft near right vat wall, connecting to motor in protrusion
 
 ax_side.plot(shaft_x, shaft_y, 'o', color=ACCENT, markersize=9, zorder=6)
@@ -130,30 +136,28 @@ ax_side.text(shaft_x + 0.4, shaft_y + 0.2, "shaft", color=ACCENT,
 
 # ── WAND ARM — extends LEFT from shaft ──
 # Blow position: arm goes up-left (~90° = straight up)
-blow_angle = np.radians(90)  # straight up
-arm_tip_x = shaft_x - arm_len * np.cos(blow_angle)  # = shaft_x (straight up, no X change)
-arm_tip_y = shaft_y + arm_len * np.sin(blow_angle)   # = shaft_y + arm_len
+arm_tip_x = shaft_x + d.arm_tip_dx  # = shaft_x (straight up, no X change)
+arm_tip_y = d.arm_tip_y           # = shaft_y + arm_len
 
-ax_side.plot([shaft_x, arm_tip_x], [shaft_y, arm_tip_y],
-             color=WAND_C, linewidth=4, solid_capstyle="round", zorder=4)
+wand_arm, = ax_side.plot([shaft_x, arm_tip_x], [shaft_y, arm_tip_y],
+                         color=WAND_C, linewidth=4, solid_capstyle="round", zorder=4)
 
 # Loop edge-on (vertical line, 160mm tall, from arm tip upward)
 loop_bot = arm_tip_y
-loop_top = arm_tip_y + loop_diam
-loop_center_y = (loop_bot + loop_top) / 2
+loop_top = d.loop_top
+loop_center_y = d.loop_center_y
 
-ax_side.plot([shaft_x, shaft_x], [loop_bot, loop_top],
-             color=LOOP_C, linewidth=3, solid_capstyle="round", zorder=4)
+wand_loop, = ax_side.plot([shaft_x, shaft_x], [loop_bot, loop_top],
+                          color=LOOP_C, linewidth=3, solid_capstyle="round", zorder=4)
 ax_side.text(shaft_x - 0.5, loop_center_y, "loop\n(edge-on)\n160mm", color=LOOP_C,
              fontsize=5.5, ha="right", fontweight="bold")
-ax_side.plot(shaft_x, loop_center_y, '+', color=LOOP_C, markersize=8,
-             markeredgewidth=1.5, zorder=5)
+wand_center, = ax_side.plot(shaft_x, loop_center_y, '+', color=LOOP_C, markersize=8,
+                            markeredgewidth=1.5, zorder=5)
 
 # Dip position: arm rotates from 90° to ~265° (175° sweep)
 # At 265°: arm points down-left
-dip_angle = np.radians(265)
-dip_arm_x = shaft_x + arm_len * np.cos(dip_angle)
-dip_arm_y = shaft_y + arm_len * np.sin(dip_angle)
+dip_arm_x = shaft_x + d.dip_tip_dx
+dip_arm_y = d.dip_tip_y
 ax_side.plot([shaft_x, dip_arm_x], [shaft_y, dip_arm_y],
              color=WAND_C, linewidth=2, linestyle="--", alpha=0.35)
 
@@ -191,7 +195,7 @@ prot_top_left = prot_center_x - prot_top_half
 prot_top_right = prot_center_x + prot_top_half
 
 prot_bot_y = vat_y  # starts at base top / vat bottom level
-prot_top_y = loop_center_y + duct_r + 15*S  # extends above duct center
+prot_top_y = d.prot_top_y  # extends above duct center
 
 # Draw trapezoid
 trap_x = [prot_base_left, prot_base_right, prot_top_right, prot_top_left]
@@ -229,7 +233,7 @@ ax_side.plot([motor_x, shaft_x], [shaft_y, shaft_y],
 
 # Fan — upper portion of protrusion, mounted on rim
 # Width narrows here due to taper
-fan_y_pos = prot_top_y - 15*S
+fan_y_pos = d.fan_y
 # Calculate protrusion width at fan height (linear interpolation)
 t_fan = (fan_y_pos - prot_bot_y) / (prot_top_y - prot_bot_y)
 fan_left = prot_base_left + t_fan * (prot_top_left - prot_base_left)
@@ -292,6 +296,53 @@ dimline(ax_side, 20.5, vat_y, 20.5, vat_y + vat_depth, "20mm", side="right")
 dimline(ax_side, prot_top_left, prot_top_y + 0.5, prot_top_right, prot_top_y + 0.5,
         f"{int(prot_top_half*2/S)}mm (duct+clr)")
 
+# ── Clearance check: the stated clearances (component_arrangement.md) against the placement ──
+shaft_r = 2*S
+side_shapes = [
+    interference.outline("protrusion", list(zip(trap_x, trap_y))),
+    interference.rect("vat", vat_x, vat_y, vat_ext, vat_depth),
+    interference.circle("shaft", shaft_x, shaft_y, shaft_r),
+    interference.rect("battery", batt_x, batt_y, batt_w, batt_h),
+    interference.rect("PCBA", pcba_x, pcba_y, pcba_w, pcba_h),
+    interference.rect("motor", motor_x, motor_y, motor_w, motor_h),
+    interference.rect("fan", fan_x, fan_y_pos, fan_w, 10*S),
+    interference.rect("duct", prot_center_x - duct_r, duct_y_center + duct_r,
+                   duct_diam, fan_y_pos - duct_y_center - duct_r),
+]
+side_rules = {
+    ("duct", "protrusion"): duct_clearance,    # 10mm radial duct clearance
+    ("shaft", "vat"): 5*S - shaft_r,           # shaft axis 5mm above the vat rim
+}
+violations = interference.check(side_shapes, side_rules)
+for line in interference.report(violations, 1/S, "mm"):
+    print(f"Clearance: {line}")
+interference.highlight(ax_side, violations, 1/S, "mm", shapes=side_shapes)
+
+# ── Swept clearance: wand arm and loop over the 90° → 265° swing ──
+swing = kinematics.rotation((shaft_x, shaft_y), d.blow_angle, d.dip_angle)
+arm = interference.outline("arm", [(shaft_x, shaft_y), (arm_tip_x, arm_tip_y)])
+loop = interference.outline("loop", [(shaft_x, loop_bot), (shaft_x, loop_top)])
+walls = [
+    interference.rect("vat wall (L)", vat_x, vat_y, vat_wall, vat_depth),
+    interference.rect("vat wall (R)", vat_right - vat_wall, vat_y, vat_wall, vat_depth),
+    interference.rect("vat floor", vat_x, vat_y, vat_ext, vat_wall),
+    interference.polygon("protrusion", list(zip(trap_x, trap_y))),
+    interference.outline("rim", [(rim_lx, vat_y), (rim_lx, rim_ltop)]),
+]
+# The loop is flexible and lies flat on the vat floor at the dip; only the rigid parts count there.
+swept = (kinematics.sweep([arm], walls, swing)
+         + kinematics.sweep([loop], [w for w in walls if not w.name.startswith("vat")], swing))
+for line in kinematics.report(swept, 1/S, "mm"):
+    print(f"Swing: {line}")
+for part in (arm, loop):
+    env = kinematics.envelope(part, swing)
+    ax_side.fill(env[:, 0], env[:, 1], color=WAND_C, alpha=0.05, linewidth=0)
+for c in swept:
+    if c.contact:
+        ax_side.plot(*c.p, "x", color="#e74c3c", markersize=7, markeredgewidth=2, zorder=9)
+        ax_side.text(c.p[0] + 0.2, c.p[1] - 0.35, f"{c.part} hits {c.static} at {c.at:.0f}°",
+                     color="#e74c3c", fontsize=5.5, fontweight="bold", zorder=9)
+
 ax_side.annotate("bubbles inflate\ninto page ⊗",
                  xy=(shaft_x - loop_r, loop_top + 0.3),
                  xytext=(shaft_x - loop_r - 2, loop_top + 1),
@@ -311,12 +362,13 @@ fb_w = base_long; fb_x = 0.5; fb_y = foot_h
 
 # Rubber feet
 for fx in [fb_x + 0.3, fb_x + fb_w - 0.3]:
-    ax_front.add_patch(FancyBboxPatch((fx - 0.25, 0), 0.5, foot_h,
+    batches[ax_front].add(box(fx - 0.25, 0, 0.5, foot_h,
         boxstyle="round,pad=0.02", facecolor="#888888", edgecolor="#555555", linewidth=1))
 
 # Base
-ax_front.add_patch(FancyBboxPatch((fb_x, fb_y), fb_w, base_thick,
+batches[ax_front].add(box(fb_x, fb_y, fb_w, base_thick,
     boxstyle="square,pad=0", facecolor=STRUCT, edgecolor="#444444", linewidth=1.2, alpha=0.85))
+batches[ax_front].flush()
 ax_front.text(fb_x + fb_w/2, fb_y + base_thick/2, "BASE (215mm)",
               color=TEXT, fontsize=6, ha="center")
 
@@ -373,10 +425,9 @@ ax_front.text(floop_cx, f_loop_cy, "DUCT\nØ40", color=AIR,
 # Airflow arrows
 for a_deg in range(0, 360, 45):
     a = np.radians(a_deg)
-    ax_front.annotate("",
-        xy=(floop_cx + loop_r*0.85*np.cos(a), f_loop_cy + loop_r*0.85*np.sin(a)),
-        xytext=(floop_cx + duct_r*0.6*np.cos(a), f_loop_cy + duct_r*0.6*np.sin(a)),
-        arrowprops=dict(arrowstyle="-|>", color=AIR, lw=0.8, alpha=0.5))
+    arrow(ax_front, floop_cx + duct_r*0.6*np.cos(a), f_loop_cy + duct_r*0.6*np.sin(a),
+          floop_cx + loop_r*0.85*np.cos(a), f_loop_cy + loop_r*0.85*np.sin(a),
+          "-|>", AIR, 0.8, alpha=0.5)
 ax_front.text(floop_cx, f_loop_cy - loop_r - 0.5, "air disperses through film",
               color=AIR, fontsize=5.5, ha="center", style="italic")
 
@@ -420,8 +471,45 @@ for i, (color, label) in enumerate(legend_items):
 fig.suptitle("Bubbler — Component Arrangement (Side + Front Views)",
              color=ACCENT, fontsize=15, fontweight="bold", y=0.98)
 
+for b in batches.values():
+    b.flush()
+
 plt.tight_layout(rect=[0, 0.04, 1, 0.95])
-out = "/Users/yoel/Desktop/product_ideas/output/bubbler-automated-soap-bubble-maker/arrangement_options.png"
+moved = labels.resolve_texts(dim_labels, [t for ax in (ax_side, ax_front) for t in ax.texts
+                                          if t not in dim_labels])
+print(f"Labels: {moved} dimension labels moved off other text")
+out = os.path.join(_DIR, "arrangement_options.png")
 fig.savefig(out, dpi=180, facecolor=fig.get_facecolor())
-plt.close()
+# Vector twin for the carousel PDF (scripts/pdf_figure.py); same figure, no redraw of the script.
+fig.savefig(os.path.splitext(out)[0] + ".pdf", facecolor=fig.get_facecolor(),
+            metadata={"CreationDate": None})
 print(f"Saved: {out}")
+
+# ── Animation: the wand swung from blow to dip over the static figure (scripts/animate.py) ──
+# python3 arrangement_viz.py --animate [wand_swing.gif | .mp4]
+args = sys.argv[1:]
+if "--animate" in args:
+    rest = args[args.index("--animate") + 1:]
+    anim_out = rest[0] if rest else os.path.join(_DIR, "wand_swing.gif")
+    wand = [wand_arm, wand_loop, wand_center]
+    rot = Affine2D()
+    for a in wand:
+        a.set_transform(rot + ax_side.transData)
+    readout = ax_side.text(shaft_x + 0.4, shaft_y - 0.5, "", color=ACCENT, fontsize=7, fontweight="bold")
+    # Same samples as the swept check; the wand turns red where it touches the vat or rim.
+    step = 5
+    angles = kinematics.samples(swing)[::step]
+    hit = (kinematics.contact([arm], walls, swing)
+           | kinematics.contact([loop], [w for w in walls if not w.name.startswith("vat")], swing))[::step]
+
+    def pose(i):
+        rot.clear().rotate_deg_around(shaft_x, shaft_y, angles[i] - d.blow_angle)
+        color = "#e74c3c" if hit[i] else None
+        wand_arm.set_color(color or WAND_C)
+        wand_loop.set_color(color or LOOP_C)
+        wand_center.set_color(color or LOOP_C)
+        readout.set_text(f"{angles[i]:.0f}°" + ("  contact" if hit[i] else ""))
+
+    n = animate.record(fig, wand + [readout], pose, range(len(angles)), anim_out, fps=12, dpi=72)
+    print(f"Saved: {anim_out} ({n} frames)")
+plt.close()
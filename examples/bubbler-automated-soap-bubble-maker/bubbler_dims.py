@@ -0,0 +1,150 @@
+"""Bubbler dimension model — the numbers behind component_arrangement.md, declared once.
+
+Inputs are the stated dimensions (mm, degrees); rules derive the rest.
+arrangement_viz.py reads it in drawing units (DIMS.view(1/12)) and
+arrangement_sweep.py evaluates it over whole parameter grids
+(DIMS.evaluate(**arrays)), so both draw and score the same geometry.
+Heights are measured from the ground under the rubber feet.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+
+from dimensions import Model  # noqa: E402
+
+DIMS = Model()
+
+# ── Inputs (mm unless noted) ──
+DIMS.input("foot_h", 5)
+DIMS.input("base_thick", 10)
+DIMS.input("vat_long", 200)
+DIMS.input("vat_short", 170)
+DIMS.input("vat_depth", 20)
+DIMS.input("vat_wall", 3)
+DIMS.input("sol_depth", 12)
+DIMS.input("clearance", 5)          # shaft axis above the vat rim
+DIMS.input("arm_len", 30)
+DIMS.input("loop_diam", 160)
+DIMS.input("duct_diam", 40)
+DIMS.input("duct_clearance", 10)    # radial clearance around the duct at the protrusion top
+DIMS.input("prot_base_w", 60)       # battery + motor + clearances
+DIMS.input("prot_cap", 15)          # protrusion above the duct top
+DIMS.input("fan_h", 10)
+DIMS.input("motor_depth", 15)
+DIMS.input("blow_angle", 90, unit="deg")
+DIMS.input("dip_angle", 265, unit="deg")
+
+
+# ── Derived ──
+
+@DIMS.rule
+def loop_r(loop_diam):
+    return loop_diam / 2
+
+
+@DIMS.rule
+def duct_r(duct_diam):
+    return duct_diam / 2
+
+
+@DIMS.rule
+def prot_top_w(duct_diam, duct_clearance):
+    return duct_diam + 2 * duct_clearance
+
+
+@DIMS.rule
+def vat_ext(vat_short, vat_wall):
+    return vat_short + 2 * vat_wall
+
+
+@DIMS.rule
+def base_short(vat_ext, prot_base_w):
+    return vat_ext + prot_base_w + 10
+
+
+@DIMS.rule
+def base_long(vat_long, vat_wall):
+    return vat_long + 2 * vat_wall + 9
+
+
+@DIMS.rule
+def vat_y(foot_h, base_thick):
+    return foot_h + base_thick
+
+
+@DIMS.rule
+def sol_surface(vat_y, vat_wall, sol_depth):
+    return vat_y + vat_wall + sol_depth
+
+
+@DIMS.rule
+def shaft_y(vat_y, vat_depth, clearance):
+    return vat_y + vat_depth + clearance
+
+
+@DIMS.rule
+def arm_tip_dx(arm_len, blow_angle):
+    return arm_len * np.cos(np.radians(blow_angle))
+
+
+@DIMS.rule
+def arm_tip_y(shaft_y, arm_len, blow_angle):
+    return shaft_y + arm_len * np.sin(np.radians(blow_angle))
+
+
+@DIMS.rule
+def dip_tip_dx(arm_len, dip_angle):
+    return arm_len * np.cos(np.radians(dip_angle))
+
+
+@DIMS.rule
+def dip_tip_y(shaft_y, arm_len, dip_angle):
+    return shaft_y + arm_len * np.sin(np.radians(dip_angle))
+
+
+@DIMS.rule
+def loop_top(arm_tip_y, loop_diam):
+    return arm_tip_y + loop_diam
+
+
+@DIMS.rule
+def loop_center_y(arm_tip_y, loop_r):
+    return arm_tip_y + loop_r
+
+
+@DIMS.rule
+def prot_top_y(loop_center_y, duct_r, prot_cap):
+    return loop_center_y + duct_r + prot_cap
+
+
+@DIMS.rule
+def height(loop_top, prot_top_y):
+    return np.maximum(loop_top, prot_top_y)
+
+
+@DIMS.rule(unit=None)
+def footprint(base_short, base_long):
+    """cm²"""
+    return base_short * base_long / 100
+
+
+@DIMS.rule
+def bay_w(prot_base_w):
+    """Protrusion width at its base: base_short less the vat, rim and edge allowances."""
+    return prot_base_w + 3
+
+
+@DIMS.rule
+def fan_y(prot_top_y, prot_cap):
+    return prot_top_y - prot_cap
+
+
+@DIMS.rule
+def fan_bay_w(bay_w, prot_top_w, fan_y, vat_y, prot_top_y):
+    """Protrusion width at the fan's base, where the taper has narrowed it."""
+    t = (fan_y - vat_y) / (prot_top_y - vat_y)
+    return bay_w + t * (prot_top_w - bay_w)
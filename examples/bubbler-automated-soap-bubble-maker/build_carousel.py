@@ -6,10 +6,10 @@ Uses reportlab for PDF and python-pptx for PPTX generation.
 """
 
 import os
+import sys
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, white
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
@@ -18,6 +18,12 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
 _DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+from pdf_figure import draw_figure  # noqa: E402
+
+# Diagrams sit in the bottom-left of their frame, as drawImage(anchor="sw") did.
+SW = (0.0, 1.0)
 
 # -- Page size: 4:5 ratio --
 PW = 190 * mm
@@ -157,10 +163,7 @@ if os.path.exists(img_path):
     img_top_y = 68 * mm
     img_max_w = PW - 2 * M
     img_max_h = 140 * mm
-    c.drawImage(ImageReader(img_path),
-                M, PH - img_top_y - img_max_h,
-                width=img_max_w, height=img_max_h,
-                preserveAspectRatio=True, anchor='sw', mask='auto')
+    draw_figure(c, img_path, M, PH - img_top_y - img_max_h, img_max_w, img_max_h, align=SW)
 
 # Bottom bar
 card_flat(c, 0, PH - 8 * mm, PW, 8 * mm, CARD_BG)
@@ -309,10 +312,7 @@ arr_path = os.path.join(_DIR, "arrangement_options.png")
 if os.path.exists(arr_path):
     card(c, M, 202 * mm, PW - 2 * M, 30 * mm, CARD_BG_ALT)
     txt(c, M + 4 * mm, 205 * mm, "Component Arrangement", size=10, color=ACCENT_PURPLE, bold=True)
-    c.drawImage(ImageReader(arr_path),
-                M + 4 * mm, PH - 230 * mm,
-                width=PW - 2 * M - 8 * mm, height=20 * mm,
-                preserveAspectRatio=True, anchor='sw', mask='auto')
+    draw_figure(c, arr_path, M + 4 * mm, PH - 230 * mm, PW - 2 * M - 8 * mm, 20 * mm, align=SW)
 
 footer(c, 4, TOTAL_PAGES)
 c.showPage()
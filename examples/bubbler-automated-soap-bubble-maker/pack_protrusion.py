@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Pack the Bubbler's protrusion: battery, PCBA, motor, fan and strain gauge placed by annealing.
+
+component_arrangement.md stacks the parts by hand: battery at the bottom,
+PCBA above it, motor at the shaft end, fan at the top feeding the duct.
+This hands the same inventory to scripts/packing.py with the housing's
+inside as the envelope (render_views.py's geometry from bubbler_dims.py),
+the L-bent duct as a keep-out, and the arrangement's reasons as preferences:
+
+  - fan         against the duct's vertical leg, where it feeds the bend
+  - motor       at the shaft end, where it drives the shaft
+  - gauge       at the shaft bearing, nearest the pivot
+  - battery     low (centre of gravity)
+  - PCBA        next to the battery, motor and fan (short wire runs)
+
+The best arrangements are printed and drawn side by side (isometric, the
+housing as a wireframe) in protrusion_packing.png.
+
+Usage:
+    python3 pack_protrusion.py                          # 2048 chains × 1500 steps, best 4
+    python3 pack_protrusion.py --chains 4096 --steps 3000 --best 6 --json packing.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+import packing  # noqa: E402
+import solids  # noqa: E402
+from packing import item  # noqa: E402
+from render_views import ACCENT, ELEC, MECH, POWER, TEXT, WALL, ducts, housing, layout  # noqa: E402
+
+SENSE = "#7d3c98"; FAN = "#5588cc"
+AZIM, ELEV = -150.0, 22.0
+
+ITEMS = [
+    item("battery", (58, 58, 15), rotate="any", color=POWER),    # 4×AA, 2×2 flat holder
+    item("pcba", (50, 35, 10), rotate="any", color=ELEC),        # board plus tallest part
+    item("motor", (15, 10, 8), rotate="any", color=MECH),        # geared DC motor
+    item("fan", (40, 40, 10), rotate="z", color=FAN),            # centrifugal blower, stays flat
+    item("gauge", (10, 5, 1), rotate="any", color=SENSE),        # foil strain gauge
+]
+
+
+def problem(lay):
+    """Envelope, keep-outs and preferences for the protrusion."""
+    _, inside = housing(lay)
+    wall_x = lay["outline"][0][0] + WALL                 # inside of the housing's vat-side wall
+    shaft_end = (wall_x, lay["yc"] + 90, lay["shaft_y"])
+    duct_top = (lay["cx"], lay["yc"], lay["fan_y"])
+    near = [
+        ("fan", duct_top, 0.0, 3.0),
+        ("motor", shaft_end, 0.0, 3.0),
+        ("gauge", shaft_end, 0.0, 2.0),
+        ("pcba", "battery", 2.0, 0.5),
+        ("pcba", "motor", 5.0, 0.2),
+        ("pcba", "fan", 5.0, 0.2),
+    ]
+    return inside, ducts(lay), near, {"battery": 1.0}
+
+
+def render(placements, lay, path):
+    _, inside = housing(lay)
+    n = len(placements)
+    fig, axes = plt.subplots(1, n, figsize=(4.2 * n, 5.2), squeeze=False)
+    fig.patch.set_facecolor("#FFFFFF")
+    for k, (ax, p) in enumerate(zip(axes.flat, placements)):
+        solids.draw_isometric(ax, packing.to_solids(p, ITEMS) + ducts(lay), AZIM, ELEV)
+        solids.draw_wireframe(ax, [inside], AZIM, ELEV)
+        ax.axis("off")
+        state = "feasible" if p.penalty < 0.5 else f"{p.penalty:.1f} mm infeasible"
+        ax.set_title(f"#{k + 1}   score {p.score:.1f}   {state}", color=ACCENT, fontsize=9, fontweight="bold")
+    handles = [plt.Rectangle((0, 0), 1, 1, color=it.color) for it in ITEMS]
+    fig.legend(handles, [it.name for it in ITEMS], loc="lower center", ncol=len(ITEMS), frameon=False,
+               fontsize=8, labelcolor=TEXT)
+    fig.suptitle("Bubbler — Protrusion Packing (simulated annealing)", color=ACCENT, fontsize=13,
+                 fontweight="bold")
+    fig.tight_layout(rect=[0, 0.05, 1, 0.95])
+    fig.savefig(path, dpi=150, facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--chains", type=int, default=2048)
+    parser.add_argument("--steps", type=int, default=1500)
+    parser.add_argument("--best", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the placements here (part -> lo, hi corners in mm)")
+    parser.add_argument("--out", default=os.path.join(_DIR, "protrusion_packing.png"))
+    args = parser.parse_args()
+
+    lay = layout()
+    envelope, keepouts, near, low = problem(lay)
+    start = time.perf_counter()
+    best = packing.pack(ITEMS, envelope, keepouts, near, low, chains=args.chains, steps=args.steps,
+                        best=args.best, seed=args.seed)
+    seconds = time.perf_counter() - start
+    print(f"{args.chains} chains × {args.steps} steps in {seconds:.1f} s")
+    print("\n".join(packing.report(best)))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([p._asdict() for p in best], f, indent=2)
+        print(f"Saved: {args.json}")
+    render(best, lay, args.out)
+    print(f"Saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
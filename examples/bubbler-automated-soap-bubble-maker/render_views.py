@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Bubbler product views rendered offline: isometric concept and side cross-section.
+
+generate_illustration.py asks DALL-E for these two pictures through a
+logged-in browser. This builds the product as solids from the same
+dimension model as arrangement_viz.py (bubbler_dims.py, in mm) and renders
+both views with scripts/solids.py in well under a second, the same image
+on every run:
+
+  - isometric   exterior only, seen from the vat side, wand in blow position
+  - section     cut along the long axis through the loop centre, looking
+                the same way as arrangement_viz.py's side view, with the
+                parts inside the protrusion and leader-line labels
+
+Coordinates: x across the short axis (vat on the left, protrusion on the
+right), y along the long axis, z up from the ground under the feet.
+
+Usage:
+    python3 render_views.py                        # render_views.png next to this script
+    python3 render_views.py --azim -110 --elev 35 --out /tmp/bubbler.png
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+import solids  # noqa: E402
+from solids import box, cylinder, ellipse, inset, prism  # noqa: E402
+from bubbler_dims import DIMS  # noqa: E402
+
+MECH = "#1a5276"; ELEC = "#c0392b"; POWER = "#27ae60"; FLOW = "#2e86c1"
+STRUCT = "#5d6d7e"; TEXT = "#1a1a1a"; ACCENT = "#d35400"; WAND_C = "#2471a3"
+LOOP_C = "#1a5276"; SOLUTION = "#85c1e9"; HOUSING = "#c9cdd2"; DUCT = "#d5e8f0"
+FOOT = "#555555"; WALL = 3  # housing wall, mm
+
+LABELS = {
+    "housing": "Tapered protrusion", "base": "Base plate", "vat": "Vat", "solution": "Soap solution",
+    "battery": "Battery (4×AA)", "pcba": "PCBA (MCU, HX711)", "motor": "Geared motor",
+    "fan": "Centrifugal fan", "duct": "L-bent air duct Ø40", "shaft": "Shaft",
+    "arm": "Wand arm", "loop": "Wire loop Ø160",
+}
+
+
+def layout():
+    """Positions shared by the views and pack_protrusion.py (mm, the coordinates above)."""
+    d = DIMS.evaluate()
+    vat_x = 3
+    vat_right = vat_x + d["vat_ext"]
+    left, right = vat_right + 2, d["base_short"] - 2
+    cx, half, top = (left + right) / 2, d["prot_top_w"] / 2, d["prot_top_y"]
+    # Housing: trapezoid wide at the base, narrowing to the duct exit, along the whole long side.
+    outline = [(left, d["vat_y"]), (right, d["vat_y"]), (cx + half, top), (cx - half, top)]
+    return dict(d, vat_x=vat_x, vat_right=vat_right, yc=d["base_long"] / 2, shaft_x=vat_right - 5,
+                outline=outline, cx=cx,
+                elbow_x=cx - d["duct_r"])      # duct turns up into the fan under the housing top
+
+
+def housing(lay):
+    """Housing shell and end walls, and the convex space inside it."""
+    outline, base_long = lay["outline"], lay["base_long"]
+    shell = [prism("housing", outline, "y", WALL, base_long - WALL, HOUSING, holes=[inset(outline, WALL)]),
+             prism("housing end", outline, "y", 0, WALL, HOUSING),
+             prism("housing end", outline, "y", base_long - WALL, base_long, HOUSING)]
+    return shell, prism("inside", inset(outline, WALL), "y", WALL, base_long - WALL, HOUSING)
+
+
+def ducts(lay):
+    """Horizontal duct from the elbow to the loop, and the vertical leg up to the fan."""
+    yc, loop_cy, duct_r = lay["yc"], lay["loop_center_y"], lay["duct_r"]
+    return [cylinder("duct", (yc, loop_cy), duct_r, "x", lay["shaft_x"] + 3, lay["elbow_x"], DUCT,
+                     inner=duct_r - 2),
+            cylinder("duct", (lay["cx"], yc), duct_r, "z", loop_cy - duct_r, lay["fan_y"], DUCT,
+                     inner=duct_r - 2)]
+
+
+def scene(internal=True):
+    """Bubbler as a list of solids; internal=False leaves out what the housing hides."""
+    d = lay = layout()
+    base_short, base_long, yc = d["base_short"], d["base_long"], d["yc"]
+    vat_y, vat_ext = d["vat_y"], d["vat_ext"]
+    vat_cx, wall = d["vat_x"] + vat_ext / 2, d["vat_wall"]
+    shaft_x, shaft_y = d["shaft_x"], d["shaft_y"]
+    loop_cy, outline = d["loop_center_y"], d["outline"]
+
+    def side_at(z, edge):
+        """x of the housing's left (edge=0) or right (edge=1) face at height z."""
+        (x0, z0), (x1, z1) = (outline[0], outline[3]) if edge == 0 else (outline[1], outline[2])
+        return x0 + (z - z0) / (z1 - z0) * (x1 - x0)
+
+    parts = [
+        box("base", (0, 0, d["foot_h"]), (base_short, base_long, vat_y), STRUCT),
+        prism("vat", ellipse(vat_cx, yc, vat_ext / 2, d["vat_long"] / 2 + wall), "z", vat_y, vat_y + d["vat_depth"],
+              FLOW, holes=[ellipse(vat_cx, yc, d["vat_short"] / 2, d["vat_long"] / 2)], smooth=True),
+        prism("vat floor", ellipse(vat_cx, yc, d["vat_short"] / 2, d["vat_long"] / 2), "z", vat_y, vat_y + wall,
+              FLOW, smooth=True),
+        prism("solution", ellipse(vat_cx, yc, d["vat_short"] / 2, d["vat_long"] / 2), "z", vat_y + wall,
+              d["sol_surface"], SOLUTION, alpha=0.9, smooth=True),
+        *housing(lay)[0],
+        cylinder("shaft", (shaft_x, shaft_y), 3, "y", yc - 90, yc + 90, ACCENT),
+        box("arm", (shaft_x - 2, yc - 2, shaft_y), (shaft_x + 2, yc + 2, d["arm_tip_y"]), WAND_C),
+        cylinder("loop", (yc, loop_cy), d["loop_r"], "x", shaft_x - 1.5, shaft_x + 1.5, LOOP_C,
+                 inner=d["loop_r"] - 2.5, segments=96),
+        ducts(lay)[0],
+    ]
+    for fx in (12, base_short - 12):
+        for fy in (12, base_long - 12):
+            parts.insert(0, cylinder("foot", (fx, fy), 7, "z", 0, d["foot_h"], FOOT, segments=24))
+    if not internal:
+        return parts
+
+    # Inside the housing, stacked as in component_arrangement.md: battery, PCBA, motor, fan.
+    inner_left = side_at(vat_y + WALL, 0) + WALL
+    batt_w = side_at(vat_y + WALL, 1) - inner_left - WALL
+    batt_z = vat_y + WALL + 2
+    fan_z = d["fan_y"]
+    fan_l, fan_r = side_at(fan_z, 0) + WALL + 1, side_at(fan_z, 1) - WALL - 1
+    parts += [
+        box("battery", (inner_left + 1, yc - 29, batt_z), (inner_left + 1 + batt_w - 2, yc + 29, batt_z + 15), POWER),
+        box("pcba", (inner_left + 2, yc - 25, batt_z + 17), (inner_left + batt_w - 3, yc + 25, batt_z + 27), ELEC),
+        box("motor", (inner_left + 1, yc + 80, shaft_y - 6), (inner_left + 1 + d["motor_depth"], yc + 90, shaft_y + 6),
+            MECH),
+        box("fan", (fan_l, yc - 20, fan_z), (fan_r, yc + 20, fan_z + d["fan_h"]), MECH),
+        ducts(lay)[1],
+    ]
+    return parts
+
+
+def render(path, azim=-130.0, elev=28.0):
+    d = DIMS.evaluate()
+    fig, (ax_iso, ax_cut) = plt.subplots(1, 2, figsize=(15, 7.5))
+    fig.patch.set_facecolor("#FFFFFF")
+    solids.draw_isometric(ax_iso, scene(internal=False), azim, elev)
+    regions = solids.draw_section(ax_cut, scene(), "y", d["base_long"] / 2)
+    solids.label_regions(ax_cut, regions, LABELS)
+    for ax, title, sub in (
+            (ax_iso, "Bubbler — Concept", "Exterior, wand upright in blow position"),
+            (ax_cut, "Side Cross-Section", "Cut along the long axis through the loop centre")):
+        ax.axis("off")
+        ax.set_title(f"{title}\n", color=ACCENT, fontsize=13, fontweight="bold")
+        ax.text(0.5, 1.0, sub, transform=ax.transAxes, color="#555555", fontsize=8, ha="center",
+                va="bottom", style="italic")
+    fig.tight_layout()
+    fig.savefig(path, dpi=150, facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--azim", type=float, default=-130.0, help="isometric view azimuth, degrees")
+    parser.add_argument("--elev", type=float, default=28.0, help="isometric view elevation, degrees")
+    parser.add_argument("--out", default=os.path.join(_DIR, "render_views.png"))
+    args = parser.parse_args()
+    start = time.perf_counter()
+    render(args.out, args.azim, args.elev)
+    print(f"Saved: {args.out} ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
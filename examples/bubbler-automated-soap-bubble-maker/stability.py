@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Bubbler mass properties and tip-over stability, wand up to wand down, vat full and empty.
+
+The Bubbler stands a 160 mm loop upright, 245 mm tall, on a 246 × 215 mm
+base, with the soap vat on one side and the battery and fan in the
+protrusion on the other. This weighs render_views.py's solids (bubbler_dims.py geometry,
+masses below), swings the wand from the blow to the dip angle with the
+vat full and empty, and reports with scripts/massprops.py:
+
+  - mass, centre of gravity and principal inertia in every state
+  - tip angle: how far the Bubbler leans before its centre of gravity
+    passes over the edge of the support polygon (the four rubber feet),
+    and which way it falls
+
+lumped() is the same product as a dozen boxes built straight from
+bubbler_dims.py arrays, so arrangement_sweep.py can score the tip angle of
+thousands of variants in one call; the nominal design is printed both ways
+as a check on the approximation. The figure (stability.png) marks the
+centre of gravity over the swing on the side cross-section and plots the
+tip angle against the wand angle.
+
+Usage:
+    python3 stability.py                      # 36 wand angles, stability.png next to this script
+    python3 stability.py --steps 176 --out /tmp/stability.png
+"""
+
+import argparse
+import os
+import sys
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+import massprops  # noqa: E402
+import solids  # noqa: E402
+from massprops import box_moments, combine, rotation, transform  # noqa: E402
+from render_views import ACCENT, FLOW, MECH, TEXT, WALL, layout, scene  # noqa: E402
+
+# ── Part masses (g) where the solid is not the part, densities (g/cm³) where it is ──
+MASS = {"foot": 2, "loop": 15, "battery": 110, "pcba": 20, "motor": 30, "fan": 25}
+DENSITY = {
+    "base": 0.55,          # ribbed ABS moulding, about half solid
+    "vat": 0.9, "vat floor": 0.9, "solution": 1.0,
+    "housing": 1.05, "housing end": 1.05, "duct": 1.05, "arm": 1.05,
+    "shaft": 7.85,
+}
+WAND = ("shaft", "arm", "loop")
+FILLS = {"full": 1.0, "empty": 0.0}
+
+
+def weigh(parts):
+    """massprops.Parts of a scene, one row per solid."""
+    for s in parts:
+        if s.name not in MASS and s.name not in DENSITY:
+            raise SystemExit(f"No mass or density for {s.name!r}")
+    return massprops.stack([massprops.part(s, mass=MASS.get(s.name), density=DENSITY.get(s.name))
+                            for s in parts], [s.name for s in parts])
+
+
+def wand_rotation(lay, angles):
+    """Rotations (..., 3, 3) taking the wand from the blow angle to `angles`, and the pivot."""
+    # Wand angles run from +x towards +z (bubbler_dims.py); that is a negative turn about +y.
+    return rotation("y", -(np.asarray(angles, dtype=float) - lay["blow_angle"])), \
+        (lay["shaft_x"], lay["yc"], lay["shaft_y"])
+
+
+def states(lay, angles):
+    """Props over (fill, wand angle) and the support polygon."""
+    parts = scene()
+    polygon = massprops.support(parts)
+    where = np.isin(np.array([s.name for s in parts]), WAND)
+    R, pivot = wand_rotation(lay, angles)
+    mass = np.empty((len(FILLS), len(parts)))
+    centroid = np.empty((len(FILLS), len(angles), len(parts), 3))
+    spread = np.empty(centroid.shape + (3,))
+    for f, fill in enumerate(FILLS.values()):
+        # The solution's top drops with the fill; everything else is the same solid.
+        top = lay["vat_y"] + lay["vat_wall"] + fill * lay["sol_depth"]
+        # An empty vat keeps its solution solid, weightless, so every fill has the same parts.
+        p = weigh([s._replace(hi=top) if s.name == "solution" and fill else s for s in parts])
+        mass[f] = np.where(np.array(p.name) == "solution", p.mass * (fill > 0), p.mass)
+        centroid[f], spread[f] = transform(p.centroid, p.spread, R[:, None], pivot, where=where)
+    return combine(mass[:, None, :], centroid, spread), polygon
+
+
+# ================================================================
+# Lumped model for sweeps
+# ================================================================
+
+def lumped(d, fill, angle):
+    """The Bubbler as boxes from bubbler_dims.py arrays: mass (..., P), centroid (..., P, 3), spread.
+
+    d is DIMS.evaluate() over any array shape; fill (0..1) and angle
+    (degrees) broadcast against it. Walls are thin shells weighed by area,
+    each part is its bounding box, the electronics sit where render_views.py
+    puts them. The feet (8 g) are left out.
+    """
+    vat_x, wall, yc = 3.0, d["vat_wall"], d["base_long"] / 2
+    vat_right = vat_x + d["vat_ext"]
+    left, right = vat_right + 2, d["base_short"] - 2
+    cx, top, vat_y = (left + right) / 2, d["prot_top_y"], d["vat_y"]
+    shaft_x, shaft_y = vat_right - 5, d["shaft_y"]
+    s, l = d["vat_short"], d["vat_long"]
+    zero = np.zeros_like(s)
+
+    def corners(x0, y0, z0, x1, y1, z1):
+        return np.stack(np.broadcast_arrays(x0, y0, z0), -1), np.stack(np.broadcast_arrays(x1, y1, z1), -1)
+
+    ellipse = np.pi / 4
+    sol_top = vat_y + wall + fill * d["sol_depth"]
+    bottom, top_w = right - left, d["prot_top_w"]
+    slant = np.hypot((bottom - top_w) / 2, top - vat_y)
+    # (mass g, box corners); densities are g/cm³ and volumes mm³.
+    boxes = [
+        (DENSITY["base"] * d["base_short"] * d["base_long"] * d["base_thick"] / 1000,
+         corners(0, 0, d["foot_h"], d["base_short"], d["base_long"], vat_y)),
+        (DENSITY["vat"] * ellipse * (d["vat_ext"] * (l + 2 * wall) * d["vat_depth"] - s * l * (d["vat_depth"] - wall))
+         / 1000, corners(vat_x, yc - l / 2 - wall, vat_y, vat_right, yc + l / 2 + wall, vat_y + d["vat_depth"])),
+        (DENSITY["solution"] * ellipse * s * l * (sol_top - vat_y - wall) / 1000,
+         corners(vat_x + wall, yc - l / 2, vat_y + wall, vat_right - wall, yc + l / 2, sol_top)),
+        (DENSITY["housing"] * WALL * ((bottom + top_w + 2 * slant) * d["base_long"]
+                                      + (bottom + top_w) * (top - vat_y)) / 1000,
+         corners(left, zero, vat_y, right, d["base_long"], top)),
+        (DENSITY["duct"] * np.pi * (2 * d["duct_r"] - 2) * 2
+         * (cx - shaft_x + d["fan_y"] - d["loop_center_y"] + d["duct_r"]) / 1000,
+         corners(shaft_x, yc - d["duct_r"], d["loop_center_y"] - d["duct_r"], cx + d["duct_r"],
+                 yc + d["duct_r"], d["fan_y"])),
+        (DENSITY["shaft"] * np.pi * 9 * 180 / 1000,
+         corners(shaft_x - 3, yc - 90, shaft_y - 3, shaft_x + 3, yc + 90, shaft_y + 3)),
+        (MASS["battery"], corners(left + 4, yc - 29, vat_y + WALL + 2, right - 4, yc + 29, vat_y + WALL + 17)),
+        (MASS["pcba"], corners(left + 5, yc - 25, vat_y + WALL + 19, right - 6, yc + 25, vat_y + WALL + 29)),
+        (MASS["motor"], corners(left + 4, yc + 80, shaft_y - 6, left + 4 + d["motor_depth"], yc + 90, shaft_y + 6)),
+        (MASS["fan"], corners(cx - 20, yc - 20, d["fan_y"], cx + 20, yc + 20, d["fan_y"] + d["fan_h"])),
+        (DENSITY["arm"] * 16 * d["arm_len"] / 1000,
+         corners(shaft_x - 2, yc - 2, shaft_y, shaft_x + 2, yc + 2, d["arm_tip_y"])),
+        (MASS["loop"] + zero, corners(shaft_x - 1.5, yc - d["loop_r"], d["arm_tip_y"], shaft_x + 1.5,
+                                      yc + d["loop_r"], d["loop_top"])),
+    ]
+    shape = np.broadcast_shapes(*[np.shape(m) for m, _ in boxes], *[c.shape[:-1] for _, b in boxes for c in b])
+    mass = np.stack([np.broadcast_to(m, shape) for m, _ in boxes], -1)
+    lo = np.stack([np.broadcast_to(b[0], shape + (3,)) for _, b in boxes], -2)
+    hi = np.stack([np.broadcast_to(b[1], shape + (3,)) for _, b in boxes], -2)
+    centroid, spread = box_moments(lo, hi)
+    # The wand swings to `angle` about the shaft: the last two boxes.
+    R = rotation("y", -(np.asarray(angle, dtype=float) - d["blow_angle"]))[..., None, :, :]
+    pivot = np.stack(np.broadcast_arrays(shaft_x, yc, shaft_y), -1)[..., None, :]
+    centroid, spread = transform(centroid, spread, R, pivot, where=np.arange(len(boxes)) >= len(boxes) - 2)
+    return np.broadcast_to(mass, centroid.shape[:-1]), centroid, spread
+
+
+def feet(d):
+    """Support polygon (..., 4, 2): the outer corners of the four Ø14 feet 12 mm in from the edges."""
+    x0, x1 = np.full_like(d["base_short"], 5.0), d["base_short"] - 5
+    y0, y1 = np.full_like(d["base_long"], 5.0), d["base_long"] - 5
+    return np.stack([np.stack(np.broadcast_arrays(x, y), -1) for x, y in
+                     ((x0, y0), (x1, y0), (x1, y1), (x0, y1))], -2)
+
+
+def worst_tip(d):
+    """Smallest tip angle (degrees) over wand up / down and vat full / empty, for every variant in d."""
+    fills = np.array([1.0, 0.0]).reshape((2, 1) + (1,) * np.ndim(d["base_short"]))
+    blow, dip, _ = np.broadcast_arrays(d["blow_angle"], d["dip_angle"], d["base_short"])
+    angles = np.stack([blow, dip])[None]
+    props = combine(*lumped(d, fills, angles))
+    return massprops.tip(props.cg, feet(d)[None, None]).angle.min(axis=(0, 1))
+
+
+# ================================================================
+# Figure
+# ================================================================
+
+def render(lay, angles, props, polygon, path):
+    fig, (ax_cut, ax_tip) = plt.subplots(1, 2, figsize=(15, 6.5), gridspec_kw={"width_ratios": [1.25, 1]})
+    fig.patch.set_facecolor("#FFFFFF")
+    solids.draw_section(ax_cut, scene(), "y", lay["yc"], beyond=0.75)
+    tips = massprops.tip_angles(props.cg, polygon)
+    x_lo, x_hi = polygon[:, 0].min(), polygon[:, 0].max()
+    for (name, _), cg, style in zip(FILLS.items(), props.cg, ("-", "--")):
+        ax_cut.plot(cg[:, 0], cg[:, 2], style, color=ACCENT, lw=1.2, zorder=5)
+        ax_cut.plot(cg[0, 0], cg[0, 2], "o", color=ACCENT, ms=5, zorder=6)
+        ax_cut.plot(cg[-1, 0], cg[-1, 2], "s", color=ACCENT, ms=5, zorder=6)
+        ax_cut.annotate(f"CG, vat {name}", (cg[-1, 0], cg[-1, 2]), xytext=(-8, 0), textcoords="offset points",
+                        fontsize=7, color=ACCENT, ha="right", va="center")
+    # Tipping lines from the worst state's centre of gravity to the two long edges.
+    f, a = np.unravel_index(tips.min(axis=-1).argmin(), tips.shape[:2])
+    cg = props.cg[f, a]
+    for x in (x_lo, x_hi):
+        ax_cut.plot([cg[0], x], [cg[2], 0], ":", color=TEXT, lw=0.8, zorder=5)
+    ax_cut.axhline(0, color="#888888", lw=0.6)
+    ax_cut.axis("off")
+    ax_cut.set_title("Centre of gravity over the wand swing\n", color=ACCENT, fontsize=12, fontweight="bold")
+    ax_cut.text(0.5, 1.0, "● blow position   ■ dip position   dotted: tipping lines of the worst state",
+                transform=ax_cut.transAxes, color="#555555", fontsize=8, ha="center", va="bottom", style="italic")
+
+    for (name, _), t, color in zip(FILLS.items(), tips, (FLOW, MECH)):
+        ax_tip.plot(angles, t.min(axis=-1), color=color, lw=1.8, label=f"vat {name}")
+    ax_tip.axvline(lay["blow_angle"], color="#aaaaaa", lw=0.6)
+    ax_tip.axvline(lay["dip_angle"], color="#aaaaaa", lw=0.6)
+    ax_tip.set_xlabel("wand angle (degrees; 90 blow, 265 dip)", fontsize=9, color=TEXT)
+    ax_tip.set_ylabel("smallest tip angle (degrees)", fontsize=9, color=TEXT)
+    ax_tip.set_ylim(0, None)
+    ax_tip.grid(alpha=0.3)
+    ax_tip.legend(frameon=False, fontsize=8)
+    ax_tip.set_title("Tip-over margin\n", color=ACCENT, fontsize=12, fontweight="bold")
+    fig.suptitle("Bubbler — Mass Properties and Tip-Over Stability", color=ACCENT, fontsize=14,
+                 fontweight="bold")
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    fig.savefig(path, dpi=150, facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--steps", type=int, default=36, help="wand angles from blow to dip")
+    parser.add_argument("--out", default=os.path.join(_DIR, "stability.png"))
+    args = parser.parse_args()
+
+    lay = layout()
+    angles = np.linspace(lay["blow_angle"], lay["dip_angle"], args.steps)
+    props, polygon = states(lay, angles)
+    ends = [0, -1]
+    names = [f"vat {f}, wand {angles[a]:.0f}°" for f in FILLS for a in ends]
+    flat = massprops.Props(*(v[:, ends].reshape((-1,) + v.shape[2:]) for v in props))
+    print("\n".join(massprops.report(names, flat, massprops.tip(flat.cg, polygon))))
+
+    d = {k: np.asarray(v) for k, v in lay.items() if np.isscalar(v)}
+    fills = np.array(list(FILLS.values()))[:, None]
+    approx = combine(*lumped(d, fills, np.array([lay["blow_angle"], lay["dip_angle"]])[None]))
+    approx = massprops.Props(*(v.reshape((-1,) + v.shape[2:]) for v in approx))
+    print("\nLumped boxes (arrangement_sweep.py):")
+    print("\n".join(massprops.report(names, approx, massprops.tip(approx.cg, feet(d)))[1:]))
+
+    render(lay, angles, props, polygon, args.out)
+    print(f"Saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Bubbler tolerance stack-up: how often each clearance in component_arrangement.md fails in production.
+
+component_arrangement.md states its clearances at nominal (bubbler_dims.py
+checks them the same way). This gives every dimension in those stacks a
+production tolerance, adds the assembly errors the dimension model does
+not carry, and runs scripts/tolerance.py over a million builds:
+
+  - duct concentric   duct exit centred on the loop within ±5 mm (radial
+                      offset in the loop plane, blow position)
+  - loop swing        loop clears the far vat wall: vat_long less the shaft
+                      inset (5), arm and loop (the "200 mm exactly" stack)
+  - shaft over rim    shaft (Ø6) in the housing's bearing clears the vat rim
+  - vat fit           loop lies flat in the vat (arrangement_sweep.py)
+  - dip               loop tip below the solution surface at the dip angle,
+                      with the vat topped up anywhere from 6 to 12 mm
+  - fan fit           the 40 mm blower and 2 mm rim fit the tapered protrusion
+
+The housing is one moulding on the base: its bearing bore, duct exit and
+fan bay are cut to the nominal design and vary by their own tolerances, not
+with the vat, duct or fan that go into them. Normal tolerances are ±3 sigma;
+uniform ones are anything in the band.
+
+Usage:
+    python3 tolerance_stack.py                        # 1,000,000 samples
+    python3 tolerance_stack.py -n 5000000 --seed 3 --top 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(_DIR, "..", "..", "scripts"))
+
+import tolerance  # noqa: E402
+from tolerance import normal, triangular, uniform  # noqa: E402
+from bubbler_dims import DIMS  # noqa: E402
+
+SHAFT_R = 3             # Ø6 shaft
+SHAFT_INSET = 5         # shaft axis in from the vat wall (render_views.py: vat_right - 5)
+CONCENTRIC = 5          # duct exit to loop centre, component_arrangement.md
+FAN_W = 40              # centrifugal blower, pack_protrusion.py
+
+TOLERANCES = {
+    # Vat
+    "vat_long":    normal(0.8),            # PP tray, shrinkage varies with the lot
+    "vat_short":   normal(0.8),
+    "vat_depth":   normal(0.3),
+    "vat_wall":    normal(0.15),
+    # Wand
+    "arm_len":     normal(0.3),
+    "loop_diam":   normal(3.0),            # hand-formed wire loop
+    "blow_angle":  uniform(2.0),           # motor homing at the blow stop, degrees
+    "dip_angle":   uniform(2.0),
+    # Use
+    "sol_depth":   uniform(3.0, shift=-3.0),   # topped up anywhere from 6 to 12 mm
+    # Housing and bought parts, deviations from their nominal size (not model inputs)
+    "bearing_z":   normal(0.4),                # bearing bore height above the vat seat
+    "housing_w":   normal(0.3),                # protrusion width at the fan
+    "fan_w":       normal(0.2),                # blower body, supplier drawing
+    # Assembly errors outside the dimension model (nominal 0)
+    "loop_sag":    uniform(1.5, shift=-1.5),   # flexible loop droops up to 3 mm when upright
+    "loop_y":      triangular(2.0),            # loop centre along the shaft (arm bend, crimp)
+    "duct_z":      normal(1.0),                # duct exit height: housing + fan/duct stack
+    "duct_y":      normal(1.0),
+    "shaft_x":     normal(0.5),                # shaft inset from the vat wall
+}
+
+_NOM = DIMS.evaluate()
+
+
+def shaft_height(d):
+    """Shaft axis above the vat seat, set by the housing's bearing bore rather than the vat."""
+    return _NOM["shaft_y"] - _NOM["vat_y"] + d["bearing_z"]
+
+
+def duct_offset(d):
+    """Radial offset (mm) of the duct exit from the loop centre in the loop plane, blow position."""
+    # Heights are taken from the vat seat: base and feet move the housing and the loop alike.
+    loop = shaft_height(d) + d["loop_center_y"] - d["shaft_y"]
+    dz = loop - (_NOM["loop_center_y"] - _NOM["vat_y"]) + d["loop_sag"] - d["duct_z"]
+    return np.hypot(dz, d["loop_y"] - d["duct_y"])
+
+
+CHECKS = {
+    "duct concentric": lambda d: CONCENTRIC - duct_offset(d),
+    "loop swing":      lambda d: d["vat_long"] - (SHAFT_INSET + d["shaft_x"]) - d["arm_len"] - d["loop_diam"],
+    "shaft over rim":  lambda d: shaft_height(d) - d["vat_depth"] - SHAFT_R,
+    "vat fit":         lambda d: np.minimum(d["vat_long"], d["vat_short"]) - d["loop_diam"],
+    "dip":             lambda d: d["vat_wall"] + d["sol_depth"] - shaft_height(d) - (d["dip_tip_y"] - d["shaft_y"]),
+    "fan fit":         lambda d: _NOM["fan_bay_w"] + d["housing_w"] - 2 - (FAN_W + d["fan_w"]),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-n", "--samples", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=3, help="contributors listed per check")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stacks = tolerance.run(DIMS, TOLERANCES, CHECKS, samples=args.samples, seed=args.seed)
+    print(f"{args.samples:,} samples × {len(TOLERANCES)} tolerances in {time.perf_counter() - start:.1f} s\n")
+    print("\n".join(tolerance.report(stacks, top=args.top)))
+
+
+if __name__ == "__main__":
+    main()
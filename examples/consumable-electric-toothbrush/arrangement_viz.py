@@ -1,9 +1,15 @@
 """Side-by-side cross-section visualization of two motor arrangement options."""
+import os
+import sys
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Arc
+from matplotlib.patches import Arc
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+from primitives import box  # noqa: E402
+
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 20))
 fig.patch.set_facecolor('#1a1a2e')
 
@@ -27,7 +33,7 @@ def draw_option_a(ax):
     ax.axis('off')
 
     # --- Battery cap + O-ring (bottom) ---
-    cap = FancyBboxPatch((-6, 0), 12, 3, boxstyle="round,pad=0.3", fc='#888888', ec='#555555', lw=1.5)
+    cap = box(-6, 0, 12, 3, boxstyle="round,pad=0.3", fc='#888888', ec='#555555', lw=1.5)
     ax.add_patch(cap)
     ax.text(0, 1.5, 'Battery Cap\n(threaded PP)', ha='center', va='center', fontsize=6, color='white', fontweight='bold')
     # O-ring
@@ -36,23 +42,23 @@ def draw_option_a(ax):
 
     # --- Shell outline (main body) ---
     # Outer shell - TPE overmold
-    shell = FancyBboxPatch((-7.5, 3.5), 15, 82, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
+    shell = box(-7.5, 3.5, 15, 82, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
     ax.add_patch(shell)
     # Inner rigid PP body
-    body = FancyBboxPatch((-6.5, 4), 13, 81, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
+    body = box(-6.5, 4, 13, 81, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
     ax.add_patch(body)
 
     # --- Spring contact (negative) ---
-    ax.add_patch(patches.FancyBboxPatch((-3, 4.5), 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
+    ax.add_patch(box(-3, 4.5, 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
     ax.text(0, 5.2, '− spring', ha='center', va='center', fontsize=5.5, color='#333')
 
     # --- AAA Battery ---
-    batt = FancyBboxPatch((-5, 6.5), 10, 36, boxstyle="round,pad=0.5", fc=BATTERY_COLOR, ec='#1a5276', lw=2)
+    batt = box(-5, 6.5, 10, 36, boxstyle="round,pad=0.5", fc=BATTERY_COLOR, ec='#1a5276', lw=2)
     ax.add_patch(batt)
     ax.text(0, 24.5, 'AAA\nBattery\n⌀10.5×44.5\n1.5V', ha='center', va='center', fontsize=8, color='white', fontweight='bold')
 
     # --- + contact plate ---
-    ax.add_patch(patches.FancyBboxPatch((-3, 43), 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
+    ax.add_patch(box(-3, 43, 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
     ax.text(0, 43.7, '+ plate', ha='center', va='center', fontsize=5.5, color='#333')
 
     # --- Wire ---
@@ -60,7 +66,7 @@ def draw_option_a(ax):
     ax.text(2, 46, 'wire', ha='left', va='center', fontsize=5.5, color='#e74c3c', fontstyle='italic')
 
     # --- Switch ---
-    sw = FancyBboxPatch((-4, 48), 8, 5, boxstyle="round,pad=0.3", fc=SWITCH_COLOR, ec='#c0571e', lw=1.5)
+    sw = box(-4, 48, 8, 5, boxstyle="round,pad=0.3", fc=SWITCH_COLOR, ec='#c0571e', lw=1.5)
     ax.add_patch(sw)
     ax.text(0, 50.5, 'Latching\nSwitch', ha='center', va='center', fontsize=7, color='white', fontweight='bold')
     # Button indicator on shell
@@ -74,7 +80,7 @@ def draw_option_a(ax):
     ax.plot([0, 0], [53, 58], color='#e74c3c', lw=1.5, ls='--')
 
     # --- ERM Motor (axial) ---
-    motor = FancyBboxPatch((-3.5, 58), 7, 14, boxstyle="round,pad=0.4", fc=MOTOR_COLOR, ec='#922b21', lw=2)
+    motor = box(-3.5, 58, 7, 14, boxstyle="round,pad=0.4", fc=MOTOR_COLOR, ec='#922b21', lw=2)
     ax.add_patch(motor)
     ax.text(0, 65, 'ERM\nMotor\n⌀6×12', ha='center', va='center', fontsize=7.5, color='white', fontweight='bold')
     # shaft arrow
@@ -87,11 +93,11 @@ def draw_option_a(ax):
     ax.text(8, 73.5, '← eccentric\n   mass', ha='left', va='center', fontsize=6.5, color='#ff6b6b', fontstyle='italic')
 
     # --- Linkage arm ---
-    ax.add_patch(patches.FancyBboxPatch((-1, 75), 3, 8, boxstyle="round,pad=0.2", fc=LINKAGE_COLOR, ec='#c0392b', lw=1, alpha=0.7))
+    ax.add_patch(box(-1, 75, 3, 8, boxstyle="round,pad=0.2", fc=LINKAGE_COLOR, ec='#c0392b', lw=1, alpha=0.7))
     ax.text(1, 79, 'linkage\n~15mm', ha='center', va='center', fontsize=6, color='white', rotation=90)
 
     # --- TPE boot ---
-    boot = FancyBboxPatch((-7, 82.5), 14, 3, boxstyle="round,pad=0.5", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.6)
+    boot = box(-7, 82.5, 14, 3, boxstyle="round,pad=0.5", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.6)
     ax.add_patch(boot)
     ax.text(0, 84, 'TPE boot (seal)', ha='center', va='center', fontsize=6.5, color='white', fontweight='bold')
     ax.text(10, 84, '← dynamic\n   seal', ha='left', va='center', fontsize=6.5, color=TPE_COLOR, fontstyle='italic')
@@ -102,12 +108,12 @@ def draw_option_a(ax):
     ax.text(8, 86, '← pivot', ha='left', va='center', fontsize=6, color='white', fontstyle='italic')
 
     # Fixed half
-    fixed = FancyBboxPatch((-5.5, 86.5), 5, 8, boxstyle="round,pad=0.3", fc=PP_COLOR, ec='#a8a060', lw=1.5)
+    fixed = box(-5.5, 86.5, 5, 8, boxstyle="round,pad=0.3", fc=PP_COLOR, ec='#a8a060', lw=1.5)
     ax.add_patch(fixed)
     ax.text(-3, 90.5, 'Fixed\nHalf', ha='center', va='center', fontsize=7, color='#333', fontweight='bold')
 
     # Moving half
-    moving = FancyBboxPatch((0.5, 86.5), 5, 8, boxstyle="round,pad=0.3", fc='#f0e68c', ec='#b8a030', lw=1.5)
+    moving = box(0.5, 86.5, 5, 8, boxstyle="round,pad=0.3", fc='#f0e68c', ec='#b8a030', lw=1.5)
     ax.add_patch(moving)
     ax.text(3, 90.5, 'Moving\nHalf', ha='center', va='center', fontsize=7, color='#333', fontweight='bold')
     # oscillation arrow
@@ -137,41 +143,41 @@ def draw_option_b(ax):
     ax.axis('off')
 
     # --- Battery cap + O-ring (bottom) ---
-    cap = FancyBboxPatch((-6, 0), 12, 3, boxstyle="round,pad=0.3", fc='#888888', ec='#555555', lw=1.5)
+    cap = box(-6, 0, 12, 3, boxstyle="round,pad=0.3", fc='#888888', ec='#555555', lw=1.5)
     ax.add_patch(cap)
     ax.text(0, 1.5, 'Battery Cap\n(threaded PP)', ha='center', va='center', fontsize=6, color='white', fontweight='bold')
     ax.add_patch(patches.Ellipse((0, 3.2), 10, 1.2, fc=ORING_COLOR, ec='#444', lw=1))
 
     # --- Shell outline (main body) ---
-    shell = FancyBboxPatch((-7.5, 3.5), 15, 73, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
+    shell = box(-7.5, 3.5, 15, 73, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
     ax.add_patch(shell)
-    body = FancyBboxPatch((-6.5, 4), 13, 72, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
+    body = box(-6.5, 4, 13, 72, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
     ax.add_patch(body)
 
     # Wider neck section
-    neck = FancyBboxPatch((-9, 72), 18, 14, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
+    neck = box(-9, 72, 18, 14, boxstyle="round,pad=0.8", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.35)
     ax.add_patch(neck)
-    neck_inner = FancyBboxPatch((-8, 72.5), 16, 13, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
+    neck_inner = box(-8, 72.5, 16, 13, boxstyle="round,pad=0.5", fc=PP_COLOR, ec='#a8a060', lw=1.5, alpha=0.3)
     ax.add_patch(neck_inner)
 
     # --- Spring contact ---
-    ax.add_patch(patches.FancyBboxPatch((-3, 4.5), 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
+    ax.add_patch(box(-3, 4.5, 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
     ax.text(0, 5.2, '− spring', ha='center', va='center', fontsize=5.5, color='#333')
 
     # --- AAA Battery ---
-    batt = FancyBboxPatch((-5, 6.5), 10, 36, boxstyle="round,pad=0.5", fc=BATTERY_COLOR, ec='#1a5276', lw=2)
+    batt = box(-5, 6.5, 10, 36, boxstyle="round,pad=0.5", fc=BATTERY_COLOR, ec='#1a5276', lw=2)
     ax.add_patch(batt)
     ax.text(0, 24.5, 'AAA\nBattery\n⌀10.5×44.5\n1.5V', ha='center', va='center', fontsize=8, color='white', fontweight='bold')
 
     # --- + contact plate ---
-    ax.add_patch(patches.FancyBboxPatch((-3, 43), 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
+    ax.add_patch(box(-3, 43, 6, 1.5, boxstyle="round,pad=0.2", fc='#aaa', ec='#666', lw=1))
     ax.text(0, 43.7, '+ plate', ha='center', va='center', fontsize=5.5, color='#333')
 
     # --- Wire ---
     ax.plot([0, 0], [44.5, 48], color='#e74c3c', lw=1.5, ls='--')
 
     # --- Switch ---
-    sw = FancyBboxPatch((-4, 48), 8, 5, boxstyle="round,pad=0.3", fc=SWITCH_COLOR, ec='#c0571e', lw=1.5)
+    sw = box(-4, 48, 8, 5, boxstyle="round,pad=0.3", fc=SWITCH_COLOR, ec='#c0571e', lw=1.5)
     ax.add_patch(sw)
     ax.text(0, 50.5, 'Latching\nSwitch', ha='center', va='center', fontsize=7, color='white', fontweight='bold')
     ax.annotate('← user presses', xy=(7.5, 50.5), fontsize=7, color=SWITCH_COLOR,
@@ -184,7 +190,7 @@ def draw_option_b(ax):
     ax.plot([0, 0], [53, 73], color='#e74c3c', lw=1.5, ls='--')
 
     # --- ERM Motor (transverse - horizontal) ---
-    motor = FancyBboxPatch((-6.5, 74), 13, 6, boxstyle="round,pad=0.4", fc=MOTOR_COLOR, ec='#922b21', lw=2)
+    motor = box(-6.5, 74, 13, 6, boxstyle="round,pad=0.4", fc=MOTOR_COLOR, ec='#922b21', lw=2)
     ax.add_patch(motor)
     ax.text(0, 77, 'ERM Motor ⌀6×12\n(transverse)', ha='center', va='center', fontsize=7, color='white', fontweight='bold')
     # eccentric on right side
@@ -193,11 +199,11 @@ def draw_option_b(ax):
     ax.text(5, 81, '●', ha='center', va='center', fontsize=7, color='#922b21')
 
     # --- Stub arm (very short) ---
-    ax.add_patch(patches.FancyBboxPatch((4, 82.5), 2, 3, boxstyle="round,pad=0.2", fc=LINKAGE_COLOR, ec='#c0392b', lw=1, alpha=0.7))
+    ax.add_patch(box(4, 82.5, 2, 3, boxstyle="round,pad=0.2", fc=LINKAGE_COLOR, ec='#c0392b', lw=1, alpha=0.7))
     ax.text(10.5, 82, '← stub arm\n   (direct)', ha='left', va='center', fontsize=6, color='#ff6b6b', fontstyle='italic')
 
     # --- TPE boot ---
-    boot = FancyBboxPatch((-8, 85), 16, 3, boxstyle="round,pad=0.5", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.6)
+    boot = box(-8, 85, 16, 3, boxstyle="round,pad=0.5", fc=TPE_COLOR, ec='#3d7a6a', lw=2, alpha=0.6)
     ax.add_patch(boot)
     ax.text(0, 86.5, 'TPE boot (seal)', ha='center', va='center', fontsize=6.5, color='white', fontweight='bold')
 
@@ -205,12 +211,12 @@ def draw_option_b(ax):
     ax.plot([-5.5, 5.5], [88.5, 88.5], color='white', lw=1, ls=':')
 
     # Fixed half
-    fixed = FancyBboxPatch((-5.5, 89), 5, 8, boxstyle="round,pad=0.3", fc=PP_COLOR, ec='#a8a060', lw=1.5)
+    fixed = box(-5.5, 89, 5, 8, boxstyle="round,pad=0.3", fc=PP_COLOR, ec='#a8a060', lw=1.5)
     ax.add_patch(fixed)
     ax.text(-3, 93, 'Fixed\nHalf', ha='center', va='center', fontsize=7, color='#333', fontweight='bold')
 
     # Moving half
-    moving = FancyBboxPatch((0.5, 89), 5, 8, boxstyle="round,pad=0.3", fc='#f0e68c', ec='#b8a030', lw=1.5)
+    moving = box(0.5, 89, 5, 8, boxstyle="round,pad=0.3", fc='#f0e68c', ec='#b8a030', lw=1.5)
     ax.add_patch(moving)
     ax.text(3, 93, 'Moving\nHalf', ha='center', va='center', fontsize=7, color='#333', fontweight='bold')
     ax.annotate('', xy=(5.8, 93), xytext=(5.8, 91), arrowprops=dict(arrowstyle='<->', color='#b8a030', lw=1.5))
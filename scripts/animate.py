@@ -0,0 +1,101 @@
+"""Blitted animation of figures whose moving parts are a few artists.
+
+The figure is drawn once without the moving artists; each frame restores
+that background and draws only them. GIFs need Pillow, MP4 needs ffmpeg on PATH.
+
+    rot = Affine2D()
+    for a in wand:
+        a.set_transform(rot + ax.transData)   # move by editing `rot`
+    record(fig, wand, lambda angle: rot.clear().rotate_deg_around(sx, sy, angle - 90),
+           np.linspace(90, 265, 60), "swing.gif")
+"""
+
+import os
+import shutil
+import subprocess
+
+import numpy as np
+
+
+class Blit:
+    """Cached background plus the artists drawn over it each frame."""
+
+    def __init__(self, fig, artists, dpi=None):
+        self.fig = fig
+        self.artists = list(artists)
+        if dpi:
+            fig.set_dpi(dpi)
+        for a in self.artists:
+            a.set_animated(True)
+        self._background = None
+
+    def background(self):
+        """Draw everything but the moving artists once and keep the bitmap."""
+        if self._background is None:
+            canvas = self.fig.canvas
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        return self._background
+
+    def frame(self):
+        """(h, w, 4) uint8 RGBA of the current frame; valid until the next call."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background())
+        for a in self.artists:
+            self.fig.draw_artist(a)
+        return np.asarray(canvas.buffer_rgba())
+
+
+def frames(blit, update, values):
+    """Yield one RGBA frame per value, after update(value) has moved the artists."""
+    for v in values:
+        update(v)
+        yield blit.frame()
+
+
+def _write_gif(images, path, fps):
+    from PIL import Image
+
+    first, rest = None, []
+    for rgba in images:
+        img = Image.fromarray(rgba[..., :3])
+        if first is None:
+            first = img.quantize(colors=255, method=Image.Quantize.MEDIANCUT)
+            continue
+        rest.append(img.quantize(palette=first, dither=Image.Dither.NONE))
+    first.save(path, save_all=True, append_images=rest, duration=round(1000 / fps), loop=0,
+               optimize=False, disposal=1)
+
+
+def _write_mp4(images, path, fps):
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("MP4 export needs ffmpeg on PATH; write a .gif instead")
+    proc = None
+    try:
+        for rgba in images:
+            if proc is None:
+                h, w = rgba.shape[:2]
+                proc = subprocess.Popen(
+                    [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+                     "-s", f"{w}x{h}", "-r", str(fps), "-i", "-",
+                     "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p",
+                     "-c:v", "libx264", path],
+                    stdin=subprocess.PIPE)
+            proc.stdin.write(rgba.tobytes())
+    finally:
+        if proc is not None:
+            proc.stdin.close()
+            if proc.wait():
+                raise RuntimeError(f"ffmpeg failed writing {path}")
+
+
+def record(fig, artists, update, values, path, fps=25, dpi=None):
+    """Animate `artists` over `values` and write a .gif or .mp4; returns the frame count."""
+    ext = os.path.splitext(path)[1].lower()
+    writers = {".gif": _write_gif, ".mp4": _write_mp4}
+    if ext not in writers:
+        raise ValueError(f"Unsupported animation format {ext!r}; use .gif or .mp4")
+    values = list(values)
+    writers[ext](frames(Blit(fig, artists, dpi), update, values), path, fps)
+    return len(values)
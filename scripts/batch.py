@@ -0,0 +1,115 @@
+"""Batched drawing for diagram primitives.
+
+Adding patches one at a time costs one artist (and one draw call with its own
+graphics context) per box, strip and arrow. A Batch collects them and draws
+each z-order's worth as one collection:
+
+    batch = Batch(ax)
+    batch.add(FancyBboxPatch(...))            # boxes, strips, swatches
+    batch.arrow(FancyArrowPatch(p1, p2, ...)) # connectors, dimension lines
+    batch.flush()
+
+Output matches the unbatched drawing: each collection takes its slot in the
+axes' draw order when its first member is added, members keep their own
+colours, widths, line styles and alpha, and arrows are still laid out by
+matplotlib's FancyArrowPatch at draw time, so heads and shrink keep their
+point sizes at any dpi and after tight_layout.
+"""
+
+import numpy as np
+from matplotlib.collections import Collection, PatchCollection
+from matplotlib.path import Path
+
+
+def _styles(patches):
+    return {
+        "facecolor": [p.get_facecolor() if p.get_fill() else (0, 0, 0, 0) for p in patches],
+        "edgecolor": [p.get_edgecolor() for p in patches],
+        "linewidth": [p.get_linewidth() for p in patches],
+        "linestyle": [p.get_linestyle() for p in patches],
+        "antialiased": [p.get_antialiased() for p in patches],
+    }
+
+
+def _arrow_parts(arrow, dpi_cor):
+    """(path, filled) pieces of a FancyArrowPatch in data coordinates, its sizes in points at this dpi."""
+    scale, width, shrink = arrow.get_mutation_scale(), arrow.get_linewidth(), (arrow.shrinkA, arrow.shrinkB)
+    # get_path() lays the arrow out at one pixel per point; FancyArrowPatch.draw scales by dpi / 72.
+    arrow.set_mutation_scale(scale * dpi_cor)
+    arrow.set_linewidth(width * dpi_cor)
+    arrow.shrinkA, arrow.shrinkB = shrink[0] * dpi_cor, shrink[1] * dpi_cor
+    try:
+        path = arrow.get_path()
+    finally:
+        arrow.set_mutation_scale(scale)
+        arrow.set_linewidth(width)
+        arrow.shrinkA, arrow.shrinkB = shrink
+    # One subpath per piece (shaft, heads); the filled ones are the closed heads and bodies.
+    starts = np.flatnonzero(path.codes == Path.MOVETO).tolist() + [len(path.codes)]
+    return [(Path(path.vertices[i:j], path.codes[i:j]), path.codes[j - 1] == Path.CLOSEPOLY)
+            for i, j in zip(starts, starts[1:])]
+
+
+class ArrowCollection(Collection):
+    """FancyArrowPatches drawn as one collection; geometry is resolved per draw."""
+
+    def __init__(self, arrows=(), **kwargs):
+        super().__init__(**kwargs)
+        self.arrows = list(arrows)
+        self.set_paths([])
+
+    def draw(self, renderer):
+        if not self.get_visible() or not self.arrows:
+            return
+        paths, face, edge, width, style = [], [], [], [], []
+        dpi_cor = renderer.points_to_pixels(1.)
+        for a in self.arrows:
+            a.set_transform(self.axes.transData)
+            for p, f in _arrow_parts(a, dpi_cor):
+                paths.append(p)
+                face.append(a.get_facecolor() if f and a.get_facecolor()[3] else (0, 0, 0, 0))
+                edge.append(a.get_edgecolor())
+                width.append(a.get_linewidth())
+                style.append(a.get_linestyle())
+        self.set_paths(paths)
+        self.set_transform(self.axes.transData)
+        self.set(facecolor=face, edgecolor=edge, linewidth=width, linestyle=style)
+        super().draw(renderer)
+
+
+class Batch:
+    """Collects patches and arrows for one axes; flush() hands them over as collections."""
+
+    def __init__(self, ax):
+        self.ax = ax
+        self._slots = {}
+
+    def _slot(self, key, factory):
+        if key not in self._slots:
+            coll = factory()
+            self.ax.add_collection(coll, autolim=False)
+            self._slots[key] = (coll, [])
+        return self._slots[key][1]
+
+    def add(self, patch):
+        """Queue a patch whose path is in data coordinates (boxes, polygons, circles)."""
+        z, join, cap = patch.get_zorder(), patch.get_joinstyle(), patch.get_capstyle()
+        self._slot(("patch", z, join, cap),
+                   lambda: PatchCollection([], zorder=z, joinstyle=join, capstyle=cap)).append(patch)
+        return patch
+
+    def arrow(self, arrow):
+        """Queue a FancyArrowPatch (what ax.annotate("", ...) arrows are)."""
+        z, join, cap = arrow.get_zorder(), arrow.get_joinstyle(), arrow.get_capstyle()
+        self._slot(("arrow", z, join, cap),
+                   lambda: ArrowCollection(zorder=z, joinstyle=join, capstyle=cap)).append(arrow)
+        return arrow
+
+    def flush(self):
+        for (kind, *_), (coll, items) in self._slots.items():
+            if kind == "arrow":
+                coll.arrows = items
+            else:
+                coll.set_paths(items)
+                coll.set(**_styles(items))
+        self._slots = {}
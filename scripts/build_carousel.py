@@ -9,7 +9,6 @@ import os
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, white
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
 
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
@@ -17,6 +16,8 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+from image_fit import add_picture, draw_image
+
 _DIR = os.path.dirname(os.path.abspath(__file__))
 
 # -- Page size: 4:5 ratio --
@@ -157,10 +158,8 @@ if os.path.exists(img_path):
     img_top_y = 75 * mm
     img_max_w = PW - 2 * M
     img_max_h = 135 * mm
-    c.drawImage(ImageReader(img_path),
-                M, PH - img_top_y - img_max_h,
-                width=img_max_w, height=img_max_h,
-                preserveAspectRatio=True, anchor='sw', mask='auto')
+    draw_image(c, img_path, M, PH - img_top_y - img_max_h, img_max_w, img_max_h,
+               align="bottom left")
 
 # Bottom bar
 card_flat(c, 0, PH - 8 * mm, PW, 8 * mm, CARD_BG)
@@ -669,8 +668,8 @@ pptx_text(slide, PM, Inches(2.2), SLIDE_W - 2 * PM, Inches(0.6),
 # Image
 img_path = os.path.join(_DIR, "cross_section_illustration_haptic_metronome.png")
 if os.path.exists(img_path):
-    slide.shapes.add_picture(img_path, PM, Inches(3.0),
-                             width=SLIDE_W - 2 * PM, height=Inches(5.3))
+    add_picture(slide, img_path, PM, Inches(3.0),
+                width=SLIDE_W - 2 * PM, height=Inches(5.3))
 
 pptx_rect(slide, 0, SLIDE_H - Inches(0.35), SLIDE_W, Inches(0.35), C_CARD_BG)
 pptx_text(slide, PM, SLIDE_H - Inches(0.3), SLIDE_W - 2 * PM, Inches(0.2),
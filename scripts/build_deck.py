@@ -2,12 +2,18 @@
 """Build Chair Balancing Act product overview deck."""
 
 import os
+from functools import partial
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
+import paginate
+from deck_layout import card, layout, row, text
+from image_fit import add_picture
+
 _DIR = os.path.dirname(os.path.abspath(__file__))
 
 # -- Theme colors --
@@ -143,7 +149,7 @@ if os.path.exists(img_path):
     img_h = Inches(6.2)
     img_left = (W - img_w) // 2
     img_top = Inches(1.0)
-    slide.shapes.add_picture(img_path, img_left, img_top, img_w, img_h)
+    add_picture(slide, img_path, img_left, img_top, img_w, img_h)
 
 # ============================================================
 # SLIDE 3: How It Works + Device
@@ -168,19 +174,24 @@ zones = [
      ACCENT_RED),
 ]
 
-for i, (title, subtitle, desc, color) in enumerate(zones):
-    x = Inches(0.8) + Inches(4.1) * i
-    add_shape(slide, x, Inches(1.8), Inches(3.6), Inches(0.06), color)
-    add_shape(slide, x, Inches(1.86), Inches(3.6), Inches(3.6), CARD_BG)
-
-    t = tb(slide, x + Inches(0.3), Inches(2.1), Inches(3.0), Inches(0.6))
-    set_text(t.text_frame, title, size=24, color=color, bold=True)
+zone_cards = [
+    card(f"zone{i}", [
+        text(f"zone{i}.title", title, 24, bold=True),
+        text(f"zone{i}.sub", subtitle, 12, bold=True),
+        text(f"zone{i}.desc", desc, 15),
+    ], pad=(Inches(0.3), Inches(0.24)), min_height=Inches(3.6))
+    for i, (title, subtitle, desc, color) in enumerate(zones)
+]
+boxes = layout(row(zone_cards, gap=Inches(0.5)), Inches(0.8), Inches(1.86), Inches(11.8))
 
-    t = tb(slide, x + Inches(0.3), Inches(2.7), Inches(3.0), Inches(0.4))
-    set_text(t.text_frame, subtitle, size=12, color=LIGHT_GRAY, bold=True)
+for i, (title, subtitle, desc, color) in enumerate(zones):
+    c = boxes[f"zone{i}"]
+    add_shape(slide, c.left, c.top - Inches(0.06), c.width, Inches(0.06), color)
+    add_shape(slide, *c, CARD_BG)
 
-    t = tb(slide, x + Inches(0.3), Inches(3.2), Inches(3.0), Inches(2.0))
-    set_text(t.text_frame, desc, size=15, color=SOFT_WHITE)
+    set_text(tb(slide, *boxes[f"zone{i}.title"]).text_frame, title, size=24, color=color, bold=True)
+    set_text(tb(slide, *boxes[f"zone{i}.sub"]).text_frame, subtitle, size=12, color=LIGHT_GRAY, bold=True)
+    set_text(tb(slide, *boxes[f"zone{i}.desc"]).text_frame, desc, size=15, color=SOFT_WHITE)
 
 # Bottom — device specs
 add_shape(slide, Inches(0.8), Inches(5.8), Inches(11.5), Inches(1.2), CARD_BG)
@@ -214,18 +225,22 @@ subsystems = [
     ("Button", "On/off, mode cycle", "GPIO"),
 ]
 
-for i, (name, purpose, detail) in enumerate(subsystems):
-    y = Inches(2.2) + Inches(0.75) * i
+# A long subsystem list spills onto a continuation slide above the data-flow bar
+subsystem_h = [Inches(0.65).pt] * len(subsystems)
+more = partial(paginate.continuation_slide, prs, "Architecture & Constraints", ACCENT_BLUE, DARK_BG)
+
+for s, i, y in paginate.paged(slide, subsystem_h, Inches(2.2), Inches(6.1), Inches(0.1), more):
+    name, purpose, detail = subsystems[i]
     bg = CARD_BG if i % 2 == 0 else CARD_BG_ALT
-    add_shape(slide, Inches(0.8), y, Inches(5.8), Inches(0.65), bg)
+    add_shape(s, Inches(0.8), y, Inches(5.8), Inches(0.65), bg)
 
-    t = tb(slide, Inches(1.0), y + Inches(0.05), Inches(2.2), Inches(0.3))
+    t = tb(s, Inches(1.0), y + Inches(0.05), Inches(2.2), Inches(0.3))
     set_text(t.text_frame, name, size=14, color=WHITE, bold=True)
 
-    t = tb(slide, Inches(1.0), y + Inches(0.33), Inches(2.2), Inches(0.3))
+    t = tb(s, Inches(1.0), y + Inches(0.33), Inches(2.2), Inches(0.3))
     set_text(t.text_frame, purpose, size=11, color=LIGHT_GRAY)
 
-    t = tb(slide, Inches(3.5), y + Inches(0.15), Inches(3.0), Inches(0.35))
+    t = tb(s, Inches(3.5), y + Inches(0.15), Inches(3.0), Inches(0.35))
     set_text(t.text_frame, detail, size=11, color=ACCENT_GREEN)
 
 # Right — constraints
@@ -290,15 +305,21 @@ problems = [
      "Needs sound designer + playtesting with kids."),
 ]
 
-for i, (title, desc) in enumerate(problems):
-    y = Inches(2.2) + Inches(1.35) * i
-    add_shape(slide, Inches(0.8), y, Inches(5.8), Inches(1.15), CARD_BG)
-    circle_num(slide, Inches(1.0), y + Inches(0.15), i + 1, ACCENT_RED)
+# Card height grows with the description; overflow moves to a continuation slide
+problem_h = [paginate.block_height([(desc, 11, False)], Inches(4.6).pt,
+                                   pad_pt=Inches(0.25).pt, min_pt=Inches(1.15).pt)
+             for _, desc in problems]
+more = partial(paginate.continuation_slide, prs, "Hardest Problems", ACCENT_RED, DARK_BG)
 
-    t = tb(slide, Inches(1.6), y + Inches(0.08), Inches(4.8), Inches(0.35))
+for s, i, y in paginate.paged(slide, problem_h, Inches(2.2), Inches(6.4), Inches(0.2), more):
+    title, desc = problems[i]
+    add_shape(s, Inches(0.8), y, Inches(5.8), Pt(problem_h[i]), CARD_BG)
+    circle_num(s, Inches(1.0), y + Inches(0.15), i + 1, ACCENT_RED)
+
+    t = tb(s, Inches(1.6), y + Inches(0.08), Inches(4.8), Inches(0.35))
     set_text(t.text_frame, title, size=15, color=WHITE, bold=True)
 
-    t = tb(slide, Inches(1.6), y + Inches(0.42), Inches(4.8), Inches(0.7))
+    t = tb(s, Inches(1.6), y + Inches(0.42), Inches(4.8), Pt(problem_h[i]) - Inches(0.5))
     set_text(t.text_frame, desc, size=11, color=LIGHT_GRAY)
 
 # Right — component tradeoffs
@@ -411,11 +432,10 @@ key_reqs = [
 ]
 
 for i, (req_id, desc) in enumerate(key_reqs):
-    row = i // 2
-    col = i % 2
+    r, col = divmod(i, 2)
     x = Inches(0.8) + Inches(6.1) * col
-    y = Inches(5.2) + Inches(0.55) * row
-    bg = CARD_BG if row % 2 == 0 else CARD_BG_ALT
+    y = Inches(5.2) + Inches(0.55) * r
+    bg = CARD_BG if r % 2 == 0 else CARD_BG_ALT
     add_shape(slide, x, y, Inches(5.8), Inches(0.45), bg)
 
     t = tb(slide, x + Inches(0.15), y + Inches(0.06), Inches(0.9), Inches(0.3))
@@ -449,15 +469,20 @@ open_items = [
     ("M3", "Adhesive durability testing"),
 ]
 
-for i, (milestone, desc) in enumerate(open_items):
-    y = Inches(2.2) + Inches(0.62) * i
+open_h = [paginate.block_height([(desc, 13, False)], Inches(5.2).pt,
+                                pad_pt=Inches(0.08).pt, min_pt=Inches(0.52).pt)
+          for _, desc in open_items]
+more = partial(paginate.continuation_slide, prs, "Open Items", ACCENT_ORANGE, DARK_BG)
+
+for s, i, y in paginate.paged(slide, open_h, Inches(2.2), Inches(6.5), Inches(0.1), more):
+    milestone, desc = open_items[i]
     bg = CARD_BG if i % 2 == 0 else CARD_BG_ALT
-    add_shape(slide, Inches(0.8), y, Inches(6.5), Inches(0.52), bg)
+    add_shape(s, Inches(0.8), y, Inches(6.5), Pt(open_h[i]), bg)
 
-    t = tb(slide, Inches(1.0), y + Inches(0.1), Inches(0.6), Inches(0.3))
+    t = tb(s, Inches(1.0), y + Inches(0.1), Inches(0.6), Inches(0.3))
     set_text(t.text_frame, milestone, size=12, color=ACCENT_ORANGE, bold=True)
 
-    t = tb(slide, Inches(1.7), y + Inches(0.1), Inches(5.4), Inches(0.3))
+    t = tb(s, Inches(1.7), y + Inches(0.1), Inches(5.4), Pt(open_h[i]) - Inches(0.2))
     set_text(t.text_frame, desc, size=13, color=SOFT_WHITE)
 
 # Right — V2 features
@@ -2,13 +2,55 @@
 """Build AirSense Indoor Environment Monitor product overview deck."""
 
 import os
+import re
+from functools import partial
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
+import paginate
+import system_model
+from deck_layout import card, column, grid, layout, row, text
+from image_fit import add_picture
+from text_metrics import text_height
+
 _DIR = os.path.dirname(os.path.abspath(__file__))
+SYSTEM_DESC = os.path.join(_DIR, "..", "examples", "smart_sensor_hub", "smart_sensor_hub.md")
+
+model = system_model.load(SYSTEM_DESC)
+
+MAX_TIER_BULLETS = 8
+# Curated card copy per §3 tier id. Tiers not listed here show the model's
+# name, scope and component names.
+TIER_CARDS = {
+    "Device": ("Sensor Node", "1 per room",
+               ["nRF52840 SoC (BLE 5.3)", "CO2 (SCD41) + T/H (SHT40) + PM (PMSA003I)",
+                "2x AA batteries, >12 month target", "Deep sleep 99% of the time",
+                "BLE advertisement every 5 min"]),
+    "Gateway": ("Gateway", "1 per floor",
+                ["ESP32-S3 + Ethernet", "Passively scans BLE advertisements",
+                 "Aggregates data from up to 50 nodes", "Forwards to cloud via MQTT/TLS",
+                 "Mains-powered, always on"]),
+    "Cloud": ("Cloud Backend", "Centralized",
+              ["MQTT ingestion (AWS IoT Core)", "TimescaleDB time-series storage",
+               "REST API + web dashboard", "Alert engine (CO2, temp, device health)",
+               "OTA firmware deployment to fleet"]),
+}
+# Curated unit prices at volume; the §4 sensor table has no cost column.
+SENSOR_COST = {"SCD41": "$8-12", "SHT40": "$1-2", "PMSA003I": "$7-9"}
+# §6 power facts shown on the deep-dive slide, in order, with their slide labels.
+POWER_FACTS = {
+    "Type": "Source",
+    "Capacity": "Capacity",
+    "Sleep current": "Sleep current",
+    "Duty cycle": "Sense cycle",
+    "Target battery life": "Target life",
+    "Largest draw": "Battery issue",
+}
+TIER_WORDS = {2: "Two", 3: "Three", 4: "Four", 5: "Five", 6: "Six"}
 
 # -- Theme colors --
 DARK_BG = RGBColor(0x0F, 0x17, 0x2A)
@@ -114,7 +156,7 @@ add_p(tf, "Replace complaint-driven HVAC management with data.", size=18, color=
 # System overview concept art — right side
 overview_img = os.path.join(_DIR, "System_Overview.png")
 if os.path.exists(overview_img):
-    slide.shapes.add_picture(overview_img, Inches(6.8), Inches(1.0), Inches(5.2), Inches(5.2))
+    add_picture(slide, overview_img, Inches(6.8), Inches(1.0), Inches(5.2), Inches(5.2))
 
 add_shape(slide, Inches(0), Inches(6.5), W, Inches(0.005), RGBColor(0x33, 0x33, 0x55))
 t3 = tb(slide, Inches(0.8), Inches(6.6), Inches(11), Inches(0.6))
@@ -127,56 +169,68 @@ slide = prs.slides.add_slide(prs.slide_layouts[6])
 add_bg(slide)
 add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_BLUE)
 
+# Tier cards — one per product subgraph in the §3 architecture diagram (not Users)
+system_tiers = [tier for tier in model.tiers if not tier.external]
+tier_names = {tier.id: TIER_CARDS.get(tier.id, (tier.name,))[0] for tier in model.tiers}
+
 t = tb(slide, Inches(0.8), Inches(0.4), Inches(11), Inches(0.8))
-set_text(t.text_frame, "Three-Tier Architecture", size=36, color=WHITE, bold=True)
-
-# Tier boxes
-tiers = [
-    ("SENSOR NODE", "1 per room", ACCENT_TEAL,
-     ["nRF52840 SoC (BLE 5.3)", "CO2 (SCD41) + T/H (SHT40) + PM (PMSA003I)",
-      "2x AA batteries, >12 month target", "Deep sleep 99% of the time",
-      "BLE advertisement every 5 min"]),
-    ("GATEWAY", "1 per floor", ACCENT_BLUE,
-     ["ESP32-S3 + Ethernet", "Passively scans BLE advertisements",
-      "Aggregates data from up to 50 nodes", "Forwards to cloud via MQTT/TLS",
-      "Mains-powered, always on"]),
-    ("CLOUD BACKEND", "Centralized", ACCENT_PURPLE,
-     ["MQTT ingestion (AWS IoT Core)", "TimescaleDB time-series storage",
-      "REST API + web dashboard", "Alert engine (CO2, temp, device health)",
-      "OTA firmware deployment to fleet"]),
+set_text(t.text_frame, f"{TIER_WORDS.get(len(system_tiers), len(system_tiers))}-Tier Architecture",
+         size=36, color=WHITE, bold=True)
+
+tier_colors = [ACCENT_TEAL, ACCENT_BLUE, ACCENT_PURPLE, ACCENT_ORANGE, ACCENT_RED]
+tiers = []
+for i, tier in enumerate(system_tiers):
+    name, scope, bullets = TIER_CARDS.get(tier.id, (tier.name, tier.scope, [c.name for c in tier.components]))
+    if len(bullets) > MAX_TIER_BULLETS:
+        bullets = bullets[:MAX_TIER_BULLETS - 1] + [f"+{len(bullets) - MAX_TIER_BULLETS + 1} more"]
+    tiers.append((name.upper(), scope, tier_colors[i % len(tier_colors)], bullets))
+
+tier_cards = [
+    card(f"tier{i}", [
+        text(f"tier{i}.name", name, 20, bold=True),
+        text(f"tier{i}.sub", subtitle, 12, bold=True),
+        column([text(f"tier{i}.b{j}", b, 12) for j, b in enumerate(bullets)],
+               gap=Inches(0.12), pad=(0, Inches(0.12), 0, 0)),
+    ], min_height=Inches(4.5) if len(tiers) <= 4 else Inches(2.1))
+    for i, (name, subtitle, color, bullets) in enumerate(tiers)
 ]
+if len(tiers) <= 4:
+    tier_layout = row(tier_cards, gap=Inches(0.3))
+else:
+    tier_layout = grid(tier_cards, cols=4, gutter=Inches(0.3), row_gap=Inches(0.2), equal_rows=True)
+boxes = layout(tier_layout, Inches(0.6), Inches(1.66), Inches(12.0))
 
 for i, (name, subtitle, color, bullets) in enumerate(tiers):
-    x = Inches(0.6) + Inches(4.1) * i
-    add_shape(slide, x, Inches(1.6), Inches(3.8), Inches(0.06), color)
-    add_shape(slide, x, Inches(1.66), Inches(3.8), Inches(4.5), CARD_BG)
-
-    t = tb(slide, x + Inches(0.25), Inches(1.85), Inches(3.3), Inches(0.5))
-    set_text(t.text_frame, name, size=20, color=color, bold=True)
-
-    t = tb(slide, x + Inches(0.25), Inches(2.35), Inches(3.3), Inches(0.3))
-    set_text(t.text_frame, subtitle, size=12, color=LIGHT_GRAY, bold=True)
+    c = boxes[f"tier{i}"]
+    add_shape(slide, c.left, c.top - Inches(0.06), c.width, Inches(0.06), color)
+    add_shape(slide, *c, CARD_BG)
 
+    set_text(tb(slide, *boxes[f"tier{i}.name"]).text_frame, name, size=20, color=color, bold=True)
+    set_text(tb(slide, *boxes[f"tier{i}.sub"]).text_frame, subtitle, size=12, color=LIGHT_GRAY, bold=True)
     for j, bullet in enumerate(bullets):
-        t = tb(slide, x + Inches(0.25), Inches(2.85) + Inches(0.5) * j, Inches(3.3), Inches(0.4))
-        set_text(t.text_frame, bullet, size=12, color=SOFT_WHITE)
-
-# Arrows between tiers
-for i in range(2):
-    ax = Inches(4.4) + Inches(4.1) * i
-    ay = Inches(3.8)
-    add_shape(slide, ax, ay, Inches(0.3), Inches(0.04), LIGHT_GRAY)
+        set_text(tb(slide, *boxes[f"tier{i}.b{j}"]).text_frame, bullet, size=12, color=SOFT_WHITE)
+
+# Arrows between neighbouring tiers, labelled with the protocols linking them
+for i in range(len(tiers) - 1):
+    c, nxt = boxes[f"tier{i}"], boxes[f"tier{i + 1}"]
+    if nxt.top != c.top:
+        continue
+    ax = c.left + c.width
+    ay = c.top + Inches(2.14)
+    add_shape(slide, ax, ay, nxt.left - ax, Inches(0.04), LIGHT_GRAY)
     # Arrow label
-    labels = ["BLE 5.3", "MQTT/TLS"]
-    t = tb(slide, ax - Inches(0.1), ay - Inches(0.35), Inches(0.6), Inches(0.3))
-    set_text(t.text_frame, labels[i], size=9, color=LIGHT_GRAY, bold=True, align=PP_ALIGN.CENTER)
-
-# Bottom — data flow
+    label = " / ".join(model.tier_links(system_tiers[i].id, system_tiers[i + 1].id))
+    t = tb(slide, ax - Inches(0.1), ay - Inches(0.35), nxt.left - ax + Inches(0.2), Inches(0.3))
+    set_text(t.text_frame, label, size=9, color=LIGHT_GRAY, bold=True, align=PP_ALIGN.CENTER)
+
+# Bottom — data flow, through to the users
+flow = tier_names[model.tiers[0].id] if model.tiers else ""
+for a, b in zip(model.tiers, model.tiers[1:]):
+    via = " / ".join(model.tier_links(a.id, b.id))
+    flow += f" --({via})--> {tier_names[b.id]}" if via else f" --> {tier_names[b.id]}"
 add_shape(slide, Inches(0.6), Inches(6.4), Inches(12.1), Inches(0.7), CARD_BG)
 t = tb(slide, Inches(0.8), Inches(6.5), Inches(11.5), Inches(0.5))
-set_text(t.text_frame,
-         "Sensor node (BLE adv, one-way) --> Gateway (passive scan, Ethernet) --> Cloud (MQTT) --> Dashboard (REST API)",
-         size=14, color=LIGHT_GRAY)
+set_text(t.text_frame, flow, size=14, color=LIGHT_GRAY)
 
 # ============================================================
 # SLIDE 3: Hardware Cross-Sections
@@ -191,7 +245,7 @@ set_text(t.text_frame, "Inside the Hardware", size=36, color=WHITE, bold=True)
 # Left — sensor node cross-section
 node_img = os.path.join(_DIR, "Cross-Section — Sensor Node.png")
 if os.path.exists(node_img):
-    slide.shapes.add_picture(node_img, Inches(0.5), Inches(1.5), Inches(5.5), Inches(5.5))
+    add_picture(slide, node_img, Inches(0.5), Inches(1.5), Inches(5.5), Inches(5.5))
 
 add_shape(slide, Inches(0.5), Inches(1.15), Inches(5.5), Inches(0.35), ACCENT_TEAL)
 t = tb(slide, Inches(0.65), Inches(1.18), Inches(5.2), Inches(0.3))
@@ -200,7 +254,7 @@ set_text(t.text_frame, "SENSOR NODE  (1 per room)", size=13, color=WHITE, bold=T
 # Right — gateway cross-section
 gw_img = os.path.join(_DIR, "Cross-Section — Gateway.png")
 if os.path.exists(gw_img):
-    slide.shapes.add_picture(gw_img, Inches(6.5), Inches(1.5), Inches(6.3), Inches(3.9))
+    add_picture(slide, gw_img, Inches(6.5), Inches(1.5), Inches(6.3), Inches(3.9))
 
 add_shape(slide, Inches(6.5), Inches(1.15), Inches(6.3), Inches(0.35), ACCENT_BLUE)
 t = tb(slide, Inches(6.65), Inches(1.18), Inches(6.0), Inches(0.3))
@@ -235,78 +289,82 @@ add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_TEAL)
 t = tb(slide, Inches(0.8), Inches(0.4), Inches(11), Inches(0.8))
 set_text(t.text_frame, "Sensor Node — Components & Power", size=36, color=WHITE, bold=True)
 
-# Left — sensors
+# Left — sensors (§4 sensor table)
+sensors = model.sensors
+shown = paginate.split([Inches(0.82).pt] * len(sensors), Inches(3.1).pt, Inches(0.13).pt)[0]
+more = f"  (+{len(sensors) - shown.stop} more)" if shown.stop < len(sensors) else ""
+
 add_shape(slide, Inches(0.8), Inches(1.5), Inches(5.8), Inches(0.5), ACCENT_TEAL)
 t = tb(slide, Inches(1.0), Inches(1.55), Inches(5.4), Inches(0.4))
-set_text(t.text_frame, "SENSORS", size=14, color=WHITE, bold=True)
+set_text(t.text_frame, "SENSORS" + more, size=14, color=WHITE, bold=True)
 
-sensors = [
-    ("SCD41 (Sensirion)", "CO2 ppm + temp + humidity", "+/-40 ppm accuracy", "$8-12", ACCENT_TEAL),
-    ("SHT40 (Sensirion)", "Temperature + humidity", "+/-0.2C, +/-1.8% RH", "$1-2", ACCENT_TEAL),
-    ("PMSA003I (Plantower)", "PM1.0, PM2.5, PM10", "+/-10 ug/m3", "$7-9", ACCENT_ORANGE),
-]
+# The sensor that dominates the §6 power budget gets the warning accent
+hog = max(model.power_budget, key=lambda d: d.avg_ua).component if model.power_budget else None
 
-for i, (name, measures, accuracy, cost, color) in enumerate(sensors):
+for i, sensor in enumerate(sensors[:shown.stop]):
     y = Inches(2.2) + Inches(0.95) * i
+    color = ACCENT_ORANGE if hog and hog in sensor.get("Sensor", "") else ACCENT_TEAL
     bg = CARD_BG if i % 2 == 0 else CARD_BG_ALT
     add_shape(slide, Inches(0.8), y, Inches(5.8), Inches(0.82), bg)
     accent_bar(slide, Inches(0.8), y + Inches(0.1), Inches(0.6), color)
 
     t = tb(slide, Inches(1.1), y + Inches(0.05), Inches(2.5), Inches(0.3))
-    set_text(t.text_frame, name, size=13, color=WHITE, bold=True)
+    set_text(t.text_frame, sensor.get("Sensor", ""), size=13, color=WHITE, bold=True)
 
+    cost = next((c for part, c in SENSOR_COST.items() if part in sensor.get("Sensor", "")), "")
     t = tb(slide, Inches(3.8), y + Inches(0.05), Inches(2.5), Inches(0.3))
     set_text(t.text_frame, cost, size=13, color=color, bold=True, align=PP_ALIGN.RIGHT)
 
-    t = tb(slide, Inches(1.1), y + Inches(0.35), Inches(3.0), Inches(0.3))
-    set_text(t.text_frame, f"{measures}  |  {accuracy}", size=11, color=LIGHT_GRAY)
+    t = tb(slide, Inches(1.1), y + Inches(0.35), Inches(5.3), Inches(0.3))
+    set_text(t.text_frame, f"{sensor.get('Measures', '')}  |  {sensor.get('Key Spec', '')}", size=11, color=LIGHT_GRAY)
+
+# Right — power (§6 power source, budget figures and target)
+facts = dict(model.power)
+power = [(label, facts[key]) for key, label in POWER_FACTS.items() if key in facts] or list(model.power)
+# Parenthesised asides ("(Energizer Ultimate Lithium L91)") stay in the spec
+power = [(label, re.sub(r"\s*\([^)]*\)$", "", value)) for label, value in power]
 
-# Right — power & firmware
 rx = Inches(7.3)
+value_w = Inches(3.5)
+heights = [max(Inches(0.42).pt, text_height(value, 11, value_w.pt - 14.4) + Inches(0.2).pt)
+           for _, value in power]
+shown = paginate.split(heights, Inches(3.1).pt, Inches(0.08).pt)[0]
+more = f"  (+{len(heights) - shown.stop} more)" if shown.stop < len(heights) else ""
+
 add_shape(slide, rx, Inches(1.5), Inches(5.3), Inches(0.5), ACCENT_ORANGE)
 t = tb(slide, rx + Inches(0.2), Inches(1.55), Inches(4.8), Inches(0.4))
-set_text(t.text_frame, "POWER ARCHITECTURE", size=14, color=WHITE, bold=True)
-
-power_items = [
-    ("Source", "2x AA lithium (Energizer L91)"),
-    ("Capacity", "3000 mAh, 6V input -> TPS62740 -> 3.3V"),
-    ("Sleep current", "~2 uA (MCU + regulator quiescent)"),
-    ("Sense cycle", "5s active every 5 min = 99.7% sleeping"),
-    ("Target life", ">12 months (PM sensor is the bottleneck)"),
-    ("Battery issue", "PM sensor @ 25 mA eats 417 uA avg alone"),
-]
+set_text(t.text_frame, "POWER ARCHITECTURE" + more, size=14, color=WHITE, bold=True)
 
-for i, (label, value) in enumerate(power_items):
-    y = Inches(2.2) + Inches(0.63) * i
+for i, offset in zip(range(shown.stop), shown.offsets):
+    label, value = power[i]
+    y = Inches(2.2) + Pt(offset)
     bg = CARD_BG if i % 2 == 0 else CARD_BG_ALT
-    add_shape(slide, rx, y, Inches(5.3), Inches(0.52), bg)
+    add_shape(slide, rx, y, Inches(5.3), Pt(heights[i]), bg)
 
-    t = tb(slide, rx + Inches(0.15), y + Inches(0.1), Inches(1.4), Inches(0.3))
+    t = tb(slide, rx + Inches(0.15), y + Inches(0.05), Inches(1.4), Inches(0.3))
     set_text(t.text_frame, label, size=11, color=ACCENT_ORANGE, bold=True)
 
-    t = tb(slide, rx + Inches(1.6), y + Inches(0.1), Inches(3.5), Inches(0.3))
+    t = tb(slide, rx + Inches(1.6), y + Inches(0.05), value_w, Pt(heights[i]) - Inches(0.1))
     set_text(t.text_frame, value, size=11, color=SOFT_WHITE)
 
-# Bottom — firmware
+# Bottom — firmware (§4 module table)
 add_shape(slide, Inches(0.8), Inches(5.4), Inches(11.8), Inches(0.5), ACCENT_BLUE)
 t = tb(slide, Inches(1.0), Inches(5.45), Inches(11.4), Inches(0.4))
 set_text(t.text_frame, "FIRMWARE (Zephyr RTOS on nRF52840)", size=14, color=WHITE, bold=True)
 
-fw_modules = [
-    ("Sensor Mgr", "Read SCD41, SHT40, PMSA003I\non schedule. Power-gate PM sensor."),
-    ("BLE Advertiser", "Encode readings into 20-byte\nextended advertisement payload."),
-    ("Power Mgr", "Deep sleep entry/exit,\nbattery ADC monitoring."),
-    ("OTA Mgr", "BLE DFU via MCUboot.\nA/B partitioning, rollback on failure."),
-    ("Config Mgr", "Sample interval, PM enable/disable.\nBLE write from gateway."),
+fw_modules = [(m.get("Module", ""), m.get("Responsibility", "")) for m in model.firmware_modules]
+fw_cards = [
+    card(f"fw{i}", [text(f"fw{i}.name", name, 11, bold=True), text(f"fw{i}.desc", desc, 9)],
+         pad=(Inches(0.1), Inches(0.05)), min_height=Inches(1.1))
+    for i, (name, desc) in enumerate(fw_modules)
 ]
+boxes = layout(grid(fw_cards, cols=max(5, min(len(fw_cards), 6)), gutter=Inches(0.2)),
+               Inches(0.8), Inches(6.05), Inches(11.8))
 
 for i, (name, desc) in enumerate(fw_modules):
-    x = Inches(0.8) + Inches(2.46) * i
-    add_shape(slide, x, Inches(6.05), Inches(2.26), Inches(1.1), CARD_BG)
-    t = tb(slide, x + Inches(0.1), Inches(6.1), Inches(2.05), Inches(0.3))
-    set_text(t.text_frame, name, size=11, color=ACCENT_BLUE, bold=True)
-    t = tb(slide, x + Inches(0.1), Inches(6.4), Inches(2.05), Inches(0.6))
-    set_text(t.text_frame, desc, size=9, color=LIGHT_GRAY)
+    add_shape(slide, *boxes[f"fw{i}"], CARD_BG)
+    set_text(tb(slide, *boxes[f"fw{i}.name"]).text_frame, name, size=11, color=ACCENT_BLUE, bold=True)
+    set_text(tb(slide, *boxes[f"fw{i}.desc"]).text_frame, desc, size=9, color=LIGHT_GRAY)
 
 # ============================================================
 # SLIDE 4: Constraints & BOM
@@ -318,7 +376,7 @@ add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_ORANGE)
 t = tb(slide, Inches(0.8), Inches(0.4), Inches(11), Inches(0.8))
 set_text(t.text_frame, "Constraints & Cost", size=36, color=WHITE, bold=True)
 
-# Left — constraints
+# Left — constraints (curated from §9)
 add_shape(slide, Inches(0.8), Inches(1.5), Inches(5.8), Inches(0.5), ACCENT_ORANGE)
 t = tb(slide, Inches(1.0), Inches(1.55), Inches(5.4), Inches(0.4))
 set_text(t.text_frame, "HARD CONSTRAINTS", size=14, color=WHITE, bold=True)
@@ -346,30 +404,19 @@ for i, (name, value, note) in enumerate(constraints):
     t = tb(slide, Inches(1.0), y + Inches(0.33), Inches(5.4), Inches(0.25))
     set_text(t.text_frame, note, size=10, color=LIGHT_GRAY)
 
-# Right — BOM breakdown
+# Right — BOM breakdown (line-item table in §9)
 rx = Inches(7.3)
 add_shape(slide, rx, Inches(1.5), Inches(5.3), Inches(0.5), ACCENT_TEAL)
 t = tb(slide, rx + Inches(0.2), Inches(1.55), Inches(4.8), Inches(0.4))
 set_text(t.text_frame, "SENSOR NODE BOM (1k units)", size=14, color=WHITE, bold=True)
 
-bom = [
-    ("nRF52840 SoC", "$4.50"),
-    ("SCD41 CO2 sensor", "$10.00"),
-    ("SHT40 temp/humidity", "$1.50"),
-    ("PMSA003I PM sensor", "$8.00"),
-    ("TPS62740 regulator", "$1.50"),
-    ("RGB LED + passives", "$0.50"),
-    ("PCB (45x45mm, 4-layer)", "$1.50"),
-    ("2x AA battery holder", "$0.40"),
-    ("2x AA lithium cells", "$2.50"),
-    ("Enclosure (ABS molded)", "$2.50"),
-    ("Assembly + test", "$2.50"),
-]
+bom = model.bom
+bom_pitch = min(Inches(0.35), int((Inches(6.0) - Inches(2.15)) / max(1, len(bom) + 1)))
 
 for i, (item, cost) in enumerate(bom):
-    y = Inches(2.15) + Inches(0.35) * i
+    y = Inches(2.15) + bom_pitch * i
     bg = CARD_BG if i % 2 == 0 else CARD_BG_ALT
-    add_shape(slide, rx, y, Inches(5.3), Inches(0.28), bg)
+    add_shape(slide, rx, y, Inches(5.3), bom_pitch - Inches(0.07), bg)
 
     t = tb(slide, rx + Inches(0.15), y + Inches(0.02), Inches(3.2), Inches(0.22))
     set_text(t.text_frame, item, size=10, color=SOFT_WHITE)
@@ -378,12 +425,13 @@ for i, (item, cost) in enumerate(bom):
     set_text(t.text_frame, cost, size=10, color=WHITE, bold=True, align=PP_ALIGN.RIGHT)
 
 # Total
-total_y = Inches(2.15) + Inches(0.35) * len(bom) + Inches(0.08)
+total = sum(float(m.group(1)) for _, cost in bom for m in [re.search(r"\$([\d.]+)", cost)] if m)
+total_y = Inches(2.15) + bom_pitch * len(bom) + Inches(0.08)
 add_shape(slide, rx, total_y, Inches(5.3), Inches(0.35), ACCENT_TEAL)
 t = tb(slide, rx + Inches(0.15), total_y + Inches(0.04), Inches(3.2), Inches(0.25))
 set_text(t.text_frame, "Total COGS (sensor node)", size=11, color=WHITE, bold=True)
 t = tb(slide, rx + Inches(3.5), total_y + Inches(0.04), Inches(1.5), Inches(0.25))
-set_text(t.text_frame, "~$35.90", size=11, color=WHITE, bold=True, align=PP_ALIGN.RIGHT)
+set_text(t.text_frame, f"~${total:.2f}", size=11, color=WHITE, bold=True, align=PP_ALIGN.RIGHT)
 
 # Gateway BOM summary
 gy = total_y + Inches(0.55)
@@ -485,45 +533,40 @@ add_shape(slide, Inches(0), Inches(0), W, Inches(0.06), ACCENT_PURPLE)
 t = tb(slide, Inches(0.8), Inches(0.4), Inches(11), Inches(0.8))
 set_text(t.text_frame, "Key Technical Decisions", size=36, color=WHITE, bold=True)
 
-decisions = [
-    ("BLE + Gateway vs. WiFi Direct", "CHOSEN: BLE + GATEWAY",
-     "WiFi draws 100-300 mA during Tx vs. 8 mA for BLE advertising. WiFi would drain AAs in weeks. "
-     "The gateway adds $35-40 per floor but enables >12 month battery life per sensor node.",
-     "Adds a second hardware product (gateway). BLE range limits placement to ~15m LOS. "
-     "1 gateway per ~500 m2.",
-     ACCENT_TEAL),
-    ("AA Batteries vs. Rechargeable LiPo", "CHOSEN: 2x AA LITHIUM",
-     "Facility staff can swap AAs in seconds with no tools. Rechargeable adds USB-C, charge IC, and "
-     "'another thing to charge' -- doesn't fit mount-and-forget deployment.",
-     "Non-rechargeable: ~$6/year per node in batteries. 200-node building = $1,200/year. "
-     "Rechargeable V2 SKU possible if this becomes a concern.",
-     ACCENT_ORANGE),
-    ("Cloud-Only vs. Edge Analytics", "CHOSEN: CLOUD-ONLY (V1)",
-     "Sensor nodes sleep 99%. Gateway could do edge analytics, but adds FW complexity for marginal "
-     "latency gain -- dashboard refreshes every 30s anyway. Cloud processing keeps FW simple and allows "
-     "algorithm updates without OTA.",
-     "Requires reliable Ethernet. Alert latency is cloud-round-trip (~1-5s). "
-     "Acceptable for HVAC decisions (minutes-scale).",
-     ACCENT_PURPLE),
-]
-
-for i, (title, choice, rationale, consequences, color) in enumerate(decisions):
-    y = Inches(1.5) + Inches(1.8) * i
-    add_shape(slide, Inches(0.8), y, Inches(11.7), Inches(1.6), CARD_BG)
-    add_shape(slide, Inches(0.8), y, Inches(0.1), Inches(1.6), color)
-
-    circle_num(slide, Inches(1.1), y + Inches(0.15), i + 1, color)
-
-    t = tb(slide, Inches(1.7), y + Inches(0.1), Inches(4.0), Inches(0.3))
+decision_colors = [ACCENT_TEAL, ACCENT_ORANGE, ACCENT_PURPLE, ACCENT_BLUE]
+decisions = []
+for i, d in enumerate(model.decisions):
+    # "B — BLE + gateway" -> "CHOSEN: BLE + GATEWAY"
+    choice = re.sub(r"^\(?[A-Z]\)?\s*(—|-)?\s*", "", d.chosen)
+    choice = re.sub(r"(\d)X\b", r"\1x", choice.upper())   # "2x AA" stays "2x"
+    decisions.append((d.title, f"CHOSEN: {choice}", d.rationale, d.consequences,
+                      decision_colors[i % len(decision_colors)]))
+
+# Card height follows the longer of the rationale and consequences columns
+heights = [max(Inches(1.6).pt,
+               Inches(0.6).pt + max(text_height(rationale, 11, Inches(5.0).pt - 14.4),
+                                    text_height(consequences, 10, Inches(5.2).pt - 14.4) + 16))
+           for _, _, rationale, consequences, _ in decisions]
+
+more = partial(paginate.continuation_slide, prs, "Key Technical Decisions", ACCENT_PURPLE, DARK_BG)
+for s, i, y in paginate.paged(slide, heights, Inches(1.5), Inches(7.2), Inches(0.2), more):
+    title, choice, rationale, consequences, color = decisions[i]
+    h = Pt(heights[i])
+    add_shape(s, Inches(0.8), y, Inches(11.7), h, CARD_BG)
+    add_shape(s, Inches(0.8), y, Inches(0.1), h, color)
+
+    circle_num(s, Inches(1.1), y + Inches(0.15), i + 1, color)
+
+    t = tb(s, Inches(1.7), y + Inches(0.1), Inches(4.0), Inches(0.3))
     set_text(t.text_frame, title, size=16, color=WHITE, bold=True)
 
-    t = tb(slide, Inches(6.0), y + Inches(0.1), Inches(3.0), Inches(0.3))
+    t = tb(s, Inches(6.0), y + Inches(0.1), Inches(6.3), Inches(0.3))
     set_text(t.text_frame, choice, size=12, color=color, bold=True)
 
-    t = tb(slide, Inches(1.7), y + Inches(0.5), Inches(5.0), Inches(0.8))
+    t = tb(s, Inches(1.7), y + Inches(0.5), Inches(5.0), h - Inches(0.6))
     set_text(t.text_frame, rationale, size=11, color=SOFT_WHITE)
 
-    t = tb(slide, Inches(7.0), y + Inches(0.5), Inches(5.2), Inches(0.8))
+    t = tb(s, Inches(7.0), y + Inches(0.5), Inches(5.2), h - Inches(0.6))
     tf = t.text_frame
     set_text(tf, "Consequences:", size=10, color=ACCENT_ORANGE, bold=True)
     add_p(tf, consequences, size=10, color=LIGHT_GRAY, before=Pt(2))
@@ -16,6 +16,8 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
+from image_fit import add_picture
+
 _DIR = os.path.dirname(os.path.abspath(__file__))
 
 # -- Theme --
@@ -99,7 +101,7 @@ txt(sl, Inches(0.8), Inches(0.85), Inches(11), Inches(0.3),
 # System overview concept art — left half
 overview_img = os.path.join(_DIR, "System_Overview.png")
 if os.path.exists(overview_img):
-    sl.shapes.add_picture(overview_img, Inches(0.8), Inches(1.5), Inches(5.5), Inches(5.5))
+    add_picture(sl, overview_img, Inches(0.8), Inches(1.5), Inches(5.5), Inches(5.5))
 
 # "What It Is" card — right half
 box(sl, Inches(6.8), Inches(1.5), Inches(5.7), Inches(2.4), CARD)
@@ -152,19 +154,20 @@ txt(sl, Inches(0.8), Inches(0.35), Inches(11), Inches(0.6),
     "System Architecture", 32, WHITE, True)
 
 # Block diagram — top
-img_path = os.path.join(_DIR, "AirSense_Block_Diagram.png")
+# Written by block_diagram.py next to its spec
+img_path = os.path.join(_DIR, "..", "examples", "smart_sensor_hub", "AirSense_Block_Diagram.png")
 if os.path.exists(img_path):
-    sl.shapes.add_picture(img_path, Inches(0.8), Inches(1.2), Inches(8.0), Inches(3.9))
+    add_picture(sl, img_path, Inches(0.8), Inches(1.2), Inches(8.0), Inches(3.9))
 
 # Sensor node cross-section — right
 node_img = os.path.join(_DIR, "Cross-Section — Sensor Node.png")
 if os.path.exists(node_img):
-    sl.shapes.add_picture(node_img, Inches(9.2), Inches(1.2), Inches(3.5), Inches(3.5))
+    add_picture(sl, node_img, Inches(9.2), Inches(1.2), Inches(3.5), Inches(3.5))
 
 # Gateway cross-section — bottom right
 gw_img = os.path.join(_DIR, "Cross-Section — Gateway.png")
 if os.path.exists(gw_img):
-    sl.shapes.add_picture(gw_img, Inches(9.2), Inches(4.9), Inches(3.5), Inches(2.2))
+    add_picture(sl, gw_img, Inches(9.2), Inches(4.9), Inches(3.5), Inches(2.2))
 
 # Labels for cross-sections
 box(sl, Inches(9.2), Inches(4.6), Inches(3.5), Inches(0.3), CARD)
@@ -0,0 +1,208 @@
+"""Clearance and interference checks for component arrangements.
+
+The arrangement scripts place boxes for the battery, PCBA, motor, fan and duct
+by hand; component_arrangement.md states the clearances they must keep. This
+checks one against the other:
+
+    shapes = [outline("protrusion", trapezoid), rect("battery", x, y, w, h),
+              rect("fan", ...), circle("shaft", cx, cy, r)]
+    rules = {("fan", "protrusion"): 1.0, ("duct", "protrusion"): 10.0}
+    for v in check(shapes, rules):
+        print(v.a, v.b, v.gap, v.required)
+    highlight(ax, violations)
+
+Shapes are polygons. rect / circle / polygon are solid: two solids whose
+interiors meet interfere whatever the rule. outline is a container wall (the
+enclosure, a protrusion): parts inside it are measured to its edges and only
+interfere when they cross one. Shapes sharing a group are parts of one
+component and are not checked against each other.
+
+Rules map a pair of names or groups to a minimum gap; ("fan", "*") applies to
+the fan and anything, None skips a pair, and `default` covers the rest (0:
+touching is fine, overlapping is not). Candidate pairs come from a uniform
+grid over the shapes' bounding boxes grown by the largest rule, so a check
+costs about one exact distance per neighbouring pair: thousands of shapes
+check in well under a second, fast enough to run inside a sweep.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from spatial import GridIndex
+
+Shape = namedtuple("Shape", "name points solid group")
+Violation = namedtuple("Violation", "a b gap required overlap p q")
+
+EPS = 1e-9             # mm; gaps, crossings and containment within this count as touching
+
+
+def polygon(name, points, group=None):
+    return Shape(name, np.asarray(points, dtype=float).reshape(-1, 2), True, group or name)
+
+
+def rect(name, x, y, w, h, group=None):
+    return polygon(name, [(x, y), (x + w, y), (x + w, y + h), (x, y + h)], group)
+
+
+def circle(name, cx, cy, r, group=None, n=32):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return polygon(name, np.column_stack([cx + r * np.cos(t), cy + r * np.sin(t)]), group)
+
+
+def outline(name, points, group=None):
+    return Shape(name, np.asarray(points, dtype=float).reshape(-1, 2), False, group or name)
+
+
+def bbox(shape):
+    (x0, y0), (x1, y1) = shape.points.min(axis=0), shape.points.max(axis=0)
+    return x0, y0, x1, y1
+
+
+# ================================================================
+# Geometry (shared with kinematics.py)
+# ================================================================
+
+def segments(shape):
+    """Edges of a shape as start and end points (n, 2) each, the last edge closing the loop."""
+    p = shape.points
+    return p, np.roll(p, -1, axis=0)
+
+
+def point_segment(p, a, b):
+    """Distance and closest point from points p (n, 2) to segments a-b (m, 2), as (n, m)."""
+    ab = b - a
+    denom = np.maximum((ab ** 2).sum(axis=1), EPS)
+    t = np.clip(((p[:, None, :] - a[None]) * ab[None]).sum(axis=2) / denom, 0, 1)
+    closest = a[None] + t[..., None] * ab[None]
+    return np.linalg.norm(p[:, None, :] - closest, axis=2), closest
+
+
+def _cross(o, a, b):
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+
+
+def crossing(a0, a1, b0, b1):
+    """(n, m) mask of segment pairs that properly cross (touching does not count)."""
+    A0, A1 = a0[:, None], a1[:, None]
+    B0, B1 = b0[None], b1[None]
+    d1, d2 = _cross(B0, B1, A0), _cross(B0, B1, A1)
+    d3, d4 = _cross(A0, A1, B0), _cross(A0, A1, B1)
+    return (d1 * d2 < -EPS) & (d3 * d4 < -EPS)
+
+
+def probes(points):
+    """Vertices and edge midpoints of polygons (..., n, 2), as points for inside().
+
+    Midpoints are needed because aligned boxes can overlap with no vertex
+    strictly inside the other.
+    """
+    return np.concatenate([points, (points + np.roll(points, -1, axis=-2)) / 2], axis=-2)
+
+
+def inside(points, shape):
+    """Mask of points strictly inside a polygon (even-odd rule)."""
+    a, b = segments(shape)
+    x, y = points[:, 0:1], points[:, 1:2]
+    straddle = (a[None, :, 1] > y) != (b[None, :, 1] > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xs = a[None, :, 0] + (y - a[None, :, 1]) * (b[None, :, 0] - a[None, :, 0]) / (b[None, :, 1] - a[None, :, 1])
+    odd = (straddle & (x < xs - EPS)).sum(axis=1) % 2 == 1
+    edge, _ = point_segment(points, a, b)
+    return odd & (edge.min(axis=1) > EPS)
+
+
+def distance(s, t):
+    """(gap, overlap, p, q): closest boundary distance, whether the two interfere, closest points."""
+    a0, a1 = segments(s)
+    b0, b1 = segments(t)
+    d_ab, c_ab = point_segment(s.points, b0, b1)
+    d_ba, c_ba = point_segment(t.points, a0, a1)
+    i, j = np.unravel_index(d_ab.argmin(), d_ab.shape)
+    k, m = np.unravel_index(d_ba.argmin(), d_ba.shape)
+    if d_ab[i, j] <= d_ba[k, m]:
+        gap, p, q = d_ab[i, j], s.points[i], c_ab[i, j]
+    else:
+        gap, p, q = d_ba[k, m], c_ba[k, m], t.points[k]
+    crossed = crossing(a0, a1, b0, b1).any()
+    overlap = bool(crossed
+                   or (t.solid and inside(probes(s.points), t).any())
+                   or (s.solid and inside(probes(t.points), s).any()))
+    if crossed:
+        gap = 0.0
+    return float(gap), overlap, tuple(map(float, p)), tuple(map(float, q))
+
+
+# ================================================================
+# Checking
+# ================================================================
+
+def _rule(rules, s, t, default):
+    for a in (s.name, s.group, "*"):
+        for b in (t.name, t.group, "*"):
+            for key in ((a, b), (b, a)):
+                if key in rules:
+                    return rules[key]
+    return default
+
+
+def pairs(shapes, reach=0.0, cell=None):
+    """Candidate (i, j) pairs whose bounding boxes come within `reach` of each other."""
+    boxes = [bbox(s) for s in shapes]
+    if cell is None:
+        sizes = [max(b[2] - b[0], b[3] - b[1]) for b in boxes]
+        cell = max(float(np.median(sizes)) if sizes else 1.0, reach, EPS)
+    index = GridIndex(cell)
+    for b in boxes:
+        index.insert((b[0] - reach, b[1] - reach, b[2] + reach, b[3] + reach))
+    for i, b in enumerate(boxes):
+        for j in index.query(b):
+            if j > i:
+                r = index.rects[j]
+                if r[0] <= b[2] and b[0] <= r[2] and r[1] <= b[3] and b[1] <= r[3]:
+                    yield i, j
+
+
+def check(shapes, rules=None, default=0.0):
+    """Violations of the clearance rules, tightest first."""
+    rules = rules or {}
+    reach = max([default] + [g for g in rules.values() if g is not None])
+    out = []
+    for i, j in pairs(shapes, reach):
+        s, t = shapes[i], shapes[j]
+        if s.group == t.group:
+            continue
+        required = _rule(rules, s, t, default)
+        if required is None:
+            continue
+        gap, overlap, p, q = distance(s, t)
+        if overlap or gap < required - EPS:
+            out.append(Violation(s.name, t.name, 0.0 if overlap else gap, required, overlap, p, q))
+    return sorted(out, key=lambda v: (not v.overlap, v.gap - v.required))
+
+
+def report(violations, unit=1.0, suffix=""):
+    """One line per violation, gaps scaled by `unit` (e.g. 12 for 1 unit = 12 mm)."""
+    lines = []
+    for v in violations:
+        if v.overlap:
+            lines.append(f"{v.a} / {v.b}: interfere (need {v.required * unit:.0f}{suffix})")
+        else:
+            lines.append(f"{v.a} / {v.b}: {v.gap * unit:.1f}{suffix} < {v.required * unit:.0f}{suffix}")
+    return lines
+
+
+def highlight(ax, violations, unit=1.0, suffix="", color="#e74c3c", shapes=()):
+    """Mark violations on an axes: offending shapes outlined, closest points joined and labelled."""
+    named = {s.name: s for s in shapes}
+    for v, text in zip(violations, report(violations, unit, suffix)):
+        for name in (v.a, v.b):
+            if name in named:
+                pts = named[name].points
+                ax.fill(pts[:, 0], pts[:, 1], facecolor="none", edgecolor=color,
+                        linewidth=1.6, linestyle="--", zorder=8)
+        (x1, y1), (x2, y2) = v.p, v.q
+        ax.plot([x1, x2], [y1, y2], color=color, linewidth=1.2, zorder=9)
+        ax.plot([x1, x2], [y1, y2], "o", color=color, markersize=3, zorder=9)
+        ax.text((x1 + x2) / 2, (y1 + y2) / 2, text.split(": ", 1)[1], color=color, fontsize=5.5,
+                fontweight="bold", ha="left", va="bottom", zorder=9)
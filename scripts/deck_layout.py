@@ -0,0 +1,184 @@
+"""Declarative grid/flex layout for deck slides.
+
+Slides are described as a tree of rows, columns, grids and text leaves instead
+of hand-computed Inches(...) offsets. The solver measures text with the cached
+metrics in text_metrics, sizes cards to their content, and returns one Box per
+keyed node in EMU, ready to pass straight to add_shape / add_textbox:
+
+    cards = [card("zone0", [text("zone0.title", "Static Balance", 24, bold=True),
+                            text("zone0.desc", desc, 15)])]
+    boxes = layout(row(cards, gap=Inches(0.5)), Inches(0.8), Inches(1.9), Inches(11.7))
+    add_shape(slide, *boxes["zone0"], CARD_BG)
+
+Nodes are plain tuples, so a node's hash is its content hash. Solved geometry
+is memoized on (node, width): re-laying out an unchanged card is a dict lookup,
+and editing one card only re-solves that card and its ancestors.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from text_metrics import LINE_SPACING, text_height
+
+EMU_PER_PT = 12700
+EMU_PER_INCH = 914400
+
+# python-pptx text frame insets (0.1" left/right, 0.05" top/bottom).
+INSET_X = 91440
+INSET_Y = 45720
+
+# Default card padding: 0.25" sides, 0.2" top/bottom.
+CARD_PAD = (228600, 182880)
+
+Box = namedtuple("Box", "left top width height")
+
+
+def _pad(pad):
+    """Normalize padding to (left, top, right, bottom) EMU."""
+    if isinstance(pad, (tuple, list)):
+        if len(pad) == 2:
+            return (int(pad[0]), int(pad[1]), int(pad[0]), int(pad[1]))
+        return tuple(int(p) for p in pad)
+    return (int(pad),) * 4
+
+
+# ================================================================
+# Node constructors
+# ================================================================
+
+def text(key, content, size, bold=False, font="Calibri", spacing=LINE_SPACING, min_height=0):
+    """Text leaf. Height is the wrapped text plus the text frame insets."""
+    return ("text", key, content, float(size), bool(bold), font, float(spacing), int(min_height))
+
+
+def fixed(key, height):
+    """Leaf with a fixed height (spacers, accent strips, images)."""
+    return ("fixed", key, int(height))
+
+
+def column(children, gap=0, pad=0, min_height=0, key=None):
+    """Stack children top to bottom."""
+    return ("column", key, tuple(children), int(gap), _pad(pad), int(min_height))
+
+
+def card(key, children, pad=CARD_PAD, gap=0, min_height=0):
+    """A padded column whose box is meant to be drawn as a background shape."""
+    return column(children, gap=gap, pad=pad, min_height=min_height, key=key)
+
+
+def row(children, gap=0, weights=None, stretch=True, key=None):
+    """Place children side by side. Widths follow weights (equal by default).
+
+    With stretch, every child box is as tall as the tallest child, which keeps
+    a row of cards flush at the bottom however much text each one holds.
+    """
+    weights = tuple(float(w) for w in weights) if weights else None
+    return ("row", key, tuple(children), int(gap), weights, bool(stretch))
+
+
+def grid(children, cols, gutter=0, row_gap=None, equal_rows=False, key=None):
+    """Flow children into rows of `cols` equal-width cells."""
+    children = tuple(children)
+    rows = []
+    for i in range(0, len(children), cols):
+        cells = children[i:i + cols]
+        cells += (fixed(None, 0),) * (cols - len(cells))
+        rows.append(row(cells, gap=gutter))
+    gap = gutter if row_gap is None else row_gap
+    return ("grid", key, tuple(rows), int(gap), bool(equal_rows))
+
+
+# ================================================================
+# Solver
+# ================================================================
+
+def _split(total, gap, count, weights=None):
+    """Split a width into `count` spans separated by `gap`. Returns (offset, width) pairs."""
+    avail = max(0, total - gap * (count - 1))
+    weights = weights or (1.0,) * count
+    wsum = sum(weights)
+    spans, acc, x = [], 0.0, 0
+    for w in weights:
+        start = round(avail * acc / wsum)
+        acc += w
+        end = round(avail * acc / wsum)
+        spans.append((x + start, end - start))
+        x += gap
+    return spans
+
+
+@lru_cache(maxsize=8192)
+def measure(node, width):
+    """Natural height of a node laid out at the given width (EMU)."""
+    kind = node[0]
+    if kind == "text":
+        _, _, content, size, bold, font, spacing, min_h = node
+        inner_pt = max(1, width - 2 * INSET_X) / EMU_PER_PT
+        h = text_height(content, size, inner_pt, bold, font, spacing) * EMU_PER_PT
+        return max(min_h, int(round(h)) + 2 * INSET_Y)
+    if kind == "fixed":
+        return node[2]
+    if kind == "column":
+        _, _, children, gap, (pl, pt, pr, pb), min_h = node
+        inner = width - pl - pr
+        h = sum(measure(c, inner) for c in children) + gap * max(0, len(children) - 1)
+        return max(min_h, h + pt + pb)
+    if kind == "row":
+        _, _, children, gap, weights, _ = node
+        spans = _split(width, gap, len(children), weights)
+        return max((measure(c, w) for c, (_, w) in zip(children, spans)), default=0)
+    if kind == "grid":
+        _, _, rows, gap, equal = node
+        heights = [measure(r, width) for r in rows]
+        if equal and heights:
+            heights = [max(heights)] * len(heights)
+        return sum(heights) + gap * max(0, len(rows) - 1)
+    raise ValueError(f"Unknown layout node: {kind!r}")
+
+
+@lru_cache(maxsize=8192)
+def _place(node, width, height):
+    """Relative placements (key, dx, dy, w, h) for a node given its final size."""
+    kind = node[0]
+    key = node[1]
+    out = [(key, 0, 0, width, height)] if key is not None else []
+    if kind == "column":
+        _, _, children, gap, (pl, pt, pr, _), _ = node
+        inner = width - pl - pr
+        y = pt
+        for c in children:
+            ch = measure(c, inner)
+            out.extend((k, pl + dx, y + dy, w, h) for k, dx, dy, w, h in _place(c, inner, ch))
+            y += ch + gap
+    elif kind == "row":
+        _, _, children, gap, weights, stretch = node
+        for c, (x, w) in zip(children, _split(width, gap, len(children), weights)):
+            ch = height if stretch else measure(c, w)
+            out.extend((k, x + dx, dy, cw, h) for k, dx, dy, cw, h in _place(c, w, ch))
+    elif kind == "grid":
+        _, _, rows, gap, equal = node
+        heights = [measure(r, width) for r in rows]
+        if equal and heights:
+            heights = [max(heights)] * len(heights)
+        y = 0
+        for r, rh in zip(rows, heights):
+            out.extend((k, dx, y + dy, w, h) for k, dx, dy, w, h in _place(r, width, rh))
+            y += rh + gap
+    return tuple(out)
+
+
+def layout(node, left, top, width, height=None):
+    """Solve a layout tree. Returns {key: Box} in absolute EMU."""
+    width = int(width)
+    height = measure(node, width) if height is None else int(height)
+    boxes = {}
+    for key, dx, dy, w, h in _place(node, width, height):
+        if key in boxes:
+            raise ValueError(f"Duplicate layout key: {key!r}")
+        boxes[key] = Box(int(left) + dx, int(top) + dy, w, h)
+    return boxes
+
+
+def cache_info():
+    """Hit/miss counters for the measure and placement caches."""
+    return {"measure": measure.cache_info(), "place": _place.cache_info()}
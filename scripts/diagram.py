@@ -0,0 +1,520 @@
+"""Block diagram engine: a JSON / YAML spec in, a rendered matplotlib figure out.
+
+A spec is data entry. Groups (dashed tier outlines), blocks with sublabels,
+typed edges with protocol labels, free notes and lines, a legend and a title:
+
+    {
+      "theme": "card",
+      "canvas": {"width": 16, "height": 9, "background": "#0F172A"},
+      "palette": {"teal": "#00BFA5", "gray": "#8899AA"},
+      "groups": [{"id": "device", "label": "SENSOR NODE", "box": [0.3, 0.5, 5.4, 8.0], "color": "teal"}],
+      "blocks": [{"id": "scd41", "label": "SCD41", "sublabel": "CO2 + Temp + RH",
+                  "box": [0.7, 6.6, 2.2, 1.4], "color": "teal"}],
+      "edges":  [{"from": "scd41", "to": "mcu", "label": "I2C", "color": "teal"}],
+      "output": {"file": "Block_Diagram.png", "dpi": 200}
+    }
+
+With "layout": "layered" (or a dict of layered.DEFAULTS overrides) blocks and
+groups may omit "box" and are placed automatically; see layered.py.
+
+Edges between block ids are anchored on the facing sides of the two blocks;
+"points": [[x1, y1], [x2, y2]] pins them instead. With "routing": "orthogonal"
+(or a dict of router.DEFAULTS overrides) unpinned edges are routed around the
+blocks as right-angle polylines and their labels placed in free space; see
+router.py. "route": false on an edge keeps it straight. Colours are palette names or
+hex strings. "kind" picks a colour / line style from the spec's edge_kinds.
+"labels": true (or a dict of labels.resolve_texts options) moves edge labels
+that overlap a block or other text to the nearest free spot once the figure
+is laid out, in place of hand-tuned "label_offset"s; see labels.py.
+
+load_spec() caches the parsed file by content hash and compile_spec() caches
+the resolved geometry by spec hash, so rendering the same diagram twice in a
+build only draws. YAML specs need PyYAML; JSON needs nothing extra.
+
+export() writes several formats from one drawn figure: "output": {"formats":
+["png", "svg", "pdf"], "dpis": [200, 400]} gives Block_Diagram.png at the
+first dpi, Block_Diagram_400dpi.png, .svg and .pdf. Each file is cached in
+.diagram_cache/ under the spec hash, so an unchanged diagram is copied, not
+redrawn; -j N spreads cache misses over N worker processes. Files drawn by an
+earlier version of the engine are removed on the next export.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import shutil
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# matplotlib (and NumPy, through layered / router / labels) is imported where a
+# spec first needs it: loading, hashing and copying a cached file never draw,
+# so a build whose outputs are all cached starts without either.
+import mpl_runtime
+
+# ================================================================
+# Themes
+# ================================================================
+
+# "card": dark card with a coloured border and title strip (AirSense).
+# "filled": block filled with its colour, label and italic sublabel centred (Bubbler).
+THEMES = {
+    "card": {
+        "block_pad": 0.12, "block_lw": 1.8, "block_fill": "#18223A", "strip": True,
+        "label_color": "#FFFFFF", "label_size": 10, "label_dy": None,
+        "sublabel_color": "#C8D0E0", "sublabel_size": 7.5, "sublabel_dy": -0.1,
+        "sublabel_italic": False, "sublabel_linespacing": 1.5,
+        "edge_lw": 1.5, "edge_mutation": 10, "edge_color": "#8899AA", "edge_zorder": 3,
+        "edge_label_size": 7, "edge_label_italic": True, "edge_label_box": True,
+        "edge_label_offset": [0, 0.15], "edge_label_va": "center", "edge_label_color": None,
+        "group_pad": 0.2, "group_lw": 1.5, "group_alpha": 0.5, "group_label_size": 11,
+    },
+    "filled": {
+        "block_pad": 0.08, "block_lw": 1.5, "block_fill": None, "strip": False,
+        "block_border": "#555577",
+        "label_color": "#E8E8E8", "label_size": 9, "label_dy": 0.12,
+        "sublabel_color": "#AAAACC", "sublabel_size": 6.5, "sublabel_dy": -0.18,
+        "sublabel_italic": True, "sublabel_linespacing": None,
+        "edge_lw": 1.5, "edge_mutation": 12, "edge_color": "#AAAACC", "edge_zorder": 1,
+        "edge_label_size": 6, "edge_label_italic": False, "edge_label_box": False,
+        "edge_label_offset": [0, 0.18], "edge_label_va": "bottom", "edge_label_color": None,
+        "group_pad": 0.2, "group_lw": 1.5, "group_alpha": 0.5, "group_label_size": 11,
+    },
+}
+
+Group = namedtuple("Group", "id label x y w h color")
+Block = namedtuple("Block", "id label sublabel x y w h color fill border size sublabel_size")
+Edge = namedtuple("Edge", "x1 y1 x2 y2 label color style lw curve lx ly path")
+Note = namedtuple("Note", "text x y color size bold italic ha va")
+Line = namedtuple("Line", "xs ys color lw style")
+LegendItem = namedtuple("LegendItem", "kind x y color label text_color")
+Diagram = namedtuple("Diagram", "theme width height background title subtitle "
+                                "groups blocks edges notes lines legend labels output digest")
+
+_SPECS = {}
+_COMPILED = {}
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(_DIR, ".diagram_cache")
+VECTOR = ("svg", "pdf", "eps")
+
+
+# ================================================================
+# Loading
+# ================================================================
+
+def load_spec(path):
+    """Parse a .json / .yaml / .yml spec, cached by file content hash."""
+    with open(path, "rb") as f:
+        data = f.read()
+    key = hashlib.sha1(data).hexdigest()
+    if key not in _SPECS:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML diagram specs need PyYAML: pip install pyyaml") from None
+            spec = yaml.safe_load(data)
+        else:
+            spec = json.loads(data)
+        spec.setdefault("_dir", os.path.dirname(os.path.abspath(path)))
+        _SPECS[key] = spec
+    return copy.deepcopy(_SPECS[key])
+
+
+def spec_hash(spec):
+    """Stable hash of a spec dict (key order does not matter)."""
+    return hashlib.sha1(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# ================================================================
+# Compilation: spec dict -> resolved geometry
+# ================================================================
+
+def _anchor(box, toward):
+    """Midpoint of the side of box (x, y, w, h) that faces point `toward`."""
+    x, y, w, h = box
+    cx, cy = x + w / 2, y + h / 2
+    dx, dy = toward[0] - cx, toward[1] - cy
+    if abs(dx) * h >= abs(dy) * w:
+        return (x + w, cy) if dx > 0 else (x, cy)
+    return (cx, y + h) if dy > 0 else (cx, y)
+
+
+def _center(box):
+    return box[0] + box[2] / 2, box[1] + box[3] / 2
+
+
+def compile_spec(spec):
+    """Resolve colours, themes, anchors and label positions. Cached by spec hash."""
+    digest = spec_hash(spec)
+    if digest in _COMPILED:
+        return _COMPILED[digest]
+    if spec.get("layout"):
+        import layered
+        spec = layered.apply(spec)
+
+    theme = dict(THEMES[spec.get("theme", "card")])
+    theme.update(spec.get("theme_overrides", {}))
+    palette = spec.get("palette", {})
+    kinds = spec.get("edge_kinds", {})
+
+    def color(c, default=None):
+        if c is None:
+            return default
+        return palette.get(c, c)
+
+    canvas = spec.get("canvas", {})
+    boxes = {}
+
+    groups = []
+    for g in spec.get("groups", []):
+        x, y, w, h = g["box"]
+        groups.append(Group(g.get("id"), g.get("label", ""), x, y, w, h, color(g.get("color"))))
+        if g.get("id"):
+            boxes[g["id"]] = (x, y, w, h)
+
+    blocks = []
+    for b in spec.get("blocks", []):
+        x, y, w, h = b["box"]
+        c = color(b.get("color"), theme["edge_color"])
+        fill = color(b.get("fill"), theme["block_fill"] or c)
+        border = color(b.get("border"), c if theme["strip"] else theme.get("block_border"))
+        blocks.append(Block(b["id"], b["label"], b.get("sublabel"), x, y, w, h, c, fill, border,
+                            b.get("size", theme["label_size"]),
+                            b.get("sublabel_size", theme["sublabel_size"])))
+        boxes[b["id"]] = (x, y, w, h)
+
+    spec_edges = spec.get("edges", [])
+    paths, labels_at = [None] * len(spec_edges), [None] * len(spec_edges)
+    routing = spec.get("routing")
+    if routing:
+        import router
+        todo = [k for k, e in enumerate(spec_edges) if "points" not in e and e.get("route", True)]
+        block_boxes = {b.id: (b.x, b.y, b.w, b.h) for b in blocks}
+        routes = router.route(block_boxes, [(spec_edges[k]["from"], spec_edges[k]["to"]) for k in todo],
+                              canvas.get("width", 16), canvas.get("height", 9), theme["block_pad"],
+                              routing if isinstance(routing, dict) else None)
+        at = router.place_labels(routes, [(spec_edges[k].get("label", ""), theme["edge_label_size"])
+                                          for k in todo],
+                                 block_boxes, theme["block_pad"], theme["edge_label_va"])
+        for k, path, xy in zip(todo, routes, at):
+            paths[k], labels_at[k] = path, xy
+
+    edges = []
+    for e, path, xy in zip(spec_edges, paths, labels_at):
+        kind = kinds.get(e.get("kind"), {})
+        if path:
+            (x1, y1), (x2, y2) = path[0], path[-1]
+        elif "points" in e:
+            (x1, y1), (x2, y2) = e["points"]
+        else:
+            a, b = boxes[e["from"]], boxes[e["to"]]
+            x1, y1 = _anchor(a, _center(b))
+            x2, y2 = _anchor(b, _center(a))
+        c = color(e.get("color", kind.get("color")), theme["edge_color"])
+        if xy:
+            off = e.get("label_offset", [0, 0])
+            lx, ly = xy[0] + off[0], xy[1] + off[1]
+        else:
+            off = e.get("label_offset", theme["edge_label_offset"])
+            lx, ly = (x1 + x2) / 2 + off[0], (y1 + y2) / 2 + off[1]
+        edges.append(Edge(x1, y1, x2, y2, e.get("label", ""), c,
+                          e.get("style", kind.get("style", "-|>")),
+                          e.get("lw", kind.get("lw", theme["edge_lw"])),
+                          e.get("curve", 0), lx, ly, path))
+
+    notes = [Note(n["text"], n["at"][0], n["at"][1], color(n.get("color"), theme["label_color"]),
+                  n.get("size", 7), n.get("bold", False), n.get("italic", False),
+                  n.get("ha", "left"), n.get("va", "baseline"))
+             for n in spec.get("notes", [])]
+
+    lines = [Line(tuple(p[0] for p in ln["points"]), tuple(p[1] for p in ln["points"]),
+                  color(ln.get("color"), theme["edge_color"]), ln.get("lw", 1), ln.get("style", "-"))
+             for ln in spec.get("lines", [])]
+
+    legend = []
+    lg = spec.get("legend")
+    if lg:
+        x0, y0 = lg.get("at", [0.5, 0.15])
+        for i, (c, label) in enumerate(lg["items"]):
+            c = color(c)
+            text_color = c if lg.get("kind") == "line" else color(lg.get("text_color"), theme["edge_color"])
+            legend.append(LegendItem(lg.get("kind", "swatch"), x0 + i * lg.get("step", 1.7), y0,
+                                     c, label, text_color))
+
+    def text_spec(t, default_size, default_color):
+        if not t:
+            return None
+        if isinstance(t, str):
+            t = {"text": t}
+        at = t.get("at", [canvas.get("width", 16) / 2, canvas.get("height", 9) - 0.3])
+        return Note(t["text"], at[0], at[1], color(t.get("color"), default_color),
+                    t.get("size", default_size), t.get("bold", True), False, "center", "center")
+
+    out = spec.get("output", {})
+    if isinstance(out, str):
+        out = {"file": out}
+    diagram = Diagram(
+        theme=theme,
+        width=canvas.get("width", 16), height=canvas.get("height", 9),
+        background=color(canvas.get("background"), "#0F172A"),
+        title=text_spec(spec.get("title"), 18, theme["label_color"]),
+        subtitle=text_spec(spec.get("subtitle"), 9, theme["sublabel_color"]),
+        groups=tuple(groups), blocks=tuple(blocks), edges=tuple(edges),
+        notes=tuple(notes), lines=tuple(lines), legend=tuple(legend),
+        labels=spec.get("labels"), output=out, digest=digest,
+    )
+    _COMPILED[digest] = diagram
+    return diagram
+
+
+# ================================================================
+# Rendering
+# ================================================================
+
+def _draw_group(ax, batch, d, g):
+    from primitives import box
+    t = d.theme
+    batch.add(box(g.x, g.y, g.w, g.h, boxstyle=f"round,pad={t['group_pad']}",
+                  facecolor="none", edgecolor=g.color,
+                  linewidth=t["group_lw"], linestyle="--", alpha=t["group_alpha"]))
+    if g.label:
+        ax.text(g.x + 0.25, g.y + g.h - 0.2, g.label,
+                fontsize=t["group_label_size"], fontweight="bold", color=g.color,
+                family="sans-serif", alpha=0.8)
+
+
+def _draw_block(ax, batch, d, b):
+    from primitives import box
+    t = d.theme
+    batch.add(box(b.x, b.y, b.w, b.h, boxstyle=f"round,pad={t['block_pad']}",
+                  facecolor=b.fill, edgecolor=b.border, linewidth=t["block_lw"]))
+    cx = b.x + b.w / 2
+    if t["strip"]:
+        batch.add(box(b.x + 0.05, b.y + b.h - 0.22, b.w - 0.1, 0.18,
+                      boxstyle="round,pad=0.04",
+                      facecolor=b.color, edgecolor="none", alpha=0.9))
+        label_y = b.y + b.h - 0.13
+    else:
+        label_y = b.y + b.h / 2 + t["label_dy"]
+    ax.text(cx, label_y, b.label, ha="center", va="center", fontsize=b.size,
+            fontweight="bold", color=t["label_color"], family="sans-serif")
+    if b.sublabel:
+        ax.text(cx, b.y + b.h / 2 + t["sublabel_dy"], b.sublabel,
+                ha="center", va="center", fontsize=b.sublabel_size, color=t["sublabel_color"],
+                family="sans-serif", linespacing=t["sublabel_linespacing"],
+                fontstyle="italic" if t["sublabel_italic"] else "normal")
+
+
+def _draw_edge(ax, batch, d, e):
+    from matplotlib.patches import FancyArrowPatch
+    from matplotlib.path import Path
+    t = d.theme
+    if e.path:
+        batch.arrow(FancyArrowPatch(path=Path(e.path), arrowstyle=e.style, color=e.color, lw=e.lw,
+                                    mutation_scale=t["edge_mutation"], zorder=t["edge_zorder"]))
+    else:
+        batch.arrow(FancyArrowPatch((e.x1, e.y1), (e.x2, e.y2), arrowstyle=e.style, color=e.color,
+                                    lw=e.lw, connectionstyle=f"arc3,rad={e.curve}",
+                                    mutation_scale=t["edge_mutation"], zorder=t["edge_zorder"]))
+    if e.label:
+        box = (dict(boxstyle="round,pad=0.15", facecolor=d.background, edgecolor="none", alpha=0.85)
+               if t["edge_label_box"] else None)
+        ax.text(e.lx, e.ly, e.label, ha="center", va=t["edge_label_va"],
+                fontsize=t["edge_label_size"], color=t["edge_label_color"] or e.color,
+                family="sans-serif", fontstyle="italic" if t["edge_label_italic"] else "normal",
+                bbox=box, gid="edge-label")
+
+
+def _draw_note(ax, n):
+    ax.text(n.x, n.y, n.text, ha=n.ha, va=n.va, fontsize=n.size, color=n.color,
+            fontweight="bold" if n.bold else "normal",
+            fontstyle="italic" if n.italic else "normal", family="sans-serif")
+
+
+def place_labels(ax, diagram):
+    """Nudge edge labels off blocks and other text (spec "labels"); run after the final layout."""
+    import labels
+    opts = diagram.labels if isinstance(diagram.labels, dict) else {}
+    movable = [t for t in ax.texts if t.get_gid() == "edge-label"]
+    fixed = [t for t in ax.texts if t.get_gid() != "edge-label"]
+    pad = diagram.theme["block_pad"]
+    blocks = [ax.transData.transform([(b.x - pad, b.y - pad), (b.x + b.w + pad, b.y + b.h + pad)]).ravel()
+              for b in diagram.blocks]
+    return labels.resolve_texts(movable, fixed, blocks, **opts)
+
+
+def render(diagram, figsize=None):
+    """Draw a compiled diagram onto a new figure. Returns (fig, ax).
+
+    The figure sits on an Agg canvas of its own rather than in pyplot's figure
+    manager, so nothing needs closing and no GUI backend is ever imported.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from batch import Batch
+    from primitives import box
+
+    d = diagram
+    fig = Figure(figsize=figsize or (d.width, d.height))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    fig.set_facecolor(d.background)
+    ax.set_facecolor(d.background)
+    ax.set_xlim(0, d.width)
+    ax.set_ylim(0, d.height)
+    ax.axis("off")
+
+    for ln in d.lines:
+        ax.plot(ln.xs, ln.ys, color=ln.color, linewidth=ln.lw, linestyle=ln.style)
+    batch = Batch(ax)
+    for g in d.groups:
+        _draw_group(ax, batch, d, g)
+    for b in d.blocks:
+        _draw_block(ax, batch, d, b)
+    for e in d.edges:
+        _draw_edge(ax, batch, d, e)
+    for n in d.notes:
+        _draw_note(ax, n)
+    for t in (d.title, d.subtitle):
+        if t:
+            _draw_note(ax, t)
+
+    for item in d.legend:
+        if item.kind == "line":
+            ax.plot([item.x - 0.3, item.x + 0.3], [item.y, item.y], color=item.color, lw=2)
+            ax.text(item.x + 0.5, item.y, item.label, color=item.text_color, fontsize=7, va="center")
+        else:
+            batch.add(box(item.x, item.y, 0.2, 0.15, boxstyle="round,pad=0.02",
+                          facecolor=item.color, edgecolor="none"))
+            ax.text(item.x + 0.3, item.y + 0.07, item.label,
+                    fontsize=7, color=item.text_color, va="center", family="sans-serif")
+    batch.flush()
+    return fig, ax
+
+
+def _targets(diagram, path, formats, dpis):
+    """[(fmt, dpi, dest)] for export(). The first dpi gets the plain file name."""
+    out = diagram.output
+    path = path or out.get("file", "block_diagram.png")
+    stem, ext = os.path.splitext(path)
+    formats = formats or out.get("formats") or [ext.lstrip(".") or "png"]
+    dpis = dpis or out.get("dpis") or [out.get("dpi", 200)]
+    jobs = []
+    for fmt in formats:
+        if fmt in VECTOR:
+            jobs.append((fmt, dpis[0], f"{stem}.{fmt}"))
+        else:
+            jobs += [(fmt, dpi, f"{stem}.{fmt}" if k == 0 else f"{stem}_{dpi}dpi.{fmt}")
+                     for k, dpi in enumerate(dpis)]
+    return jobs
+
+
+@lru_cache(maxsize=1)
+def _engine_hash():
+    """Hash of the drawing code, so editing the renderer invalidates cached files."""
+    h = hashlib.sha1()
+    for name in ("diagram", "batch", "labels", "layered", "primitives", "router"):
+        with open(os.path.join(_DIR, name + ".py"), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:8]
+
+
+def _cached(diagram, fmt, dpi):
+    return os.path.join(CACHE_DIR, f"{diagram.digest[:20]}-{_engine_hash()}-{dpi}.{fmt}")
+
+
+def _prune():
+    """Remove cached files drawn by another version of the engine; they can never be hit again."""
+    current = _engine_hash()
+    for name in os.listdir(CACHE_DIR):
+        parts = name.split("-")
+        if len(parts) == 3 and parts[1] != current:
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except FileNotFoundError:   # a concurrent build pruned it first
+                pass
+
+
+def _write(diagram, jobs):
+    """Draw once, save every (fmt, dpi) into the cache."""
+    out = diagram.output
+    fig, _ = render(diagram)
+    if out.get("tight_layout"):
+        fig.tight_layout(pad=out["tight_layout"])
+    if diagram.labels:
+        place_labels(fig.axes[0], diagram)
+    for fmt, dpi in jobs:
+        # No timestamps in vector files, so identical diagrams give identical bytes.
+        meta = {"svg": {"Date": None}, "pdf": {"CreationDate": None}}.get(fmt)
+        fig.savefig(_cached(diagram, fmt, dpi), format=fmt, dpi=dpi, metadata=meta,
+                    facecolor=fig.get_facecolor(), bbox_inches=out.get("bbox", "tight"))
+
+
+def export(diagram, path=None, formats=None, dpis=None, workers=0):
+    """Write the diagram in several formats from one render. Returns the paths written.
+
+    formats / dpis default to the spec's output "formats" / "dpis" (or the
+    path's extension and output "dpi"). With workers > 1 the cache misses are
+    split across that many processes, each drawing the figure once.
+    """
+    jobs = _targets(diagram, path, formats, dpis)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _prune()
+    missing = sorted({(fmt, dpi) for fmt, dpi, _ in jobs
+                      if not os.path.exists(_cached(diagram, fmt, dpi))})
+    if workers > 1 and len(missing) > 1:
+        chunks = [missing[k::workers] for k in range(min(workers, len(missing)))]
+        with ProcessPoolExecutor(len(chunks)) as pool:
+            list(pool.map(_write, [diagram] * len(chunks), chunks))
+    elif missing:
+        _write(diagram, missing)
+    for fmt, dpi, dest in jobs:
+        shutil.copyfile(_cached(diagram, fmt, dpi), dest)
+    return [dest for _, _, dest in jobs]
+
+
+def save(diagram, path=None):
+    """Render and save one file using the spec's output settings. Returns the path written."""
+    path = path or diagram.output.get("file", "block_diagram.png")
+    fmt = os.path.splitext(path)[1].lstrip(".") or "png"
+    return export(diagram, path, [fmt], [diagram.output.get("dpi", 200)])[0]
+
+
+def build(spec_path, out_path=None, formats=None, dpis=None, workers=0):
+    """Load, compile and export a spec file. Relative output paths resolve next to the spec.
+
+    Returns the first path written (the primary PNG unless formats says otherwise).
+    """
+    spec = load_spec(spec_path)
+    base = spec.pop("_dir")
+    diagram = compile_spec(spec)
+    path = out_path or os.path.join(base, diagram.output.get("file", "block_diagram.png"))
+    return export(diagram, path, formats, dpis, workers)[0]
+
+
+def main():
+    mpl_runtime.use_font_cache()
+    parser = argparse.ArgumentParser(description="Render a block diagram spec (JSON or YAML).")
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", help="output image (default: the spec's output.file)")
+    parser.add_argument("-f", "--formats", help="comma-separated, e.g. png,svg,pdf")
+    parser.add_argument("--dpi", help="comma-separated raster dpis, e.g. 200,400")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="parallel render processes")
+    args = parser.parse_args()
+    spec = load_spec(args.spec)
+    base = spec.pop("_dir")
+    diagram = compile_spec(spec)
+    path = args.output or os.path.join(base, diagram.output.get("file", "block_diagram.png"))
+    formats = args.formats.split(",") if args.formats else None
+    dpis = [int(d) for d in args.dpi.split(",")] if args.dpi else None
+    for p in export(diagram, path, formats, dpis, args.workers):
+        print(f"Saved to {p}")
+
+
+if __name__ == "__main__":
+    main()
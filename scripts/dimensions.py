@@ -0,0 +1,146 @@
+"""Parametric dimension models: inputs and derived dimensions declared once.
+
+A rule's arguments name the dimensions it depends on. Setting an input marks
+only what depends on it stale. evaluate(**overrides) recomputes everything
+statelessly and accepts NumPy arrays, and view(scale) reads lengths in
+drawing units.
+
+    dims = Model()
+    dims.input("duct_diam", 40)
+    dims.input("duct_clearance", 10)
+
+    @dims.rule
+    def prot_top_w(duct_diam, duct_clearance):
+        return duct_diam + 2 * duct_clearance
+
+    dims["duct_diam"] = 45      # prot_top_w goes stale
+    dims["prot_top_w"]          # 65, recomputed on read
+"""
+
+import inspect
+from collections import defaultdict
+
+
+class Model:
+    def __init__(self):
+        self._inputs = {}
+        self._rules = {}       # name -> (fn, deps)
+        self._units = {}
+        self._users = defaultdict(set)
+        self._cache = {}
+
+    # ── Declaration ──
+
+    def input(self, name, value, unit="mm"):
+        """Declare an input dimension."""
+        self._inputs[name] = value
+        self._units[name] = unit
+        self._invalidate(name)
+        return value
+
+    def rule(self, fn=None, *, name=None, unit="mm"):
+        """Declare a derived dimension; usable as @model.rule or @model.rule(unit="deg")."""
+        def register(fn):
+            key = name or fn.__name__
+            deps = tuple(inspect.signature(fn).parameters)
+            self._rules[key] = (fn, deps)
+            self._units[key] = unit
+            for d in deps:
+                self._users[d].add(key)
+            self._invalidate(key)
+            return fn
+        return register(fn) if fn is not None else register
+
+    # ── Reading and editing ──
+
+    def __contains__(self, name):
+        return name in self._inputs or name in self._rules
+
+    def __getitem__(self, name):
+        if name in self._inputs:
+            return self._inputs[name]
+        if name not in self._cache:
+            self._cache[name] = self._compute(name, self.__getitem__, set())
+        return self._cache[name]
+
+    def __setitem__(self, name, value):
+        if name not in self._inputs:
+            raise KeyError(f"{name!r} is derived; set one of its inputs instead")
+        self._inputs[name] = value
+        self._invalidate(name)
+
+    def update(self, **values):
+        for name, value in values.items():
+            self[name] = value
+
+    def names(self):
+        return list(self._inputs) + list(self._rules)
+
+    def inputs(self):
+        return dict(self._inputs)
+
+    def unit(self, name):
+        return self._units[name]
+
+    def depends_on(self, name):
+        """Every dimension that changes when `name` does."""
+        out, stack = set(), [name]
+        while stack:
+            for user in self._users[stack.pop()]:
+                if user not in out:
+                    out.add(user)
+                    stack.append(user)
+        return out
+
+    def _invalidate(self, name):
+        self._cache.pop(name, None)
+        for user in self.depends_on(name):
+            self._cache.pop(user, None)
+
+    def _compute(self, name, get, active):
+        if name not in self._rules:
+            raise KeyError(f"unknown dimension {name!r}")
+        if name in active:
+            raise ValueError(f"dimension {name!r} depends on itself")
+        active.add(name)
+        fn, deps = self._rules[name]
+        value = fn(*(get(d) for d in deps))
+        active.discard(name)
+        return value
+
+    # ── Bulk evaluation and views ──
+
+    def evaluate(self, **overrides):
+        """Every dimension as a dict, inputs replaced by overrides (scalars or NumPy arrays)."""
+        values = dict(self._inputs)
+        unknown = set(overrides) - set(self._inputs)
+        if unknown:
+            raise KeyError(f"not inputs: {', '.join(sorted(unknown))}")
+        values.update(overrides)
+        active = set()
+
+        def get(name):
+            if name not in values:
+                values[name] = self._compute(name, get, active)
+            return values[name]
+
+        for name in self._rules:
+            get(name)
+        return values
+
+    def view(self, scale=1.0):
+        return View(self, scale)
+
+
+class View:
+    """Attribute access to a model's dimensions, lengths multiplied by scale."""
+
+    def __init__(self, model, scale):
+        self._model = model
+        self._scale = scale
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._model:
+            raise AttributeError(name)
+        value = self._model[name]
+        return value * self._scale if self._model.unit(name) == "mm" else value
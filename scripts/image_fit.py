@@ -0,0 +1,165 @@
+"""Aspect-aware image placement shared by the PPTX and PDF builders.
+
+"contain" letterboxes the whole image inside the frame, "cover" fills it and
+crops the overflow; `align` places the slack. Downscaled variants are cached
+next to this script, keyed by the SHA-1 of the image.
+
+    add_picture(slide, path, Inches(6.8), Inches(1.0), Inches(5.2), Inches(5.2))
+    draw_image(c, path, M, y, w, h, mode="cover")
+"""
+
+import hashlib
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+from PIL import Image
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(_DIR, ".image_cache")
+
+EMU_PER_INCH = 914400
+PT_PER_INCH = 72.0
+DEFAULT_DPI = 220   # enough for a projected slide or a phone-sized PDF page
+
+ALIGN = {"center": (0.5, 0.5), "top": (0.5, 0.0), "bottom": (0.5, 1.0),
+         "left": (0.0, 0.5), "right": (1.0, 0.5), "bottom left": (0.0, 1.0)}
+
+ImageInfo = namedtuple("ImageInfo", "digest width height")
+
+# Placement inside a frame. left/top/width/height are in the frame's units;
+# crop is the fraction trimmed from each edge (left, top, right, bottom).
+Placement = namedtuple("Placement", "left top width height crop")
+
+
+@lru_cache(maxsize=256)
+def _digest(path, mtime_ns, size):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def file_digest(path):
+    """SHA-1 of the file contents; re-hashed only when mtime or size change."""
+    st = os.stat(path)
+    return _digest(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _info(digest, path):
+    with Image.open(path) as im:
+        return ImageInfo(digest, *im.size)
+
+
+def image_info(path):
+    """(digest, width_px, height_px), cached by content hash."""
+    return _info(file_digest(path), os.path.abspath(path))
+
+
+def fit(img_w, img_h, box_w, box_h, mode="contain", align="center"):
+    """Place an img_w x img_h image in a box_w x box_h frame. Returns a Placement.
+
+    contain: scale to fit inside the frame, centred per `align`, no crop.
+    cover:   scale to fill the frame; the overflow is cropped per `align`.
+    stretch: fill the frame exactly, ignoring aspect ratio (the old behaviour).
+    """
+    ax, ay = ALIGN[align] if isinstance(align, str) else align
+    if mode == "stretch":
+        return Placement(0, 0, box_w, box_h, (0.0, 0.0, 0.0, 0.0))
+    img_ratio = img_w / img_h
+    box_ratio = box_w / box_h
+    if mode == "contain":
+        if img_ratio > box_ratio:
+            w, h = box_w, box_w / img_ratio
+        else:
+            w, h = box_h * img_ratio, box_h
+        return Placement((box_w - w) * ax, (box_h - h) * ay, w, h, (0.0, 0.0, 0.0, 0.0))
+    if mode == "cover":
+        if img_ratio > box_ratio:
+            keep = box_ratio / img_ratio          # fraction of the width that stays
+            cut = 1.0 - keep
+            crop = (cut * ax, 0.0, cut * (1 - ax), 0.0)
+        else:
+            keep = img_ratio / box_ratio          # fraction of the height that stays
+            cut = 1.0 - keep
+            crop = (0.0, cut * ay, 0.0, cut * (1 - ay))
+        return Placement(0, 0, box_w, box_h, crop)
+    raise ValueError(f"Unknown fit mode: {mode!r}")
+
+
+def place(path, left, top, width, height, mode="contain", align="center"):
+    """fit() for an image file, in absolute frame units."""
+    info = image_info(path)
+    p = fit(info.width, info.height, width, height, mode, align)
+    return Placement(left + p.left, top + p.top, p.width, p.height, p.crop)
+
+
+def variant(path, width_in, height_in, crop=(0.0, 0.0, 0.0, 0.0), dpi=DEFAULT_DPI):
+    """Path to a copy of the image cropped and downscaled for a frame of the given inches.
+
+    Returns the original path when no crop is needed and the image is already
+    at or below the target resolution (dpi=None: crop only, never resample).
+    Variants are PNG files in CACHE_DIR, named by source hash, crop and pixel
+    size, and are only written once.
+    """
+    info = image_info(path)
+    l, t, r, b = crop
+    src = (round(info.width * l), round(info.height * t),
+           round(info.width * (1 - r)), round(info.height * (1 - b)))
+    native = (src[2] - src[0], src[3] - src[1])
+    target = native if dpi is None else (max(1, round(width_in * dpi)), max(1, round(height_in * dpi)))
+    cropped = src != (0, 0, info.width, info.height)
+    if target[0] >= native[0]:
+        if not cropped:
+            return path
+        target = native
+    name = f"{info.digest[:16]}_{'_'.join(map(str, src))}_{target[0]}x{target[1]}.png"
+    out = os.path.join(CACHE_DIR, name)
+    if not os.path.exists(out):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with Image.open(path) as im:
+            im.crop(src).resize(target, Image.LANCZOS).save(out)
+    return out
+
+
+# ================================================================
+# Backends
+# ================================================================
+
+def add_picture(slide, path, left, top, width, height, mode="contain", align="center",
+                dpi=DEFAULT_DPI):
+    """python-pptx add_picture with contain/cover fitting (EMU in, Picture out).
+
+    The embedded image is a pre-sized variant, so decks don't carry 4K
+    originals; dpi=None embeds the original and crops with PowerPoint's crop
+    handles instead.
+    """
+    p = place(path, left, top, width, height, mode, align)
+    if dpi is None:
+        pic = slide.shapes.add_picture(path, int(p.left), int(p.top), int(p.width), int(p.height))
+        pic.crop_left, pic.crop_top, pic.crop_right, pic.crop_bottom = p.crop
+        return pic
+    src = variant(path, p.width / EMU_PER_INCH, p.height / EMU_PER_INCH, p.crop, dpi)
+    return slide.shapes.add_picture(src, int(p.left), int(p.top), int(p.width), int(p.height))
+
+
+@lru_cache(maxsize=64)
+def _reader(src):
+    from reportlab.lib.utils import ImageReader
+    return ImageReader(src)
+
+
+def draw_image(c, path, x, y, width, height, mode="contain", align="center", dpi=DEFAULT_DPI):
+    """ReportLab drawImage with contain/cover fitting. x, y is the frame's lower-left corner (points).
+
+    Vertical alignment follows the page, not PDF coordinates: "top" puts the
+    image against the top edge of the frame.
+    """
+    p = place(path, 0, 0, width, height, mode, align)
+    src = variant(path, p.width / PT_PER_INCH, p.height / PT_PER_INCH, p.crop, dpi)
+    c.drawImage(_reader(src), x + p.left, y + height - p.top - p.height,
+                width=p.width, height=p.height, mask="auto")
+
+
+def cache_info():
+    """Hit/miss counters for the digest and header caches."""
+    return {"digest": _digest.cache_info(), "info": _info.cache_info()}
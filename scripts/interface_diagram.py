@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Block diagram generated from a system description's §5 interface tables.
+
+Every system description lists its interfaces as From / To / Protocol / Data /
+Rate rows. This turns those rows into a graph and the graph into a diagram
+spec (layered layout, orthogonal routing), so the diagram never has to be
+redrawn by hand:
+
+  - Nodes are the components named in From / To. Cells name a component plus
+    the pin or peripheral used ("MCU GPIO (bit-banged SPI)", "HX711 DOUT
+    pin"); the peripheral words, counts and parentheticals are stripped so
+    both ends of the MCU land on one block, and the peripherals become the
+    block's sublabel. "A → B" cells are chains, "A, B" cells fan out.
+  - Nodes join the §3 tier whose name or components mention them; the rest
+    go to "Device" (internal interface tables) or "External".
+  - Edges carry the protocol and rate. Rows between the same two components
+    in the same direction share one edge.
+
+graph() is cached per document hash on top of system_model.load(), so
+re-rendering or restyling never re-parses.
+
+Usage:
+    python3 interface_diagram.py path/to/system_description.md
+    python3 interface_diagram.py system.md -o Interfaces.png -f png,svg,pdf
+"""
+
+import argparse
+import os
+import re
+from dataclasses import dataclass
+
+import diagram
+import mpl_runtime
+import system_model
+from router import text_extent
+
+_GRAPHS = {}
+
+COLORS = ["teal", "blue", "purple", "orange", "red"]
+PALETTE = {"teal": "#00BFA5", "blue": "#009BF5", "purple": "#9B6DFF", "orange": "#FF8C00",
+           "red": "#FF4545", "gray": "#8899AA", "white": "#FFFFFF"}
+
+
+@dataclass(frozen=True)
+class Node:
+    id: str
+    label: str
+    group: str
+    ports: tuple = ()
+
+
+@dataclass(frozen=True)
+class Edge:
+    source: str
+    target: str
+    protocol: str
+    rate: str = ""
+    interfaces: tuple = ()
+
+
+@dataclass(frozen=True)
+class InterfaceGraph:
+    product: str
+    groups: tuple = ()       # (id, label) in diagram order
+    nodes: tuple = ()
+    edges: tuple = ()
+    digest: str = ""
+
+
+# ================================================================
+# Endpoint names
+# ================================================================
+
+_PORT = re.compile(r"\s+((?:GPIO\w*|(?:SA)?ADC|PWM(?:\s+timer)?|timer|LEDC|SPI|I2C|I2S\d*|INT\d*|DOUT|STAT|"
+                   r"pins?|gate|input|VDD|terminal)(?:\s+\d+|\s+pins?)?)$", re.I)
+_COUNT = re.compile(r"^\d+\s*[×x]\s*|\s*[×x]\s*\d+(?:\s*[–-]\s*\d+)?$")
+
+
+def _split(cell):
+    """Endpoints named in one cell: "A → B" chains and "A, B" lists."""
+    cell = re.sub(r"\s*\([^)]*\)", "", cell)
+    return [[p.strip() for p in hop.split(",") if p.strip()] for hop in cell.split("→")]
+
+
+def endpoint(text):
+    """(key, label, ports) for one endpoint, e.g. "MCU PWM timer" -> ("mcu", "MCU", ("PWM timer",))."""
+    name = re.sub(r"\s+(?:via|on|in)\s+.*$", "", text.strip())
+    ports = []
+    while True:
+        bare = _COUNT.sub("", name).strip()
+        m = _PORT.search(bare)
+        if not m or m.start() == 0:
+            break
+        ports.insert(0, m.group(1))
+        name = bare[:m.start()]
+    name = bare or name
+    # Plural and case differences name the same part: "Tactile switch" / "2× tactile switches".
+    key = re.sub(r"(?<=\w{3})s\b", "", " ".join(name.lower().split()))
+    if name.split()[0].islower():
+        name = name[:1].upper() + name[1:]
+    return key, name, tuple(ports)
+
+
+def _short(text, limit=22):
+    """First clause of a table cell, cut to fit an edge label."""
+    if text in ("", "—", "-"):
+        return ""
+    if len(text) > limit:
+        text = re.split(r"\s\(|,\s|;\s|\s—\s", text)[0]
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def _slug(key):
+    return re.sub(r"\W+", "_", key).strip("_") or "node"
+
+
+# ================================================================
+# Graph
+# ================================================================
+
+def _tier_of(label, model):
+    """The §3 tier whose name, or one of whose components, mentions the node's first word."""
+    word = label.split()[0].lower()
+    for t in model.tiers:
+        names = [t.name] + [c.name.replace("<br/>", " ") for c in t.components]
+        if any(word in re.findall(r"[\w+./-]+", n.lower()) for n in names):
+            return t.id
+    return None
+
+
+def build_graph(model):
+    """InterfaceGraph from a SystemModel's interfaces."""
+    nodes, merged = {}, {}
+    for iface in model.interfaces:
+        hops = _split(iface.source) + _split(iface.target)
+        crossing = len(_split(iface.source)) - 1
+        for k in range(len(hops) - 1):
+            for a in hops[k]:
+                for b in hops[k + 1]:
+                    ends = []
+                    for text in (a, b):
+                        key, label, ports = endpoint(text)
+                        node = nodes.setdefault(key, {"label": label, "ports": [], "internal": False})
+                        node["ports"] += [p for p in ports if p not in node["ports"]]
+                        node["internal"] |= not iface.external
+                        ends.append(key)
+                    if ends[0] == ends[1]:
+                        continue
+                    edge = merged.setdefault(tuple(ends), {"protocol": [], "rate": [], "names": []})
+                    if k != crossing:
+                        continue    # a chain's inner hops carry no protocol of their own
+                    for field, value in (("protocol", _short(iface.protocol)),
+                                         ("rate", _short(iface.rate)), ("names", iface.name)):
+                        if value and value not in edge[field]:
+                            edge[field].append(value)
+
+    groups = [(t.id, t.name.upper()) for t in model.tiers] or [("device", "DEVICE")]
+    groups.append(("external", "EXTERNAL"))
+    out_nodes, used = [], set()
+    for key, n in nodes.items():
+        group = _tier_of(n["label"], model) or (groups[0][0] if n["internal"] else "external")
+        used.add(group)
+        out_nodes.append(Node(_slug(key), n["label"], group, tuple(n["ports"])))
+    groups = [g for g in groups if g[0] in used]
+    edges = tuple(Edge(_slug(a), _slug(b), " / ".join(e["protocol"]), " / ".join(e["rate"]),
+                       tuple(e["names"])) for (a, b), e in merged.items())
+    return InterfaceGraph(model.product, tuple(groups), tuple(out_nodes), edges, model.digest)
+
+
+def graph(path):
+    """Interface graph of a system description, cached by the document's content hash."""
+    model = system_model.load(path)
+    if model.digest not in _GRAPHS:
+        _GRAPHS[model.digest] = build_graph(model)
+    return _GRAPHS[model.digest]
+
+
+# ================================================================
+# Diagram spec
+# ================================================================
+
+def spec_from_graph(g, label_size=9):
+    """Layered, routed diagram spec: one group per tier, one block per node."""
+    colors = {gid: COLORS[i % len(COLORS)] for i, (gid, _) in enumerate(g.groups)}
+    blocks = []
+    for n in g.nodes:
+        sub = " · ".join(n.ports)
+        w = max(text_extent(n.label, label_size)[0], text_extent(sub, 7.5)[0]) + 0.5
+        blocks.append({"id": n.id, "group": n.group, "label": n.label, "sublabel": sub or None,
+                       "color": colors[n.group], "extent": [round(max(w, 1.8), 2), 0.75 if sub else 0.5],
+                       "size": label_size})
+    group_of = {n.id: n.group for n in g.nodes}
+    edges = [{"from": e.source, "to": e.target, "color": colors[group_of[e.source]],
+              "label": "\n".join(s for s in (e.protocol, e.rate) if s)} for e in g.edges]
+    short = g.product.split()[0]
+    return {
+        "theme": "card",
+        "layout": {"layer_gap": 1.6, "node_gap": 0.5},
+        "routing": "orthogonal",
+        "labels": True,
+        "canvas": {"background": "#0F172A"},
+        "palette": PALETTE,
+        "title": {"text": f"{short}  --  Interfaces", "size": 18, "color": "white"},
+        "groups": [{"id": gid, "label": label, "color": colors[gid]} for gid, label in g.groups],
+        "blocks": blocks,
+        "edges": edges,
+        "output": {"file": f"{short}_Interfaces.png", "dpi": 200, "bbox": "tight"},
+    }
+
+
+def main():
+    mpl_runtime.use_font_cache()
+    parser = argparse.ArgumentParser(description="Block diagram from a system description's §5 interface tables.")
+    parser.add_argument("system_description")
+    parser.add_argument("-o", "--output", help="output image (default: <Product>_Interfaces.png next to it)")
+    parser.add_argument("-f", "--formats", help="comma-separated, e.g. png,svg,pdf")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="parallel render processes")
+    args = parser.parse_args()
+    g = graph(args.system_description)
+    if not g.edges:
+        raise SystemExit(f"No From / To interface rows in {args.system_description}")
+    d = diagram.compile_spec(spec_from_graph(g))
+    path = args.output or os.path.join(os.path.dirname(os.path.abspath(args.system_description)),
+                                       d.output["file"])
+    formats = args.formats.split(",") if args.formats else None
+    for p in diagram.export(d, path, formats, workers=args.workers):
+        print(f"Saved to {p}")
+
+
+if __name__ == "__main__":
+    main()
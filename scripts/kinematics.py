@@ -0,0 +1,182 @@
+"""Swept-volume clearance for rotating and translating parts.
+
+A moving part (a clearance.Shape: the wand arm, the loop seen edge-on, a
+sliding tray) is sampled over its motion range, and its distance to every
+static shape is taken at every sample in one NumPy pass:
+
+    wand = [outline("arm", [(sx, sy), (sx, sy + arm)]), outline("loop", [...])]
+    motion = rotation((sx, sy), 90, 265)          # part drawn at 90°, swings to 265°
+    for c in sweep(wand, [vat, protrusion, rim], motion):
+        print(c.part, c.static, c.gap, c.at)       # closest approach and where it happens
+
+Distances are exact at each sample (vertex-to-segment both ways, plus a
+crossing test), so only the step between samples limits accuracy: 176 steps
+of 1° over a 175° swing. envelope() gives the outline of the swept region
+for drawing. A mechanism with a few parts and obstacles sweeps in about a
+millisecond, cheap enough to repeat for every variant of a sweep.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from clearance import EPS, Shape, crossing, inside, point_segment, probes, segments
+
+Motion = namedtuple("Motion", "kind origin start stop steps")
+Clearance = namedtuple("Clearance", "part static gap at contact p q")
+
+
+def rotation(pivot, start, stop, steps=None):
+    """Rotation about pivot from `start` to `stop` degrees (CCW when stop > start), 1° steps by default."""
+    steps = steps or int(abs(stop - start)) + 1
+    return Motion("rotate", tuple(pivot), float(start), float(stop), steps)
+
+
+def translation(start, stop, steps=50):
+    """Straight travel of the part's drawn position by offset `start` to offset `stop` (x, y)."""
+    return Motion("translate", (0.0, 0.0), np.asarray(start, dtype=float), np.asarray(stop, dtype=float), steps)
+
+
+def samples(motion):
+    """Angles in degrees (rotation) or (steps, 2) offsets (translation)."""
+    t = np.linspace(0, 1, motion.steps)
+    if motion.kind == "rotate":
+        return motion.start + t * (motion.stop - motion.start)
+    return motion.start[None] + t[:, None] * (motion.stop - motion.start)[None]
+
+
+def poses(points, motion):
+    """(steps, n, 2) positions of a part's points over the motion."""
+    at = samples(motion)
+    if motion.kind == "translate":
+        return points[None] + at[:, None, :]
+    theta = np.radians(at - motion.start)
+    c, s = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    d = points - np.asarray(motion.origin)
+    return np.stack([motion.origin[0] + c * d[None, :, 0] - s * d[None, :, 1],
+                     motion.origin[1] + s * d[None, :, 0] + c * d[None, :, 1]], axis=2)
+
+
+def _approach(moving, static, part_solid=False):
+    """Per-sample gap, contact flag and closest point pair between a moving part and one static shape.
+
+    moving: (steps, n, 2) positions of a part whose outline is its point order.
+    """
+    steps, n, _ = moving.shape
+    a0 = moving.reshape(-1, 2)
+    a1 = np.roll(moving, -1, axis=1).reshape(-1, 2)
+    b0, b1 = segments(static)
+
+    d_ab, c_ab = point_segment(a0, b0, b1)                   # part vertices -> static edges
+    d_ab, j = d_ab.reshape(steps, n, -1), d_ab.reshape(steps, -1).argmin(axis=1)
+    best_ab = d_ab.reshape(steps, -1).min(axis=1)
+    d_ba, c_ba = point_segment(static.points, a0, a1)       # static vertices -> part edges
+    d_ba = d_ba.reshape(len(static.points), steps, n).transpose(1, 0, 2).reshape(steps, -1)
+    k = d_ba.argmin(axis=1)
+    best_ba = d_ba.min(axis=1)
+
+    gap = np.minimum(best_ab, best_ba)
+    rows = np.arange(steps)
+    m = d_ab.shape[2]
+    p_ab = a0.reshape(steps, n, 2)[rows, j // m]
+    q_ab = c_ab.reshape(steps, n, m, 2)[rows, j // m, j % m]
+    c_ba = c_ba.reshape(len(static.points), steps, n, 2)
+    q_ba = static.points[k // n]
+    p_ba = c_ba[k // n, rows, k % n]
+    use_ab = (best_ab <= best_ba)[:, None]
+    p, q = np.where(use_ab, p_ab, p_ba), np.where(use_ab, q_ab, q_ba)
+
+    crossed = crossing(a0, a1, b0, b1).reshape(steps, -1).any(axis=1)
+    contact = crossed
+    if static.solid:
+        contact = contact | inside(probes(moving).reshape(-1, 2), static).reshape(steps, -1).any(axis=1)
+    if part_solid:
+        contact = contact | np.array([inside(probes(static.points), Shape("", pose, True, ""))
+                                      .any() for pose in moving])
+    gap = np.where(contact, 0.0, gap)
+    return gap, contact, p, q
+
+
+def sweep(parts, statics, motion):
+    """Closest approach of each moving part to each static shape, tightest first.
+
+    `at` is the angle (degrees) or offset of the closest approach; when the part
+    touches or enters the static shape it is the first sample in contact.
+    """
+    out = []
+    at = samples(motion)
+    for part in parts:
+        moving = poses(part.points, motion)
+        for static in statics:
+            gap, contact, p, q = _approach(moving, static, part.solid)
+            i = int(np.argmax(contact)) if contact.any() else int(gap.argmin())
+            where = float(at[i]) if motion.kind == "rotate" else tuple(map(float, at[i]))
+            out.append(Clearance(part.name, static.name, float(gap[i]), where, bool(contact.any()),
+                                 tuple(map(float, p[i])), tuple(map(float, q[i]))))
+    return sorted(out, key=lambda c: (not c.contact, c.gap))
+
+
+def contact(parts, statics, motion):
+    """(steps,) mask of the samples where any part touches or enters any static shape."""
+    hit = np.zeros(motion.steps, dtype=bool)
+    for part in parts:
+        moving = poses(part.points, motion)
+        for static in statics:
+            hit |= _approach(moving, static, part.solid)[1]
+    return hit
+
+
+def envelope(part, motion):
+    """Outline of the region a part sweeps, as an (n, 2) array.
+
+    Rotation: the annular sector between the part's nearest and farthest
+    points from the pivot. Translation: the hull of its start and end poses.
+    """
+    if motion.kind == "rotate":
+        o = np.asarray(motion.origin)
+        p0, p1 = segments(part)
+        d, _ = point_segment(o[None], p0, p1)
+        r0 = 0.0 if part.solid and inside(o[None], part)[0] else max(float(d.min()) - EPS, 0.0)
+        rel = part.points - o
+        dist = np.linalg.norm(rel, axis=1)
+        r1 = float(dist.max())
+        rel = rel[dist > EPS]          # a point on the pivot has no angle
+        ang = np.degrees(np.arctan2(rel[:, 1], rel[:, 0]))
+        ang = (ang - motion.start + 180) % 360 - 180
+        lo = motion.start + min(0.0, motion.stop - motion.start) + ang.min()
+        hi = motion.start + max(0.0, motion.stop - motion.start) + ang.max()
+        t = np.radians(np.linspace(lo, hi, max(int(hi - lo), 2)))
+        outer = o + r1 * np.column_stack([np.cos(t), np.sin(t)])
+        inner = o + r0 * np.column_stack([np.cos(t[::-1]), np.sin(t[::-1])])
+        return np.vstack([outer, inner])
+    pts = np.vstack([part.points + motion.start, part.points + motion.stop])
+    return hull(pts)
+
+
+def hull(pts):
+    """Convex hull (monotone chain), counter-clockwise."""
+    pts = np.unique(pts, axis=0)
+    if len(pts) < 3:
+        return pts
+
+    def half(seq):
+        h = []
+        for p in seq:
+            while len(h) >= 2 and (h[-1][0] - h[-2][0]) * (p[1] - h[-2][1]) - (h[-1][1] - h[-2][1]) * (p[0] - h[-2][0]) <= 0:
+                h.pop()
+            h.append(p)
+        return h[:-1]
+
+    return np.array(half(pts) + half(pts[::-1]))
+
+
+def report(clearances, unit=1.0, suffix=""):
+    """One line per part / static pair, gaps scaled by `unit`."""
+    lines = []
+    for c in clearances:
+        where = f"{c.at:.0f}°" if isinstance(c.at, float) else f"({c.at[0] * unit:.0f}, {c.at[1] * unit:.0f}){suffix}"
+        if c.contact:
+            lines.append(f"{c.part} -> {c.static}: contact from {where}")
+        else:
+            lines.append(f"{c.part} -> {c.static}: {c.gap * unit:.1f}{suffix} at {where}")
+    return lines
@@ -0,0 +1,180 @@
+"""Mass properties and tip-over stability of an arrangement over its motion states.
+
+A part's spread is the covariance of its volume about the centroid (mm²).
+Units are mm and g; inertia is g·mm² (1 kg·cm² = 1e5 g·mm²).
+
+    parts = stack([part(s, density=DENSITY.get(s.name), mass=MASS.get(s.name)) for s in scene])
+    R = rotation("y", -np.arange(0, 176, 5))                  # (36, 3, 3), one per wand angle
+    c, J = transform(parts.centroid, parts.spread, R[:, None], pivot=(97, 0, 55), where=wand)
+    props = combine(parts.mass, c, J)                         # mass (36,), cg (36, 3), inertia (36, 3, 3)
+    t = tip(props.cg, support(scene))                         # smallest tip angle and its direction
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from kinematics import hull
+from solids import AXES
+
+Parts = namedtuple("Parts", "name mass centroid spread")
+Props = namedtuple("Props", "mass cg inertia")
+Tip = namedtuple("Tip", "angle direction edge")
+
+
+# ================================================================
+# Parts
+# ================================================================
+
+def _loop_moments(loop):
+    """Area, first and second moments of a closed loop (signed: holes, wound clockwise, subtract)."""
+    u, v = loop[:, 0], loop[:, 1]
+    un, vn = np.roll(u, -1), np.roll(v, -1)
+    cross = u * vn - un * v
+    return np.array([
+        cross.sum() / 2,
+        ((u + un) * cross).sum() / 6,
+        ((v + vn) * cross).sum() / 6,
+        ((u * u + u * un + un * un) * cross).sum() / 12,
+        ((v * v + v * vn + vn * vn) * cross).sum() / 12,
+        ((u * vn + 2 * u * v + 2 * un * vn + un * v) * cross).sum() / 24,
+    ])
+
+
+def moments(solid):
+    """Volume (mm³), centroid (3,) and spread (3, 3) of a prism, exact for its polygon loops."""
+    a, su, sv, suu, svv, suv = sum(_loop_moments(loop) for loop in solid.loops)
+    length = solid.hi - solid.lo
+    sw, sww = (solid.hi ** 2 - solid.lo ** 2) / 2, (solid.hi ** 3 - solid.lo ** 3) / 3
+    volume = a * length
+    # ∫ x_i x_j dV in profile (u, v) and extrusion (w) order, then into world axes.
+    second = np.array([[suu * length, suv * length, su * sw],
+                       [suv * length, svv * length, sv * sw],
+                       [su * sw, sv * sw, a * sww]])
+    first = np.array([su * length, sv * length, a * sw])
+    perm = np.zeros((3, 3))
+    perm[list(AXES[solid.axis]), [0, 1, 2]] = 1
+    centroid = perm @ first / volume
+    return volume, centroid, perm @ second @ perm.T / volume - np.outer(centroid, centroid)
+
+
+def part(solid, mass=None, density=None):
+    """(mass g, centroid, spread) of a solid: `mass` as given, or `density` (g/cm³) × volume."""
+    if (mass is None) == (density is None):
+        raise ValueError(f"{solid.name}: give exactly one of mass and density")
+    volume, centroid, spread = moments(solid)
+    return (mass if mass is not None else density * volume / 1000), centroid, spread
+
+
+def stack(parts, names=None):
+    """Parts as arrays: mass (P,), centroid (P, 3), spread (P, 3, 3)."""
+    mass, centroid, spread = zip(*parts)
+    return Parts(list(names or range(len(parts))), np.array(mass, dtype=float), np.array(centroid),
+                 np.array(spread))
+
+
+def box_moments(lo, hi):
+    """Centroid (..., 3) and spread (..., 3, 3) of boxes between corners lo and hi (..., 3)."""
+    lo, hi = np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+    size = hi - lo
+    return (lo + hi) / 2, size[..., :, None] * np.eye(3) * size[..., None, :] / 12
+
+
+# ================================================================
+# States
+# ================================================================
+
+def rotation(axis, degrees):
+    """Right-handed rotations about world `axis` ("x", "y" or "z"): (..., 3, 3) for angles (...)."""
+    t = np.radians(np.asarray(degrees, dtype=float))
+    c, s = np.cos(t), np.sin(t)
+    i, j = {"x": (1, 2), "y": (2, 0), "z": (0, 1)}[axis]
+    R = np.broadcast_to(np.eye(3), t.shape + (3, 3)).copy()
+    R[..., i, i], R[..., i, j], R[..., j, i], R[..., j, j] = c, -s, s, c
+    return R
+
+
+def transform(centroid, spread, R, pivot=(0, 0, 0), offset=(0, 0, 0), where=None):
+    """Parts rotated by R (..., 3, 3) about `pivot` and moved by `offset`; `where` (P,) picks which move.
+
+    Leading shapes broadcast: centroids (P, 3) with rotations (S, 1, 3, 3)
+    give (S, P, 3), one row of parts per state.
+    """
+    pivot = np.asarray(pivot, dtype=float)
+    c = pivot + np.einsum("...ij,...j->...i", R, centroid - pivot) + offset
+    J = np.einsum("...ij,...jk,...lk->...il", R, spread, R)
+    if where is None:
+        return c, J
+    where = np.asarray(where, dtype=bool)
+    return (np.where(where[:, None], c, centroid),
+            np.where(where[:, None, None], J, spread))
+
+
+def combine(mass, centroid, spread):
+    """Total mass, centre of gravity and inertia tensor about it, summed over the last part axis.
+
+    mass (..., P), centroid (..., P, 3), spread (..., P, 3, 3); leading
+    axes (states, variants) broadcast and are kept.
+    """
+    mass = np.asarray(mass, dtype=float)
+    total = mass.sum(axis=-1)
+    cg = np.einsum("...p,...pi->...i", mass, centroid) / total[..., None]
+    d = centroid - cg[..., None, :]
+    cov = np.einsum("...p,...pij->...ij", mass, spread + d[..., :, None] * d[..., None, :])
+    inertia = np.trace(cov, axis1=-2, axis2=-1)[..., None, None] * np.eye(3) - cov
+    return Props(total, cg, inertia)
+
+
+def principal(inertia):
+    """Principal moments (..., 3), ascending, and their axes as columns (..., 3, 3)."""
+    return np.linalg.eigh(inertia)
+
+
+# ================================================================
+# Stability
+# ================================================================
+
+def support(scene, ground=0.0, tol=1e-6):
+    """Support polygon (n, 2), counter-clockwise: convex hull of the z-extruded solids standing on the ground."""
+    pts = [loop for s in scene if s.axis == "z" and abs(s.lo - ground) < tol for loop in s.loops[:1]]
+    if not pts:
+        raise ValueError(f"no solid stands on z = {ground}")
+    return hull(np.vstack(pts))
+
+
+def _inward(polygon):
+    """Inward unit normals (..., n, 2) of a counter-clockwise polygon's edges (edge k: vertex k to k + 1)."""
+    edge = np.roll(polygon, -1, axis=-2) - polygon
+    return np.stack([-edge[..., 1], edge[..., 0]], axis=-1) / np.hypot(edge[..., 0], edge[..., 1])[..., None]
+
+
+def tip_angles(cg, polygon, ground=0.0):
+    """Tilt (degrees) that brings the centre of gravity over each edge of the support polygon.
+
+    cg (..., 3), polygon (..., n, 2) counter-clockwise; returns (..., n).
+    Negative where the centre of gravity is already outside that edge.
+    """
+    polygon = np.asarray(polygon, dtype=float)
+    dist = np.einsum("...ni,...ni->...n", cg[..., None, :2] - polygon, _inward(polygon))
+    return np.degrees(np.arctan2(dist, cg[..., None, 2] - ground))
+
+
+def tip(cg, polygon, ground=0.0):
+    """Smallest tip angle (...), the compass direction it falls towards (degrees, 0 = +x, 90 = +y) and the edge."""
+    angles = tip_angles(cg, polygon, ground)
+    edge = angles.argmin(axis=-1)
+    inward = np.broadcast_to(_inward(np.asarray(polygon, dtype=float)), angles.shape + (2,))
+    n = np.take_along_axis(inward, edge[..., None, None], axis=-2)[..., 0, :]
+    direction = np.degrees(np.arctan2(-n[..., 1], -n[..., 0])) % 360
+    return Tip(np.take_along_axis(angles, edge[..., None], axis=-1)[..., 0], direction, edge)
+
+
+def report(names, props, tips):
+    """One line per state: mass, centre of gravity, principal inertia and the weakest tip."""
+    lines = [f"{'state':<22} {'mass g':>7}  {'cg x, y, z mm':>21}  {'I1, I2, I3 kg·cm²':>20}  tip"]
+    axes_i, _ = principal(props.inertia)
+    for k, name in enumerate(names):
+        cg, i = props.cg[k], axes_i[k] / 1e5
+        lines.append(f"{name:<22} {props.mass[k]:7.0f}  {cg[0]:6.1f} {cg[1]:6.1f} {cg[2]:6.1f}  "
+                     f"{i[0]:6.1f} {i[1]:6.1f} {i[2]:6.1f}  {tips.angle[k]:5.1f}° towards {tips.direction[k]:3.0f}°")
+    return lines
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Startup profile for the diagram scripts: font cache, import times.
+
+In a fresh container the first matplotlib import scans every system font
+and writes fontlist-*.json before anything is drawn, and a plain
+`import matplotlib.pyplot` costs more than drawing a small diagram. diagram.py
+already imports matplotlib only when it has to draw (an all-cached build
+never loads it) and draws on an Agg canvas without pyplot. This module covers
+the rest:
+
+    python3 mpl_runtime.py warm                       # build the font cache in scripts/.mpl_cache
+    python3 mpl_runtime.py profile block_diagram.py   # wall time and import-time breakdown
+
+Once scripts/.mpl_cache exists, use_font_cache() (called by the diagram entry
+points before any matplotlib import) points MPLCONFIGDIR at it unless the caller
+set one, so CI can build it once and keep it between runs like any other cache
+directory. Importing diagram.py leaves MPLCONFIGDIR alone.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_CACHE = os.path.join(_DIR, ".mpl_cache")
+
+
+def use_font_cache():
+    """Use the warmed cache for this process if there is one; returns the config dir in effect."""
+    if "MPLCONFIGDIR" not in os.environ and os.path.isdir(FONT_CACHE) and "matplotlib" not in sys.modules:
+        os.environ["MPLCONFIGDIR"] = FONT_CACHE
+    return os.environ.get("MPLCONFIGDIR")
+
+
+def warm(path=FONT_CACHE):
+    """Build matplotlib's font list into `path` (in a child process, so this one stays clean)."""
+    os.makedirs(path, exist_ok=True)
+    env = dict(os.environ, MPLCONFIGDIR=path)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import matplotlib.font_manager"], env=env, check=True)
+    return [f for f in os.listdir(path) if f.startswith("fontlist")], time.perf_counter() - start
+
+
+def _parse_importtime(stderr):
+    """[(module, self_us, cumulative_us)] from `python -X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    return rows
+
+
+def profile(argv, top=12):
+    """Run a script under -X importtime; returns (wall seconds, {package: self us}, slowest modules).
+
+    The script runs in the caller's working directory, as it would on its own.
+    """
+    use_font_cache()
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(proc.returncode)
+    rows = _parse_importtime(proc.stderr)
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    slowest = sorted(rows, key=lambda r: -r[1])[:top]
+    return wall, dict(by_package), slowest
+
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["warm"]:
+        files, seconds = warm()
+        print(f"Font cache: {', '.join(files)} in {FONT_CACHE} ({seconds:.2f} s)")
+        return
+    if args[:1] == ["profile"] and len(args) > 1:
+        wall, packages, slowest = profile(args[1:])
+        total = sum(packages.values())
+        cache = use_font_cache() or "default (~/.cache/matplotlib)"
+        print(f"{' '.join(args[1:])}: {wall:.2f} s wall, {total / 1e6:.2f} s importing; font cache: {cache}")
+        print("\nImport time by package (self):")
+        for name, us in sorted(packages.items(), key=lambda kv: -kv[1])[:8]:
+            print(f"  {name:<24} {us / 1000:8.1f} ms  {100 * us / max(total, 1):5.1f}%")
+        print("\nSlowest modules (self):")
+        for name, self_us, cum_us in slowest:
+            print(f"  {name:<44} {self_us / 1000:8.1f} ms   (cumulative {cum_us / 1000:.1f} ms)")
+        return
+    raise SystemExit(__doc__)
+
+
+if __name__ == "__main__":
+    main()
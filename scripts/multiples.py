@@ -0,0 +1,124 @@
+"""Small-multiples sheets: many arrangement variants side by side on one scale.
+
+Panels are cells of one axes in the same data coordinates (mm), drawn as a
+few batched collections for the whole sheet:
+
+    sheet = Sheet(len(variants), extent=(-10, 260, -10, 240), cols=8, title="Bubbler — variants")
+    sheet.static([Rectangle((0, 0), 246, 5, color=STRUCT)])   # once, shown in every panel
+    for k, v in enumerate(variants):
+        panel = sheet.panel(k)
+        panel.add(box(3, v.vat_y, v.vat_ext, 20, facecolor=FLOW))  # patches in panel coordinates
+        panel.plot([x, x], [y0, y1], color=WAND_C, lw=2.5)
+        panel.title(f"#{k + 1}")
+    sheet.save("variants.png")
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.transforms import Affine2D, AffineDeltaTransform
+
+from batch import Batch
+
+
+class Panel:
+    """One cell of a Sheet: draws in panel coordinates, shifted into the cell."""
+
+    def __init__(self, sheet, k):
+        self.sheet, self.k = sheet, k
+        self.dx, self.dy = sheet.offsets[k]
+
+    def add(self, patch):
+        """Queue a patch (its path in panel coordinates)."""
+        patch.set_transform(Affine2D().translate(self.dx, self.dy))
+        return self.sheet.batch.add(patch)
+
+    def plot(self, x, y, color="#333333", lw=1.0, zorder=4):
+        """A polyline through (x, y)."""
+        pts = np.column_stack([np.atleast_1d(x), np.atleast_1d(y)]) + (self.dx, self.dy)
+        self.sheet._lines.setdefault(zorder, []).append((pts, color, lw))
+
+    def point(self, x, y, color="#333333", ms=4.0, zorder=6):
+        """A round marker `ms` points across."""
+        self.sheet._points.setdefault(zorder, []).append((x + self.dx, y + self.dy, color, ms))
+
+    def title(self, text, color="#d35400", fontsize=9, **kwargs):
+        """Bold heading centred above the cell."""
+        x0, x1, _, y1 = self.sheet.extent
+        self.sheet.ax.text((x0 + x1) / 2 + self.dx, y1 + self.dy + self.sheet.head / 2, text, color=color,
+                           fontsize=fontsize, fontweight="bold", ha="center", va="center", **kwargs)
+
+    def text(self, u, v, text, **kwargs):
+        """Text at (u, v) as fractions of the cell, like transform=ax.transAxes on a subplot."""
+        x0, x1, y0, y1 = self.sheet.extent
+        return self.sheet.ax.text(x0 + u * (x1 - x0) + self.dx, y0 + v * (y1 - y0) + self.dy, text, **kwargs)
+
+
+class Sheet:
+    """n panels showing `extent` (x0, x1, y0, y1, panel coordinates) each, `cols` to a row.
+
+    size is the panel width in inches; gap the space between cells and
+    head the title band above each, both as fractions of the panel height.
+    """
+
+    def __init__(self, n, extent, cols=4, size=4.2, gap=0.08, head=0.1, title=None,
+                 facecolor="#F0F0F0", panelcolor="#FFFFFF", title_color="#d35400"):
+        self.n, self.extent = n, tuple(map(float, extent))
+        self.cols = min(cols, n)
+        self.rows = -(-n // self.cols)
+        x0, x1, y0, y1 = self.extent
+        w, h = x1 - x0, y1 - y0
+        self.head = head * h
+        pitch_x, pitch_y = w + gap * h, h + self.head + gap * h
+        k = np.arange(n)
+        col, row = k % self.cols, k // self.cols
+        self.offsets = np.column_stack([col * pitch_x - x0, -row * pitch_y - y0])
+
+        top = 0.6 if title else 0.15   # inches above the grid for the sheet title
+        width = self.cols * pitch_x - gap * h
+        height = self.rows * pitch_y - gap * h
+        scale = size / w
+        self.fig = plt.figure(figsize=(width * scale + 0.3, height * scale + top + 0.15))
+        self.fig.patch.set_facecolor(facecolor)
+        fw, fh = self.fig.get_size_inches()
+        self.ax = self.fig.add_axes([0.15 / fw, 0.15 / fh, width * scale / fw, height * scale / fh])
+        self.ax.set_xlim(x0, x0 + width)
+        self.ax.set_ylim(y1 + self.head - height, y1 + self.head)
+        self.ax.set_aspect("equal")
+        self.ax.axis("off")
+        if title:
+            self.fig.text(0.5, 1 - 0.35 / fh, title, color=title_color, fontsize=13, fontweight="bold",
+                          ha="center", va="center")
+        self.batch = Batch(self.ax)
+        self._lines, self._points = {}, {}
+        if panelcolor:
+            self.static([plt.Rectangle((x0, y0), w, h, facecolor=panelcolor, edgecolor="none")], zorder=0)
+
+    def panel(self, k):
+        return Panel(self, k)
+
+    def static(self, patches, zorder=1):
+        """Patches shared by every panel, drawn from one set of paths at each panel's offset."""
+        # Collections cycle paths and styles over the offsets: item i is path i % m in panel i // m.
+        coll = PatchCollection(patches, match_original=True, zorder=zorder,
+                               offsets=np.repeat(self.offsets, len(patches), axis=0),
+                               offset_transform=AffineDeltaTransform(self.ax.transData))
+        self.ax.add_collection(coll, autolim=False)
+        return coll
+
+    def flush(self):
+        """Hand the queued patches, lines and points to matplotlib."""
+        self.batch.flush()
+        for z, lines in self._lines.items():
+            self.ax.add_collection(LineCollection([p for p, _, _ in lines], colors=[c for _, c, _ in lines],
+                                                  linewidths=[w for _, _, w in lines], capstyle="round",
+                                                  zorder=z), autolim=False)
+        for z, pts in self._points.items():
+            x, y, c, ms = zip(*pts)
+            self.ax.scatter(x, y, s=np.square(ms), c=list(c), zorder=z, linewidths=0)
+        self._lines, self._points = {}, {}
+
+    def save(self, path, dpi=150):
+        self.flush()
+        self.fig.savefig(path, dpi=dpi, facecolor=self.fig.get_facecolor())
+        plt.close(self.fig)
@@ -0,0 +1,223 @@
+"""Enclosure packing: place a component inventory inside an envelope by simulated annealing.
+
+Hard constraints (overlap within `clearance`, keep-outs, the envelope) are
+penetration depths in mm, weighted far above the `near` and `low` preferences.
+
+    items = [item("battery", (58, 58, 15), rotate="any"), item("fan", (40, 40, 10), rotate="z"), ...]
+    best = pack(items, envelope, keepouts=[duct], near=[("gauge", "motor", 0, 2.0)], low={"battery": 1.0})
+    scene = to_solids(best[0], items)                      # draw with solids.draw_isometric
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from solids import AXES, bounds, box, oriented
+
+Item = namedtuple("Item", "name size rotate color")
+Placement = namedtuple("Placement", "boxes orient penalty score")
+
+# Axis permutations: a part's (x, y, z) extent is size[perm].
+PERMS = np.array([(0, 1, 2), (1, 0, 2), (0, 2, 1), (2, 0, 1), (1, 2, 0), (2, 1, 0)])
+_ROTATIONS = {None: [0], "z": [0, 1], "any": list(range(6))}
+HARD = 50.0     # energy per mm of penetration, against 1 per mm of soft preference
+
+
+def item(name, size, rotate=None, color="#888888"):
+    """A part of `size` (x, y, z mm) as drawn; rotate None (fixed), "z" (about the vertical) or "any"."""
+    if rotate not in _ROTATIONS:
+        raise ValueError(f"rotate must be one of {', '.join(map(repr, _ROTATIONS))}, not {rotate!r}")
+    return Item(name, tuple(map(float, size)), rotate, color)
+
+
+# ================================================================
+# Energy
+# ================================================================
+
+def _depth(lo_a, hi_a, lo_b, hi_b):
+    """Penetration depth of box pairs (smallest overlap over the axes, 0 if apart)."""
+    return np.clip(np.minimum(hi_a, hi_b) - np.maximum(lo_a, lo_b), 0, None).min(axis=-1)
+
+
+def _gap(lo_a, hi_a, lo_b, hi_b):
+    """Distance between box pairs (0 when they touch or overlap)."""
+    s = np.maximum(np.maximum(lo_b - hi_a, lo_a - hi_b), 0)
+    return np.sqrt((s * s).sum(axis=-1))
+
+
+class _Problem:
+    def __init__(self, items, envelope, keepouts, near, low, clearance):
+        self.names = [it.name for it in items]
+        index = {n: k for k, n in enumerate(self.names)}
+        self.size = np.array([it.size for it in items])
+        self.allowed = np.zeros((len(items), 6), dtype=bool)
+        for k, it in enumerate(items):
+            self.allowed[k, _ROTATIONS[it.rotate]] = True
+        self.clearance = clearance
+        # Envelope: inward half-planes of the convex profile, plus the extrusion range.
+        loop = oriented(envelope.loops[0], True)
+        edge = np.roll(loop, -1, axis=0) - loop
+        self.normal = np.column_stack([-edge[:, 1], edge[:, 0]]) / np.hypot(edge[:, 0], edge[:, 1])[:, None]
+        self.offset = np.sum(self.normal * loop, axis=1)
+        self.axes = AXES[envelope.axis]
+        self.extent = (envelope.lo, envelope.hi)
+        self.bounds = bounds([envelope])[0]
+        kb = bounds(list(keepouts)) if len(keepouts) else np.zeros((0, 2, 3))
+        self.keep_lo, self.keep_hi = kb[:, 0], kb[:, 1]
+        # Adjacency: part-to-part target gaps and weights as (n, n) tables, part-to-point as rows.
+        n = len(items)
+        self.pair_gap, self.pair_w = np.zeros((n, n)), np.zeros((n, n))
+        points = []
+        for rule in near:
+            a, b, *rest = rule
+            gap, weight = (tuple(rest) + (0.0, 1.0)[len(rest):])[:2]
+            if isinstance(b, str):
+                for p, q in ((index[a], index[b]), (index[b], index[a])):
+                    self.pair_gap[p, q], self.pair_w[p, q] = gap, self.pair_w[p, q] + weight
+            else:
+                points.append((index[a], *map(float, b), gap, weight))
+        points = np.array(points, dtype=float).reshape(-1, 6)
+        self.pt_part, self.pt_xyz = points[:, 0].astype(int), points[:, 1:4]
+        self.pt_gap, self.pt_w = points[:, 4], points[:, 5]
+        self.low_w = np.zeros(n)
+        for name, weight in low.items():
+            self.low_w[index[name]] = weight
+
+    def boxes(self, center, orient, parts=None):
+        """Box corners for centres (..., 3) and orientations; parts are the item indices (all by default)."""
+        size = self.size if parts is None else self.size[parts]
+        dims = np.take_along_axis(np.broadcast_to(size, orient.shape + (3,)), PERMS[orient], axis=-1)
+        return center - dims / 2, center + dims / 2
+
+    def terms(self, lo_k, hi_k, k, lo, hi):
+        """Energy terms of part k (one per chain) placed at lo_k, hi_k (K, 3) among boxes lo, hi (K, n, 3).
+
+        Returns its own (penalty, score), each (K,), and its penalty and
+        score against every other part, each (K, n) and 0 against itself.
+        """
+        # Envelope: the worst corner per profile edge is the low or high end of each axis, by the normal's sign.
+        a, b, c = self.axes
+        nu, nv = self.normal[:, 0], self.normal[:, 1]
+        reach = (np.where(nu > 0, lo_k[:, a:a + 1], hi_k[:, a:a + 1]) * nu
+                 + np.where(nv > 0, lo_k[:, b:b + 1], hi_k[:, b:b + 1]) * nv)      # (K, edges)
+        penalty = np.clip(self.offset - reach, 0, None).max(axis=-1)
+        penalty = np.maximum(penalty, np.clip(self.extent[0] - lo_k[:, c], 0, None))
+        penalty = np.maximum(penalty, np.clip(hi_k[:, c] - self.extent[1], 0, None))
+        if len(self.keep_lo):
+            penalty = penalty + _depth(lo_k[:, None], hi_k[:, None], self.keep_lo, self.keep_hi).sum(axis=1)
+        score = self.low_w[k] * (lo_k[:, 2] - self.bounds[0, 2])
+        if len(self.pt_part):
+            gap = _gap(lo_k[:, None], hi_k[:, None], self.pt_xyz, self.pt_xyz)                  # (K, rules)
+            w = np.where(self.pt_part == k[:, None], self.pt_w, 0.0)
+            score = score + (w * np.clip(gap - self.pt_gap, 0, None)).sum(axis=1)
+
+        half = self.clearance / 2
+        pair_pen = _depth(lo_k[:, None] - half, hi_k[:, None] + half, lo - half, hi + half)
+        pair_pen[np.arange(len(k)), k] = 0.0
+        pair_score = self.pair_w[k] * np.clip(_gap(lo_k[:, None], hi_k[:, None], lo, hi) - self.pair_gap[k], 0, None)
+        return penalty, score, pair_pen, pair_score
+
+    def energy(self, center, orient):
+        """(penalty mm, score) per chain for centres (K, n, 3) and orientations (K, n)."""
+        lo, hi = self.boxes(center, orient)
+        penalty, score = np.zeros(len(center)), np.zeros(len(center))
+        for p in range(lo.shape[1]):
+            pen, sc, pair_pen, pair_score = self.terms(lo[:, p], hi[:, p], np.full(len(center), p), lo, hi)
+            penalty += pen + pair_pen[:, p + 1:].sum(axis=1)
+            score += sc + pair_score[:, p + 1:].sum(axis=1)
+        return penalty, score
+
+
+# ================================================================
+# Search
+# ================================================================
+
+def pack(items, envelope, keepouts=(), near=(), low=None, clearance=2.0,
+         chains=2048, steps=1500, best=5, seed=0, tol=5.0):
+    """Anneal `chains` arrangements at once; the `best` distinct ones, lowest energy first.
+
+    near: (part, part name or (x, y, z) point[, gap[, weight]]) preferences.
+    low: {part: weight} pulls parts toward the envelope floor. Arrangements
+    whose parts all lie within `tol` mm of a better one count as the same.
+    """
+    prob = _Problem(items, envelope, list(keepouts), near, low or {}, clearance)
+    rng = np.random.default_rng(seed)
+    n = len(items)
+    span = prob.bounds[1] - prob.bounds[0]
+    center = prob.bounds[0] + rng.random((chains, n, 3)) * span
+    orient = _random_orient(rng, prob.allowed, np.broadcast_to(np.arange(n), (chains, n)))
+    lo, hi = prob.boxes(center, orient)
+    rows = np.arange(chains)
+    # Per-part terms (K, n) and pair terms (K, n, n), so a move re-evaluates only the part it moved.
+    own = np.zeros((chains, n))
+    pair = np.zeros((chains, n, n))
+    for p in range(n):
+        pen, sc, pair_pen, pair_score = prob.terms(lo[:, p], hi[:, p], np.full(chains, p), lo, hi)
+        own[:, p] = HARD * pen + sc
+        pair[:, p] = HARD * pair_pen + pair_score
+    energy = own.sum(axis=1) + pair.sum(axis=(1, 2)) / 2
+    best_c, best_o, best_e = center.copy(), orient.copy(), energy.copy()
+    t0 = max(float(np.median(energy)), 1.0)
+    t1 = t0 * 1e-4
+    for step in range(steps):
+        frac = step / max(steps - 1, 1)
+        temp = t0 * (t1 / t0) ** frac
+        k = rng.integers(n, size=chains)
+        sigma = span * (0.01 + 0.25 * (1 - frac))
+        c_k = np.clip(center[rows, k] + rng.normal(size=(chains, 3)) * sigma, prob.bounds[0], prob.bounds[1])
+        o_k = orient[rows, k].copy()
+        turn = rng.random(chains) < 0.1
+        o_k[turn] = _random_orient(rng, prob.allowed, k[turn])
+        lo_k, hi_k = prob.boxes(c_k, o_k, k)
+        pen, sc, pair_pen, pair_score = prob.terms(lo_k, hi_k, k, lo, hi)
+        own_k = HARD * pen + sc
+        pair_k = HARD * pair_pen + pair_score
+        delta = own_k - own[rows, k] + pair_k.sum(axis=1) - pair[rows, k].sum(axis=1)
+        accept = (delta <= 0) | (rng.random(chains) < np.exp(np.minimum(-delta, 0) / temp))
+        r, kk = rows[accept], k[accept]
+        center[r, kk], orient[r, kk] = c_k[accept], o_k[accept]
+        lo[r, kk], hi[r, kk] = lo_k[accept], hi_k[accept]
+        own[r, kk] = own_k[accept]
+        pair[r, kk], pair[r, :, kk] = pair_k[accept], pair_k[accept]
+        energy[accept] += delta[accept]
+        better = energy < best_e - 1e-9
+        best_c[better], best_o[better], best_e[better] = center[better], orient[better], energy[better]
+
+    penalty, score = prob.energy(best_c, best_o)
+    lo, hi = prob.boxes(best_c, best_o)
+    out, seen = [], []
+    for c in np.argsort(HARD * penalty + score, kind="stable"):
+        if any(np.abs(best_c[c] - best_c[s]).max() < tol and (best_o[c] == best_o[s]).all() for s in seen):
+            continue
+        seen.append(c)
+        out.append(Placement({name: (tuple(lo[c, k].tolist()), tuple(hi[c, k].tolist()))
+                              for k, name in enumerate(prob.names)},
+                             {name: tuple(PERMS[best_o[c, k]].tolist()) for k, name in enumerate(prob.names)},
+                             float(penalty[c]), float(score[c])))
+        if len(out) == best:
+            break
+    return out
+
+
+def _random_orient(rng, allowed, parts):
+    """A random allowed orientation for each entry of `parts` (item indices, any shape)."""
+    keys = rng.random(np.shape(parts) + (6,)) * allowed[parts]
+    return keys.argmax(axis=-1)
+
+
+def to_solids(placement, items, alpha=1.0):
+    """Boxes for the solids renderer, one per part, in the placement's positions and colours."""
+    colors = {it.name: it.color for it in items}
+    return [box(name, lo, hi, colors[name], alpha=alpha) for name, (lo, hi) in placement.boxes.items()]
+
+
+def report(placements):
+    """One block per placement: penalty, score, and each part's position and orientation."""
+    lines = []
+    for k, p in enumerate(placements):
+        state = "feasible" if p.penalty < 0.5 else f"infeasible ({p.penalty:.1f} mm overlap/outside)"
+        lines.append(f"#{k + 1}  score {p.score:.1f}  {state}")
+        for name, (lo, hi) in p.boxes.items():
+            size = "×".join(f"{h - l:.0f}" for l, h in zip(lo, hi))
+            lines.append(f"    {name:<10} at ({lo[0]:6.1f}, {lo[1]:6.1f}, {lo[2]:6.1f})  {size} mm")
+    return lines
@@ -0,0 +1,81 @@
+"""Split card lists across slides when they overflow their frame.
+
+Builders measure each item once (text_metrics caches the string widths),
+then split() walks the heights in a single pass and returns the pages. Each
+page keeps the global index of its items, so numbering (circle_num, "3.") runs
+on across continuation slides instead of restarting at 1. Cost is linear in the
+number of items; nothing is re-measured when a page boundary moves.
+"""
+
+from collections import namedtuple
+
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches, Pt
+
+from text_metrics import text_height
+
+# One page: items[start:stop], each drawn at offsets[k] below the frame top.
+Page = namedtuple("Page", "start stop offsets")
+
+
+def block_height(parts, width_pt, pad_pt=0.0, gap_pt=0.0, min_pt=0.0):
+    """Height in points of a stacked block of (text, size, bold) parts."""
+    h = sum(text_height(t, size, width_pt, bold) for t, size, bold in parts)
+    h += gap_pt * max(0, len(parts) - 1) + 2 * pad_pt
+    return max(min_pt, h)
+
+
+def split(heights, capacity, gap=0.0):
+    """Greedy page split of item heights into frames of the given capacity.
+
+    An item taller than a whole page gets a page to itself rather than being
+    dropped.
+    """
+    pages = []
+    start, used, offsets = 0, 0.0, []
+    for i, h in enumerate(heights):
+        y = used + (gap if offsets else 0.0)
+        if offsets and y + h > capacity:
+            pages.append(Page(start, i, tuple(offsets)))
+            start, used, offsets = i, 0.0, []
+            y = 0.0
+        offsets.append(y)
+        used = y + h
+    if offsets or not pages:
+        pages.append(Page(start, len(heights), tuple(offsets)))
+    return pages
+
+
+def paged(slide, heights, top, bottom, gap, new_slide):
+    """Yield (slide, index, y) for items stacked between top and bottom (EMU).
+
+    heights are in points. Items that do not fit go onto slides returned by
+    new_slide(); the index is global, so numbering runs on across slides.
+    """
+    pages = split(heights, (bottom - top) / 12700, gap / 12700)
+    for n, page in enumerate(pages):
+        if n:
+            slide = new_slide()
+        for i, offset in zip(range(page.start, page.stop), page.offsets):
+            yield slide, i, top + Pt(offset)
+
+
+def continuation_slide(prs, title, color, background, text_color=RGBColor(0xFF, 0xFF, 0xFF)):
+    """Fresh slide for content that overflowed the slide titled `title`, in the deck's colours."""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.background.fill.solid()
+    slide.background.fill.fore_color.rgb = background
+    strip = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, Inches(0.06))
+    strip.fill.solid()
+    strip.fill.fore_color.rgb = color
+    strip.line.fill.background()
+    tf = slide.shapes.add_textbox(Inches(0.8), Inches(0.4), Inches(11), Inches(0.8)).text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = f"{title} (cont.)"
+    p.font.size = Pt(32)
+    p.font.color.rgb = text_color
+    p.font.bold = True
+    p.font.name = "Calibri"
+    return slide
@@ -0,0 +1,73 @@
+"""Vector placement of matplotlib figures on ReportLab pages.
+
+draw_figure() places a figure's PDF twin (same stem, ".pdf") as a form
+XObject, fitted like image_fit ("contain" / "cover" / "stretch" plus an
+alignment); without the twin, or without pdfrw, it draws the PNG.
+
+    draw_figure(c, os.path.join(_DIR, "arrangement_options.png"), x, y, w, h)
+"""
+
+import os
+import warnings
+from functools import lru_cache
+
+from image_fit import draw_image, file_digest, fit
+
+
+def vector_twin(path):
+    """The PDF saved alongside a raster figure, or None."""
+    pdf = os.path.splitext(path)[0] + ".pdf"
+    return pdf if os.path.exists(pdf) else None
+
+
+@lru_cache(maxsize=32)
+def _form(digest, path):
+    from pdfrw import PdfReader
+    from pdfrw.buildxobj import pagexobj
+    return pagexobj(PdfReader(path).pages[0])
+
+
+def form(path):
+    """(xobject, width_pt, height_pt) for the first page of a PDF, cached by content."""
+    xobj = _form(file_digest(path), os.path.abspath(path))
+    x0, y0, x1, y1 = (float(v) for v in xobj.BBox)
+    return xobj, x1 - x0, y1 - y0
+
+
+def draw_figure(c, path, x, y, width, height, mode="contain", align="center"):
+    """Place a figure in a frame as vector content when a PDF twin exists.
+
+    Returns True when the vector form was used, False for the raster fallback.
+    """
+    pdf = path if path.endswith(".pdf") else vector_twin(path)
+    try:
+        from pdfrw.toreportlab import makerl
+    except ImportError:
+        makerl = None
+    if pdf is None or makerl is None:
+        if path.endswith(".pdf"):
+            raise ImportError("Vector figures need pdfrw: pip install pdfrw")
+        if pdf is not None:
+            warnings.warn(f"pdfrw is not installed; drawing {os.path.basename(path)} as a raster "
+                          f"(pip install pdfrw)", stacklevel=2)
+        draw_image(c, path, x, y, width, height, mode, align)
+        return False
+
+    xobj, fw, fh = form(pdf)
+    p = fit(fw, fh, width, height, mode, align)
+    l, t, r, b = p.crop
+    # Scale the whole figure so its uncropped part fills the placement.
+    sx = p.width / (fw * (1 - l - r))
+    sy = p.height / (fh * (1 - t - b))
+    name = makerl(c, xobj)
+    c.saveState()
+    if any(p.crop):
+        clip = c.beginPath()
+        clip.rect(x + p.left, y + height - p.top - p.height, p.width, p.height)
+        c.clipPath(clip, stroke=0, fill=0)
+    c.translate(x + p.left - fw * l * sx, y + height - p.top - p.height - fh * b * sy)
+    c.scale(sx, sy)
+    c.translate(-float(xobj.BBox[0]), -float(xobj.BBox[1]))
+    c.doForm(name)
+    c.restoreState()
+    return True
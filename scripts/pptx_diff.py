@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Structural diff between two PPTX builds — no rendering, no PowerPoint.
+
+Every slide is reduced to a list of shape fingerprints (kind, geometry, text
+with run formatting, solid fill colour, picture SHA-1) plus a slide hash over
+those. Slides are aligned on their hashes, so an inserted slide shows up as one
+addition rather than "every later slide changed"; shapes inside a changed slide
+are aligned the same way.
+
+Usage:
+    python3 pptx_diff.py old.pptx new.pptx
+    python3 pptx_diff.py old.pptx new.pptx --json
+
+Exit status is 0 when the decks are structurally identical, 1 otherwise.
+slide_hashes() is the same fingerprint as a list, for build steps that want to
+check whether a saved deck still matches what they expect.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from difflib import SequenceMatcher
+
+from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+
+def _color(fill):
+    """Hex colour of a solid fill, or None."""
+    try:
+        if fill.type == MSO_FILL.SOLID:
+            return str(fill.fore_color.rgb)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _runs(shape):
+    """Text plus the run formatting that changes how it renders."""
+    if not shape.has_text_frame:
+        return None
+    out = []
+    for p in shape.text_frame.paragraphs:
+        runs = []
+        for r in p.runs:
+            f = r.font
+            try:
+                color = str(f.color.rgb) if f.color and f.color.type is not None else None
+            except AttributeError:
+                color = None
+            runs.append((r.text, f.size, f.bold, f.name, color))
+        out.append((p.alignment, p.level, tuple(runs)))
+    return tuple(out)
+
+
+def _image(shape):
+    """SHA-1 of a picture's embedded image, "linked" for a picture whose image is an external link."""
+    try:
+        return shape.image.sha1
+    except AttributeError:      # not a picture
+        return None
+    except ValueError:          # linked, not embedded: nothing in the package to hash
+        return "linked"
+
+
+def _walk(shapes):
+    """Every shape, group members after their group (recursively)."""
+    for shape in shapes:
+        yield shape
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _walk(shape.shapes)
+
+
+def shape_record(shape):
+    """Fingerprintable description of one shape."""
+    rec = {
+        "name": shape.name,
+        "kind": str(shape.shape_type),
+        "geom": (shape.left, shape.top, shape.width, shape.height),
+        "text": shape.text_frame.text if shape.has_text_frame else None,
+    }
+    runs = _runs(shape)
+    fill = _color(shape.fill) if hasattr(shape, "fill") else None
+    image = _image(shape)
+    rec["hash"] = hashlib.sha1(repr((rec["kind"], rec["geom"], runs, fill, image)).encode()).hexdigest()
+    return rec
+
+
+def slide_records(path):
+    """[(slide_hash, [shape_record, ...]), ...] for a deck."""
+    prs = Presentation(path)
+    slides = []
+    for slide in prs.slides:
+        shapes = [{"name": "(background)", "kind": "BACKGROUND", "geom": None, "text": None,
+                   "hash": str(_color(slide.background.fill))}]
+        shapes += [shape_record(s) for s in _walk(slide.shapes)]
+        h = hashlib.sha1("".join(s["hash"] for s in shapes).encode()).hexdigest()
+        slides.append((h, shapes))
+    return slides
+
+
+def slide_hashes(path):
+    """One content hash per slide, in order."""
+    return [h for h, _ in slide_records(path)]
+
+
+def _title(shapes):
+    for s in shapes:
+        if s["text"]:
+            return s["text"].splitlines()[0][:60]
+    return ""
+
+
+def _align(a, b):
+    """Yield (op, a_index | None, b_index | None) aligning two hash lists."""
+    sm = SequenceMatcher(None, a, b, autojunk=False)
+    for op, i1, i2, j1, j2 in sm.get_opcodes():
+        if op == "equal":
+            continue
+        pairs = min(i2 - i1, j2 - j1) if op == "replace" else 0
+        for k in range(pairs):
+            yield "modified", i1 + k, j1 + k
+        for i in range(i1 + pairs, i2):
+            yield "removed", i, None
+        for j in range(j1 + pairs, j2):
+            yield "added", None, j
+
+
+def diff_decks(old_path, new_path):
+    """Structural differences between two decks as a list of dicts."""
+    old, new = slide_records(old_path), slide_records(new_path)
+    changes = []
+    for op, i, j in _align([h for h, _ in old], [h for h, _ in new]):
+        if op != "modified":
+            shapes = old[i][1] if op == "removed" else new[j][1]
+            changes.append({"op": op, "old_slide": None if i is None else i + 1,
+                            "new_slide": None if j is None else j + 1,
+                            "title": _title(shapes)})
+            continue
+        a, b = old[i][1], new[j][1]
+        shape_changes = []
+        for sop, si, sj in _align([s["hash"] for s in a], [s["hash"] for s in b]):
+            ref = b[sj] if sj is not None else a[si]
+            entry = {"op": sop, "name": ref["name"], "kind": ref["kind"]}
+            if sop == "modified":
+                entry["fields"] = [f for f in ("geom", "text") if a[si][f] != b[sj][f]] or ["style"]
+            shape_changes.append(entry)
+        changes.append({"op": "modified", "old_slide": i + 1, "new_slide": j + 1,
+                        "title": _title(b), "shapes": shape_changes})
+    return changes
+
+
+def format_changes(changes):
+    lines = []
+    for c in changes:
+        where = f"slide {c['old_slide']}" if c["op"] == "removed" else f"slide {c['new_slide']}"
+        if c["op"] == "modified" and c["old_slide"] != c["new_slide"]:
+            where += f" (was {c['old_slide']})"
+        lines.append(f"{c['op'].upper():9s} {where}  {c['title']}")
+        for s in c.get("shapes", []):
+            extra = f"  [{', '.join(s['fields'])}]" if "fields" in s else ""
+            lines.append(f"    {s['op']:9s} {s['name']}{extra}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structural diff of two PPTX files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--json", action="store_true", help="print changes as JSON")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    changes = diff_decks(args.old, args.new)
+    elapsed = (time.perf_counter() - t0) * 1000
+
+    if args.json:
+        print(json.dumps(changes, indent=2))
+    elif changes:
+        print(format_changes(changes))
+        print(f"\n{len(changes)} slide(s) differ  ({elapsed:.0f} ms)")
+    else:
+        print(f"No structural differences  ({elapsed:.0f} ms)")
+    sys.exit(1 if changes else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Shared drawing primitives: boxes, labelled boxes, arrows, dimension lines.
+
+box() takes FancyBboxPatch's arguments with the corner unpacked; its outline
+is computed once per (width, height, boxstyle) and translated to each placement.
+
+    batch = Batch(ax)
+    batch.add(box(x, y, w, h, boxstyle="round,pad=0.04", facecolor=fill, edgecolor=border))
+    rbox(ax, batch, x, y, w, h, "PCBA", "nRF52832", fill)   # box + centred label and sublabel
+    dimline(ax, batch, x1, y, x2, y, "246mm (base)", color=DIM)
+    batch.flush()
+"""
+
+from functools import lru_cache
+
+from matplotlib.patches import BoxStyle, FancyArrowPatch, PathPatch
+from matplotlib.path import Path
+
+TEXT = "#1a1a1a"
+SUBTEXT = "#666666"
+
+
+# ================================================================
+# Cached geometry
+# ================================================================
+
+@lru_cache(maxsize=4096)
+def _box_outline(w, h, boxstyle):
+    path = BoxStyle(boxstyle)(0.0, 0.0, w, h, 1.0)
+    verts = path.vertices.copy()
+    verts.flags.writeable = False
+    return verts, path.codes
+
+
+def box_path(x, y, w, h, boxstyle="round,pad=0.04"):
+    """Outline of a `boxstyle` box with its lower-left corner at (x, y)."""
+    verts, codes = _box_outline(float(w), float(h), boxstyle)
+    return Path(verts + (x, y), codes)
+
+
+def box(x, y, w, h, boxstyle="round,pad=0.04", **kwargs):
+    """PathPatch drawn like FancyBboxPatch((x, y), w, h, boxstyle=...); kwargs are patch styles."""
+    return PathPatch(box_path(x, y, w, h, boxstyle), **kwargs)
+
+
+def cache_info():
+    return _box_outline.cache_info()
+
+
+# ================================================================
+# Figure helpers
+# ================================================================
+
+def setup(ax, title, sub, xlim, ylim, color, face="#FFFFFF", sub_color="#555555"):
+    """White, equal-aspect, axis-free view with a title and an italic subtitle at the top."""
+    ax.set_facecolor(face); ax.set_xlim(*xlim); ax.set_ylim(*ylim)
+    ax.set_aspect("equal"); ax.axis("off")
+    ax.text((xlim[0]+xlim[1])/2, ylim[1]-0.3, title, color=color, fontsize=13,
+            fontweight="bold", ha="center")
+    ax.text((xlim[0]+xlim[1])/2, ylim[1]-0.9, sub, color=sub_color, fontsize=8,
+            ha="center", style="italic")
+
+
+def rbox(ax, batch, x, y, w, h, label, sub, fill, border=None, fs=7.5, alpha=0.85,
+         text_color=TEXT, sub_color=SUBTEXT):
+    """Rounded component box with a bold label and an optional small sublabel."""
+    batch.add(box(x, y, w, h, boxstyle="round,pad=0.04", facecolor=fill,
+                  edgecolor=border or "#667788", linewidth=1.2, alpha=alpha))
+    ax.text(x+w/2, y+h/2+0.1, label, color=text_color, fontsize=fs,
+            fontweight="bold", ha="center", va="center")
+    if sub:
+        ax.text(x+w/2, y+h/2-0.2, sub, color=sub_color, fontsize=5,
+                ha="center", va="center")
+
+
+def arrow(batch, x1, y1, x2, y2, style, color, lw, alpha=None, mutation_scale=10, zorder=3):
+    """Same arrow as ax.annotate("", ...) draws, queued on a Batch."""
+    return batch.arrow(FancyArrowPatch((x1, y1), (x2, y2), arrowstyle=style, color=color, lw=lw,
+                                       alpha=alpha, mutation_scale=mutation_scale, zorder=zorder))
+
+
+def dimline(ax, batch, x1, y1, x2, y2, label, color, off=0.2, side="auto", fs=6):
+    """Double-headed dimension line with its label beside it; returns the label Text."""
+    arrow(batch, x1, y1, x2, y2, "<->", color, 0.9)
+    mx, my = (x1+x2)/2, (y1+y2)/2
+    if side == "left":
+        return ax.text(mx-off-0.1, my, label, color=color, fontsize=fs, ha="right", va="center")
+    if side == "right" or abs(x2-x1) <= abs(y2-y1):
+        return ax.text(mx+off+0.1, my, label, color=color, fontsize=fs, ha="left", va="center")
+    return ax.text(mx, my+off, label, color=color, fontsize=fs, ha="center")
+
+
+def farrow(ax, batch, x1, y1, x2, y2, label, color):
+    """Flow arrow (air, liquid) with an optional label above its midpoint."""
+    arrow(batch, x1, y1, x2, y2, "-|>", color, 1.8)
+    if label:
+        mx, my = (x1+x2)/2, (y1+y2)/2
+        ax.text(mx, my+0.25, label, color=color, fontsize=5.5, ha="center")
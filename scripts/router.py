@@ -0,0 +1,356 @@
+"""Orthogonal edge routing for block diagram specs.
+
+Straight anchor-to-anchor arrows cut through whatever sits between two blocks.
+route() instead finds axis-aligned polylines that go around every block:
+
+  1. Track grid: one track line along each side of every block (grown by the
+     theme padding plus "clearance"), midway between neighbouring side lines
+     so routes run down the middle of channels, and through each port. Which grid
+     nodes and grid segments lie inside a block is worked out once, with
+     numpy broadcasting over all blocks.
+  2. A* over (node, heading) states. Cost = length + a penalty per bend +
+     a crowding penalty on segments other edges already use. Segments already
+     carrying an edge to the same target are discounted instead, so fan-in
+     edges (four sensors into one MCU) merge into a trunk.
+  3. Bundles: several edges between the same pair of blocks are routed once
+     and drawn as parallel lanes "lane" apart.
+
+place_labels() then puts each edge label on the longest free stretch of its
+route, checking candidates against blocks and already-placed labels through a
+spatial.GridIndex (uniform-cell hash), so labels never sit on a block.
+
+Routes are cached by a hash of the block boxes, edges and parameters.
+"""
+
+import hashlib
+import heapq
+import json
+
+import numpy as np
+
+from spatial import GridIndex
+
+DEFAULTS = {
+    "clearance": 0.12,   # space between a route and a block, beyond the block padding
+    "bend": 0.6,         # cost of one 90-degree turn, in canvas units of length
+    "crowd": 0.5,        # extra cost per other edge already on a segment (x length)
+    "share": 0.6,        # cost factor on segments already leading to the same target
+    "lane": 0.08,        # spacing of parallel edges in a bundle
+    "ports": [0.5, 0.25, 0.75],   # port positions along each side, preferred first
+    "greed": 1.5,        # >1 weights the A* heuristic: faster, routes up to that factor longer
+    "margin": 0.1,
+}
+
+# Headings: +x, -x, +y, -y.
+_REVERSE = (1, 0, 3, 2)
+
+_CACHE = {}
+
+
+# ================================================================
+# Track grid
+# ================================================================
+
+def _ports(rect, params, xs=None, ys=None):
+    """(anchor, stub, heading, cost) for ports on each side of a padded block rect.
+
+    Without track arrays: the fixed "ports" positions (these seed the track
+    grid). With them: every track crossing the middle 80% of a side, so a
+    route can leave or enter straight in line with its other end. Ports cost
+    a little more the further they sit from the centre of their side.
+    """
+    x0, y0, x1, y1 = rect
+    c = params["clearance"]
+    if xs is None:
+        along_x = along_y = params["ports"]
+        along_x = [x0 + f * (x1 - x0) for f in along_x]
+        along_y = [y0 + f * (y1 - y0) for f in along_y]
+    else:
+        along_x = xs[(xs >= x0 + 0.1 * (x1 - x0)) & (xs <= x1 - 0.1 * (x1 - x0))].tolist()
+        along_y = ys[(ys >= y0 + 0.1 * (y1 - y0)) & (ys <= y1 - 0.1 * (y1 - y0))].tolist()
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    out = []
+    for px in along_x:
+        cost = 0.2 * abs(px - cx) / (x1 - x0)
+        out += [((px, y0), (px, y0 - c), 3, cost), ((px, y1), (px, y1 + c), 2, cost)]
+    for py in along_y:
+        cost = 0.2 * abs(py - cy) / (y1 - y0)
+        out += [((x0, py), (x0 - c, py), 1, cost), ((x1, py), (x1 + c, py), 0, cost)]
+    return out
+
+
+class _Grid:
+    def __init__(self, rects, width, height, params, extra_x, extra_y):
+        c, m = params["clearance"], params["margin"]
+        inf = np.array(rects, dtype=float).reshape(-1, 4) + [-c, -c, c, c]
+
+        def tracks(lo, hi, extra, top):
+            t = np.unique(np.clip(np.concatenate([lo, hi, [m, top - m]]), m, top - m).round(4))
+            mid = (t[1:] + t[:-1]) / 2
+            return np.unique(np.clip(np.concatenate([t, mid, extra]), m, top - m).round(4))
+
+        self.xs = tracks(inf[:, 0], inf[:, 2], extra_x, width)
+        self.ys = tracks(inf[:, 1], inf[:, 3], extra_y, height)
+
+        def inside(px, py):
+            px, py = px[:, None, None], py[None, :, None]
+            eps = 1e-6
+            return ((px > inf[:, 0] + eps) & (px < inf[:, 2] - eps)
+                    & (py > inf[:, 1] + eps) & (py < inf[:, 3] - eps)).any(axis=2)
+
+        xs, ys = self.xs, self.ys
+        free = ~inside(xs, ys)
+        mx, my = (xs[1:] + xs[:-1]) / 2, (ys[1:] + ys[:-1]) / 2
+        h_ok = free[:-1, :] & free[1:, :] & ~inside(mx, ys)      # (i, j) -> (i + 1, j)
+        v_ok = free[:, :-1] & free[:, 1:] & ~inside(xs, my)      # (i, j) -> (i, j + 1)
+        self.free = free
+
+        # Per node and heading: neighbour node index, or -1.
+        nx, ny = len(xs), len(ys)
+        self.nx, self.ny = nx, ny
+        idx = np.arange(nx * ny).reshape(nx, ny)
+        nbr = np.full((nx, ny, 4), -1, dtype=int)
+        nbr[:-1, :, 0] = np.where(h_ok, idx[1:, :], -1)
+        nbr[1:, :, 1] = np.where(h_ok, idx[:-1, :], -1)
+        nbr[:, :-1, 2] = np.where(v_ok, idx[:, 1:], -1)
+        nbr[:, 1:, 3] = np.where(v_ok, idx[:, :-1], -1)
+        px, py = np.repeat(xs, ny), np.tile(ys, nx)
+        self.px, self.py = px.tolist(), py.tolist()
+        # Adjacency as Python lists for the search loop: (heading, node, length, segment id).
+        nbr = nbr.reshape(-1, 4)
+        self.adj = [[] for _ in range(nx * ny)]
+        for n, d in zip(*np.nonzero(nbr >= 0)):
+            m = int(nbr[n, d])
+            self.adj[n].append((int(d), m, float(abs(px[m] - px[n]) + abs(py[m] - py[n])),
+                                self.segment(int(n), m)))
+
+    @staticmethod
+    def segment(a, b):
+        """Id shared by both directions of the grid segment a-b."""
+        return a * (1 << 32) + b if a < b else b * (1 << 32) + a
+
+    def node(self, x, y):
+        i = int(np.searchsorted(self.xs, round(x, 4)))
+        j = int(np.searchsorted(self.ys, round(y, 4)))
+        if i < self.nx and j < self.ny and self.xs[i] == round(x, 4) and self.ys[j] == round(y, 4):
+            return i * self.ny + j if self.free[i, j] else None
+        return None
+
+
+def _astar(grid, starts, goals, usage, target, trunk, params):
+    """Cheapest orthogonal path. starts: [(node, heading, cost)]; goals: {node: (heading_in, cost)}.
+
+    The heuristic is the Manhattan distance to the goals' bounding box, scaled
+    by "share" only when discounted trunk segments toward this target exist.
+    """
+    bend, crowd, share = params["bend"], params["crowd"], params["share"]
+    px, py, adj = grid.px, grid.py, grid.adj
+    heappush, heappop, inf = heapq.heappush, heapq.heappop, float("inf")
+    gx0, gx1 = min(px[n] for n in goals), max(px[n] for n in goals)
+    gy0, gy1 = min(py[n] for n in goals), max(py[n] for n in goals)
+    scale = (share if trunk else 1.0) * params["greed"]
+
+    def h(n):
+        x, y = px[n], py[n]
+        dx, dy = max(gx0 - x, 0, x - gx1), max(gy0 - y, 0, y - gy1)
+        # Off both axes of the goal box means at least one turn is still needed.
+        return scale * (dx + dy) + (bend if dx and dy else 0)
+
+    best, parent, heap = {}, {}, []
+    for n, d, c in starts:
+        s = n * 4 + d
+        if c < best.get(s, float("inf")):
+            best[s], parent[s] = c, None
+            heapq.heappush(heap, (c + h(n), -c, s))
+    done = None
+    while heap:
+        _, g, s = heappop(heap)
+        g = -g              # ties on f pop the deepest state first
+        if s < 0:            # end state for goal node -s - 2: nothing cheaper is left
+            done = s
+            break
+        if g > best.get(s, inf):
+            continue
+        n, d = divmod(s, 4)
+        if n in goals:
+            heading, extra = goals[n]
+            end = -n - 2
+            total = g + extra + (0 if d == heading else bend)
+            if total < best.get(end, float("inf")):
+                best[end], parent[end] = total, s
+                heapq.heappush(heap, (total, -total, end))
+        rev = _REVERSE[d]
+        for d2, m, length, seg in adj[n]:
+            if d2 == rev:
+                continue
+            users = usage.get(seg)
+            if users is None:
+                cost = length
+            elif target in users:
+                cost = length * share
+            else:
+                cost = length * (1 + crowd * len(users))
+            if d2 != d:
+                cost += bend
+            s2, g2 = m * 4 + d2, g + cost
+            if g2 < best.get(s2, inf):
+                best[s2], parent[s2] = g2, s
+                heappush(heap, (g2 + h(m), -g2, s2))
+    if done is None:
+        return None
+    nodes, s = [], parent[done]
+    while s is not None:
+        nodes.append(s // 4)
+        s = parent[s]
+    return nodes[::-1]
+
+
+def _simplify(points):
+    """Drop repeated and collinear interior points."""
+    out = []
+    for p in points:
+        if out and abs(p[0] - out[-1][0]) < 1e-9 and abs(p[1] - out[-1][1]) < 1e-9:
+            continue
+        if len(out) >= 2:
+            a, b = out[-2], out[-1]
+            if (abs(a[0] - b[0]) < 1e-9 and abs(b[0] - p[0]) < 1e-9) or \
+               (abs(a[1] - b[1]) < 1e-9 and abs(b[1] - p[1]) < 1e-9):
+                out[-1] = p
+                continue
+        out.append(p)
+    return out
+
+
+def _offset(points, o):
+    """Shift an orthogonal polyline sideways by o (left of travel direction)."""
+    if not o:
+        return points
+    normals = []
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        dx, dy = np.sign(x1 - x0), np.sign(y1 - y0)
+        normals.append((-dy * o, dx * o))
+    out = []
+    for k, (x, y) in enumerate(points):
+        a = normals[k - 1] if k else (0, 0)
+        b = normals[k] if k < len(normals) else (0, 0)
+        # Right-angle corner: shift along both normals; ends / straights: one.
+        nx = a[0] + b[0] if a[0] != b[0] else a[0]
+        ny = a[1] + b[1] if a[1] != b[1] else a[1]
+        out.append((x + nx, y + ny))
+    return out
+
+
+# ================================================================
+# Public API
+# ================================================================
+
+def route(boxes, edges, width, height, pad=0.0, params=None):
+    """Orthogonal routes for edges between blocks.
+
+    boxes: {block_id: (x, y, w, h)}; edges: [(from_id, to_id)]; pad: the
+    theme's drawn block padding; routes start and end on the drawn outline.
+    Returns one tuple of (x, y) points per edge, or None where no route
+    exists. Cached.
+    """
+    p = dict(DEFAULTS)
+    p.update(params or {})
+    key = hashlib.sha1(json.dumps([sorted(boxes.items()), edges, width, height, pad, p],
+                                  sort_keys=True).encode()).hexdigest()
+    if key in _CACHE:
+        return _CACHE[key]
+
+    rects = {bid: (x - pad, y - pad, x + w + pad, y + h + pad) for bid, (x, y, w, h) in boxes.items()}
+    seeds = [port for r in rects.values() for port in _ports(r, p)]
+    grid = _Grid(list(rects.values()), width, height, p,
+                 [stub[0] for _, stub, _, _ in seeds], [stub[1] for _, stub, _, _ in seeds])
+    ports = {bid: _ports(r, p, grid.xs, grid.ys) for bid, r in rects.items()}
+
+    def endpoints(bid, outgoing):
+        out = {}
+        for anchor, stub, heading, cost in ports[bid]:
+            n = grid.node(*stub)
+            if n is not None and (n not in out or cost < out[n][2]):
+                out[n] = (anchor, heading if outgoing else _REVERSE[heading], cost)
+        return out
+
+    usage, trunks, bundles, routes = {}, set(), {}, []
+    for src, dst in edges:
+        pair = (src, dst) if src <= dst else (dst, src)
+        if pair in bundles:
+            base, flip = bundles[pair]
+            lane = sum(1 for e in edges[:len(routes)] if tuple(sorted(e)) == pair)
+            pts = base if (src, dst) == (pair if not flip else pair[::-1]) else base[::-1]
+            routes.append(tuple(_offset(pts, lane * p["lane"])) if pts else None)
+            continue
+        if src not in rects or dst not in rects:
+            routes.append(None)
+            continue
+        sp, gp = endpoints(src, True), endpoints(dst, False)
+        starts = [(n, d, c) for n, (_, d, c) in sp.items()]
+        goals = {n: (d, c) for n, (_, d, c) in gp.items()}
+        nodes = _astar(grid, starts, goals, usage, dst, dst in trunks, p) if starts and goals else None
+        if not nodes:
+            bundles[pair] = (None, False)
+            routes.append(None)
+            continue
+        for a, b in zip(nodes, nodes[1:]):
+            usage.setdefault(grid.segment(a, b), set()).add(dst)
+        trunks.add(dst)
+        pts = [sp[nodes[0]][0]] + [(grid.px[n], grid.py[n]) for n in nodes] + [gp[nodes[-1]][0]]
+        pts = _simplify([(round(x, 4), round(y, 4)) for x, y in pts])
+        bundles[pair] = (pts, (src, dst) != pair)
+        routes.append(tuple(pts))
+    _CACHE[key] = routes
+    return routes
+
+
+def text_extent(text, size):
+    """Rough (width, height) of a text label in canvas units.
+
+    Diagrams are drawn at one inch per canvas unit on an axes that covers
+    about 77% of the figure, so points convert at 1 / (72 * 0.77).
+    """
+    lines = text.split("\n")
+    scale = size / 72 / 0.77
+    return max(len(s) for s in lines) * 0.58 * scale, len(lines) * 1.25 * scale
+
+
+def place_labels(routes, labels, boxes, pad=0.0, va="center", gap=0.05):
+    """Label position for each route: the longest segment stretch that is free.
+
+    labels: [(text, size)] aligned with routes (text may be empty). Returns
+    [(x, y) or None]. Candidates are tried on each segment's midpoint, then
+    either side of it; the first that overlaps no block and no earlier label
+    wins, otherwise the least-overlapping one.
+    """
+    index = GridIndex()
+    for x, y, w, h in boxes.values():
+        index.insert((x - pad, y - pad, x + w + pad, y + h + pad))
+    out = []
+    for pts, (text, size) in zip(routes, labels):
+        if not pts or not text:
+            out.append(None)
+            continue
+        w, h = text_extent(text, size)
+        segs = sorted(zip(pts, pts[1:]),
+                      key=lambda s: -(abs(s[1][0] - s[0][0]) + abs(s[1][1] - s[0][1])))
+        best = None
+        for (x0, y0), (x1, y1) in segs:
+            mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+            horizontal = abs(y1 - y0) < 1e-9
+            side = [(0, 0), (0, h / 2 + gap), (0, -h / 2 - gap)] if horizontal else \
+                   [(0, 0), (w / 2 + gap, 0), (-w / 2 - gap, 0)]
+            for dx, dy in side:
+                cx, cy = mx + dx, my + dy
+                rect = (cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2)
+                score = index.overlap(rect)
+                if best is None or score < best[0]:
+                    best = (score, cx, cy, rect)
+                if score == 0:
+                    break
+            if best[0] == 0:
+                break
+        _, cx, cy, rect = best
+        index.insert(rect)
+        out.append((cx, cy - h / 2 if va == "bottom" else cy))
+    return out
@@ -0,0 +1,432 @@
+"""Solid models of a product, drawn as an isometric view or a cross-section.
+
+The product illustrations come from DALL-E (generate_illustration.py): a
+logged-in browser, minutes per image, and a different picture every run.
+This draws the same two views offline from the arrangement dimensions, in
+well under a second and identically every time:
+
+    scene = [
+        box("base", (0, 0, 5), (246, 215, 15), STRUCT),
+        prism("vat", ellipse(91, 107, 88, 103), "z", 15, 35, FLOW, holes=[ellipse(91, 107, 85, 100)]),
+        cylinder("shaft", (107, 40), 3, "y", 20, 195, ACCENT),
+    ]
+    draw_isometric(ax, scene)                      # shaded, hidden faces removed
+    draw_section(ax, scene, "y", 107.5)            # cut at y = 107.5, seen from -y
+
+Every solid is a prism: one or more closed profile loops (an outer outline
+and any holes) extruded along x, y or z, so boxes, cylinders, tubes, oval
+trays and tapered housings are all the same shape to the renderer. faces()
+turns a scene into one vertex array with a face table; a view projects all
+vertices with one matrix product, drops faces turned away from the viewer
+and paints the rest far to near (painter's algorithm) in one PathCollection.
+A section cuts each prism with an axis-aligned plane exactly: across its
+axis the cut is the profile itself; along it, the profile's crossings with
+the plane pair up into strips.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from clearance import crossing
+
+Solid = namedtuple("Solid", "name loops axis lo hi color alpha smooth")
+Faces = namedtuple("Faces", "verts codes start stop normal solid side")
+Region = namedtuple("Region", "solid path centroid area")
+
+# Profile (u, v) and extrusion w -> world (x, y, z) index, per extrusion axis.
+AXES = {"x": (1, 2, 0), "y": (0, 2, 1), "z": (0, 1, 2)}
+_SECTION_VIEWS = {"x": (180.0, 0.0), "y": (-90.0, 0.0), "z": (-90.0, 90.0)}
+LIGHT = np.array([-0.45, -0.6, 1.0]) / np.linalg.norm([-0.45, -0.6, 1.0])
+
+
+# ================================================================
+# Solids
+# ================================================================
+
+def _area(loop):
+    u, v = loop[:, 0], loop[:, 1]
+    return 0.5 * float(np.dot(u, np.roll(v, -1)) - np.dot(np.roll(u, -1), v))
+
+
+def oriented(loop, ccw):
+    """A loop (n, 2) wound counter-clockwise (ccw=True) or clockwise, reversed if needed."""
+    loop = np.asarray(loop, dtype=float).reshape(-1, 2)
+    return loop if (_area(loop) > 0) == ccw else loop[::-1]
+
+
+def prism(name, profile, axis, lo, hi, color, holes=(), alpha=1.0, smooth=False):
+    """Profile (n, 2) extruded along `axis` from `lo` to `hi`.
+
+    Profile coordinates are the other two axes in order (x, y for "z"; x, z
+    for "y"; y, z for "x"). Holes are loops inside the profile. `smooth`
+    hides the seams between side faces (curved surfaces).
+    """
+    loops = (oriented(profile, True),) + tuple(oriented(h, False) for h in holes)
+    return Solid(name, loops, axis, float(min(lo, hi)), float(max(lo, hi)), color, alpha, smooth)
+
+
+def box(name, p0, p1, color, alpha=1.0):
+    """Axis-aligned box between opposite corners p0 and p1 (x, y, z)."""
+    (x0, y0, z0), (x1, y1, z1) = p0, p1
+    return prism(name, [(x0, y0), (x1, y0), (x1, y1), (x0, y1)], "z", z0, z1, color, alpha=alpha)
+
+
+def ellipse(cu, cv, ru, rv, segments=48):
+    """Profile loop approximating an ellipse (a circle when ru == rv)."""
+    t = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    return np.column_stack([cu + ru * np.cos(t), cv + rv * np.sin(t)])
+
+
+def inset(profile, d):
+    """Convex profile loop moved `d` inward along every edge (the inside of a wall `d` thick)."""
+    loop = oriented(profile, True)
+    edge = np.roll(loop, -1, axis=0) - loop
+    n = np.column_stack([-edge[:, 1], edge[:, 0]]) / np.hypot(edge[:, 0], edge[:, 1])[:, None]
+    prev = np.roll(n, 1, axis=0)
+    return loop + d * (prev + n) / (1 + np.sum(prev * n, axis=1))[:, None]
+
+
+def cylinder(name, center, radius, axis, lo, hi, color, inner=0.0, segments=48, alpha=1.0):
+    """Cylinder (a tube when `inner` > 0) along `axis`; `center` is in profile coordinates."""
+    holes = [ellipse(*center, inner, inner, segments)] if inner else ()
+    return prism(name, ellipse(*center, radius, radius, segments), axis, lo, hi, color,
+                 holes=holes, alpha=alpha, smooth=True)
+
+
+def _world(u, v, w, axis):
+    """Stack profile / extrusion coordinates into world (..., 3) points."""
+    a, b, c = AXES[axis]
+    out = np.empty(np.broadcast(u, v, w).shape + (3,))
+    out[..., a], out[..., b], out[..., c] = u, v, w
+    return out
+
+
+# ================================================================
+# Faces
+# ================================================================
+
+def faces(scene):
+    """All faces of a scene as one vertex array plus a face table.
+
+    Face k is verts[start[k]:stop[k]] with Path codes codes[start[k]:stop[k]]
+    (one closed subpath per loop, so cap faces keep their holes), outward
+    unit normal normal[k], and belongs to scene[solid[k]]; side[k] is False
+    for the two caps.
+    """
+    verts, codes, start, normal, owner, side = [], [], [], [], [], []
+    n = 0
+    for i, s in enumerate(scene):
+        # Sides: one quad per profile edge, all loops at once.
+        p0 = np.vstack(s.loops)
+        p1 = np.vstack([np.roll(loop, -1, axis=0) for loop in s.loops])
+        quad = np.stack([_world(p0[:, 0], p0[:, 1], s.lo, s.axis), _world(p1[:, 0], p1[:, 1], s.lo, s.axis),
+                         _world(p1[:, 0], p1[:, 1], s.hi, s.axis), _world(p0[:, 0], p0[:, 1], s.hi, s.axis),
+                         _world(p0[:, 0], p0[:, 1], s.lo, s.axis)], axis=1)
+        edge = p1 - p0
+        length = np.hypot(edge[:, 0], edge[:, 1])
+        keep = length > 1e-12
+        out2 = np.column_stack([edge[:, 1], -edge[:, 0]])[keep] / length[keep, None]
+        verts.append(quad[keep].reshape(-1, 3))
+        m = int(keep.sum())
+        codes.append(np.tile([1, 2, 2, 2, 79], m))
+        start.append(n + 5 * np.arange(m))
+        normal.append(_world(out2[:, 0], out2[:, 1], 0.0, s.axis))
+        owner.append(np.full(m, i))
+        side.append(np.ones(m, dtype=bool))
+        n += 5 * m
+        # Caps: every loop as a subpath, facing -axis at lo and +axis at hi.
+        ring = [np.vstack([loop, loop[:1]]) for loop in s.loops]
+        ring_codes = np.concatenate([[1] + [2] * (len(r) - 2) + [79] for r in ring])
+        ring = np.vstack(ring)
+        for w, sign in ((s.lo, -1.0), (s.hi, 1.0)):
+            verts.append(_world(ring[:, 0], ring[:, 1], w, s.axis))
+            codes.append(ring_codes)
+            start.append([n])
+            normal.append(_world(0.0, 0.0, sign, s.axis)[None])
+            owner.append([i])
+            side.append([False])
+            n += len(ring)
+    start = np.concatenate(start).astype(int)
+    return Faces(np.vstack(verts), np.concatenate(codes).astype(np.uint8), start,
+                 np.append(start[1:], n), np.vstack(normal), np.concatenate(owner).astype(int),
+                 np.concatenate(side).astype(bool))
+
+
+def camera(azim=-60.0, elev=30.0):
+    """3x3 view matrix: rows are screen right, screen up and the direction to the viewer.
+
+    The viewer sits at azimuth `azim` (degrees from +x, counter-clockwise
+    seen from above) and `elev` above the horizon; elev 35.26 with azim -45
+    (or any odd multiple of 45) is the true isometric.
+    """
+    a, e = np.radians(azim), np.radians(elev)
+    to_viewer = np.array([np.cos(e) * np.cos(a), np.cos(e) * np.sin(a), np.sin(e)])
+    right = np.array([-np.sin(a), np.cos(a), 0.0])
+    return np.vstack([right, np.cross(to_viewer, right), to_viewer])
+
+
+def _shade(colors, lum):
+    """Darken (lum < 1) or lighten (lum > 1) RGBA colours, alpha untouched."""
+    out = colors.copy()
+    lum = lum[:, None]
+    out[:, :3] = np.where(lum <= 1, colors[:, :3] * lum, colors[:, :3] + (1 - colors[:, :3]) * (lum - 1))
+    return out
+
+
+def bounds(scene):
+    """(n, 2, 3) axis-aligned bounds of each solid."""
+    out = np.empty((len(scene), 2, 3))
+    for i, s in enumerate(scene):
+        p = np.vstack(s.loops)
+        pts = _world(np.r_[p[:, 0], p[:, 0]], np.r_[p[:, 1], p[:, 1]],
+                     np.repeat([s.lo, s.hi], len(p)), s.axis)
+        out[i] = pts.min(axis=0), pts.max(axis=0)
+    return out
+
+
+def order(scene, view, eps=1e-6):
+    """Painting rank of each solid, farthest first.
+
+    Face depth alone fails for large faces (a base plate's centroid is nearer
+    than the parts standing on it), so solids are ordered as wholes: any two
+    whose bounds are separated along some axis that the view sees are ordered
+    by which side of it the viewer is on, and a topological sort of those
+    constraints gives the ranks. Solids whose bounds interpenetrate (a part
+    nested in a hollow housing, solution in its tray) share a rank, and their
+    faces are then ordered by depth.
+    """
+    n = len(scene)
+    b = bounds(scene)
+    group = np.arange(n)                       # union-find over interpenetrating solids
+
+    def root(i):
+        while group[i] != i:
+            group[i] = group[group[i]]
+            i = group[i]
+        return i
+
+    below = b[:, None, 1, :] <= b[None, :, 0, :] + eps          # (i, j, axis): i entirely below j
+    facing = np.abs(view[2]) > eps
+    after = (below & (view[2] > eps)) | (below.transpose(1, 0, 2) & (view[2] < -eps))
+    separated = (below | below.transpose(1, 0, 2)).any(axis=2)
+    corners = np.stack(np.meshgrid([0, 1], [0, 1], [0, 1], indexing="ij"), -1).reshape(-1, 3)
+    screen = b[:, corners, [0, 1, 2]] @ view[:2].T               # (n, 8, 2) projected corners
+    lo, hi = screen.min(axis=1), screen.max(axis=1)
+    overlap = ((lo[:, None] < hi[None] - eps) & (lo[None] < hi[:, None] - eps)).all(axis=2)
+    for i, j in zip(*np.nonzero(np.triu(overlap & ~separated, 1))):
+        group[root(i)] = root(j)
+    roots = np.array([root(i) for i in range(n)])
+    # j is drawn after i if some separating axis seen by the view puts j nearer.
+    edges = overlap & (after & facing).any(axis=2) & ~(after.transpose(1, 0, 2) & facing).any(axis=2)
+    depth = (b.mean(axis=1) @ view[2])
+    keys = np.unique(roots)
+    pos = {k: m for m, k in enumerate(keys)}
+    succ = [set() for _ in keys]
+    indeg = np.zeros(len(keys), dtype=int)
+    for i, j in zip(*np.nonzero(edges)):
+        gi, gj = pos[roots[i]], pos[roots[j]]
+        if gi != gj and gj not in succ[gi]:
+            succ[gi].add(gj)
+            indeg[gj] += 1
+    gdepth = np.array([depth[roots == k].mean() for k in keys])
+    rank = np.empty(len(keys), dtype=int)
+    left = set(range(len(keys)))
+    for r in range(len(keys)):
+        ready = [g for g in left if indeg[g] == 0] or list(left)   # a cycle: take the farthest
+        g = min(ready, key=lambda g: gdepth[g])
+        rank[g] = r
+        left.discard(g)
+        for h in succ[g]:
+            indeg[h] -= 1
+    return rank[[pos[k] for k in roots]]
+
+
+def _paint(ax, scene, f, view, keep, shade=True, fade=0.0, edge="#333333", lw=0.4, zorder=1):
+    """Project faces `keep` with `view` and add them far to near as one collection."""
+    from matplotlib.collections import PathCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.path import Path
+
+    screen = f.verts @ view.T
+    depth = np.add.reduceat(screen[:, 2], f.start) / (f.stop - f.start)
+    idx = np.flatnonzero(keep)
+    idx = idx[np.lexsort((depth[idx], order(scene, view)[f.solid[idx]]))]
+    rgba = to_rgba_array([scene[i].color for i in f.solid[idx]])
+    rgba[:, 3] = [scene[i].alpha for i in f.solid[idx]]
+    if shade:
+        lum = 0.62 + 0.38 * np.clip(f.normal[idx] @ LIGHT, 0, 1)
+        rgba = _shade(rgba, lum)
+    if fade:
+        rgba = _shade(rgba, np.full(len(idx), 1 + fade))
+    smooth = np.array([scene[i].smooth for i in f.solid[idx]], dtype=bool) & f.side[idx]
+    edges = np.where(smooth[:, None], rgba, to_rgba_array(edge))
+    paths = [Path(screen[f.start[k]:f.stop[k], :2], f.codes[f.start[k]:f.stop[k]]) for k in idx]
+    coll = PathCollection(paths, facecolors=rgba, edgecolors=edges, linewidths=lw, zorder=zorder)
+    coll.set_transform(ax.transData)
+    ax.add_collection(coll, autolim=False)
+    ax.update_datalim(screen[np.repeat(keep, f.stop - f.start), :2])
+    return coll
+
+
+# ================================================================
+# Views
+# ================================================================
+
+def draw_isometric(ax, scene, azim=-60.0, elev=30.0, lw=0.4):
+    """Shaded projection with back faces culled and the rest painted far to near."""
+    f = faces(scene)
+    view = camera(azim, elev)
+    coll = _paint(ax, scene, f, view, f.normal @ view[2] > 1e-9, lw=lw)
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    return coll
+
+
+def draw_wireframe(ax, scene, azim=-60.0, elev=30.0, **kwargs):
+    """Edges of each solid's outer outline (both ends and the lines joining them), e.g. for an envelope."""
+    from matplotlib.collections import LineCollection
+
+    view = camera(azim, elev)
+    segs = []
+    for s in scene:
+        loop = s.loops[0]
+        ends = [_world(loop[:, 0], loop[:, 1], w, s.axis) @ view[:2].T for w in (s.lo, s.hi)]
+        segs += [np.vstack([e, e[:1]]) for e in ends]
+        segs += list(np.stack(ends, axis=1))
+    kwargs.setdefault("color", "#777777")
+    kwargs.setdefault("linewidth", 0.6)
+    coll = LineCollection(segs, **kwargs)
+    ax.add_collection(coll)
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    return coll
+
+
+def _cut(solid, axis, at):
+    """Cut outline of one solid by the plane `axis` = at, as world-space loops."""
+    if solid.axis == axis:
+        if not solid.lo <= at <= solid.hi:
+            return []
+        return [_world(loop[:, 0], loop[:, 1], at, axis) for loop in solid.loops]
+    a, b, _ = AXES[solid.axis]
+    k = 0 if "xyz"[a] == axis else 1            # which profile coordinate the plane fixes
+    p0 = np.vstack(solid.loops)
+    p1 = np.vstack([np.roll(loop, -1, axis=0) for loop in solid.loops])
+    crosses = (p0[:, k] <= at) != (p1[:, k] <= at)
+    if not crosses.any():
+        return []
+    t = (at - p0[crosses, k]) / (p1[crosses, k] - p0[crosses, k])
+    other = np.sort(p0[crosses, 1 - k] + t * (p1[crosses, 1 - k] - p0[crosses, 1 - k]))
+    strips = []
+    for s0, s1 in other.reshape(-1, 2):
+        uv = np.empty((4, 2))
+        uv[:, k] = at
+        uv[:, 1 - k] = (s0, s1, s1, s0)
+        strips.append(_world(uv[:, 0], uv[:, 1], np.array([solid.lo, solid.lo, solid.hi, solid.hi]), solid.axis))
+    return strips
+
+
+def section(scene, axis, at, view):
+    """Cut regions of every solid by the plane `axis` = at, in `view` screen coordinates."""
+    from matplotlib.path import Path
+
+    regions = []
+    for s in scene:
+        loops = _cut(s, axis, at)
+        if not loops:
+            continue
+        pts = [loop @ view[:2].T for loop in loops]
+        areas = np.array([_area(p) for p in pts])
+        if s.axis == axis and len(pts) > 1:        # a wall: anchor between outline and hole
+            edge = (pts[0][0] + pts[0][-1]) / 2
+            near = pts[1][np.argmin(np.hypot(*(pts[1] - edge).T))]
+            groups = [(pts, abs(areas[0]) - np.abs(areas[1:]).sum(), (edge + near) / 2)]
+        elif s.axis == axis:
+            groups = [(pts, abs(areas[0]), pts[0].mean(axis=0))]
+        else:                                      # separate strips
+            groups = [([p], abs(a), p.mean(axis=0)) for p, a in zip(pts, areas)]
+        for group, area, centroid in groups:
+            ring = [np.vstack([p, p[:1]]) for p in group]
+            codes = np.concatenate([[1] + [2] * (len(r) - 2) + [79] for r in ring])
+            regions.append(Region(s.name, Path(np.vstack(ring), codes), tuple(centroid), float(area)))
+    return regions
+
+
+def draw_section(ax, scene, axis, at, beyond=0.55, hatch=None, lw=0.8):
+    """Cross-section at `axis` = at: cut faces over a faded view of what lies beyond.
+
+    x and y sections are seen from the low side (-x, -y), z sections from above.
+
+    Returns the cut regions (name, path, centroid, area), largest first per
+    solid, for labelling.
+    """
+    from matplotlib.collections import PathCollection
+
+    a = "xyz".index(axis)
+    view = camera(*_SECTION_VIEWS[axis])
+    f = faces(scene)
+    far = f.verts[:, a] < at if axis == "z" else f.verts[:, a] > at
+    beyond_faces = np.logical_or.reduceat(far, f.start) & (f.normal @ view[2] > 1e-9)
+    _paint(ax, scene, f, view, beyond_faces, shade=True, fade=beyond, edge="#bbbbbb", lw=0.3, zorder=1)
+    regions = section(scene, axis, at, view)
+    by_name = {s.name: s for s in scene}
+    order = {s.name: i for i, s in enumerate(scene)}
+    regions.sort(key=lambda r: order[r.solid])
+    colors = [by_name[r.solid].color for r in regions]
+    coll = PathCollection([r.path for r in regions], facecolors=colors, edgecolors="#222222",
+                          linewidths=lw, zorder=2, hatch=hatch)
+    coll.set_transform(ax.transData)
+    ax.add_collection(coll, autolim=False)
+    if regions:
+        ax.update_datalim(np.vstack([r.path.vertices for r in regions]))
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    return sorted(regions, key=lambda r: (order[r.solid], -r.area))
+
+
+def label_regions(ax, regions, names=None, fs=6.5, color="#1a1a1a", margin=0.06):
+    """Name each solid's largest cut region with a leader line to the nearer side margin.
+
+    Each label sits level with its region where it can and is pushed apart
+    from its neighbours otherwise; labels then trade places until no two
+    leaders on a side cross. `names` maps solid names to label text (solids
+    not in it are skipped). Returns the Text artists.
+    """
+    seen, picks = set(), []
+    for r in regions:
+        if r.solid not in seen and (names is None or r.solid in names):
+            seen.add(r.solid)
+            picks.append(r)
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    mid, pad, gap = (x0 + x1) / 2, margin * (x1 - x0), 0.06 * (y1 - y0)
+    texts = []
+    for side, ha, x in ((-1, "right", x0 - pad), (1, "left", x1 + pad)):
+        group = sorted((r for r in picks if (r.centroid[0] >= mid) == (side > 0)), key=lambda r: r.centroid[1])
+        if not group:
+            continue
+        ys = np.array([r.centroid[1] for r in group])
+        for k in range(1, len(ys)):
+            ys[k] = max(ys[k], ys[k - 1] + gap)
+        ys -= max(ys[-1] - y1, 0)
+        for k in range(len(ys) - 2, -1, -1):
+            ys[k] = min(ys[k], ys[k + 1] - gap)
+        # Pushed labels can tilt a leader across its neighbour's. Swapping the slots of a crossing
+        # pair always shortens the leaders in total, so this ends with none crossing.
+        starts = np.array([r.centroid for r in group])
+        slot = np.arange(len(group))
+        for _ in range(len(group) ** 2):
+            ends = np.column_stack([np.full(len(group), x), ys[slot]])
+            crossed = np.argwhere(crossing(starts, ends, starts, ends))
+            if not len(crossed):
+                break
+            i, j = crossed[0]
+            slot[[i, j]] = slot[[j, i]]
+        for r, y in zip(group, ys[slot]):
+            texts.append(ax.annotate((names or {}).get(r.solid, r.solid), xy=r.centroid, xytext=(x, y),
+                                     ha=ha, va="center", fontsize=fs, color=color, annotation_clip=False,
+                                     arrowprops=dict(arrowstyle="-", color="#777777", lw=0.5,
+                                                     shrinkA=2, shrinkB=0)))
+    ax.set_xlim(x0 - 3 * pad, x1 + 3 * pad)
+    return texts
@@ -0,0 +1,43 @@
+"""Uniform-cell spatial hash of axis-aligned rects.
+
+Shared by the diagram edge router (label placement) and the arrangement
+clearance checker (candidate pairs). Rects are (x0, y0, x1, y1) tuples.
+"""
+
+
+def _overlap(a, b):
+    """Overlap area of two (x0, y0, x1, y1) rects."""
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0.0
+
+
+class GridIndex:
+    """Uniform-cell spatial hash of (x0, y0, x1, y1) rects."""
+
+    def __init__(self, cell=0.5):
+        self.cell = cell
+        self.cells = {}
+        self.rects = []
+
+    def _keys(self, r):
+        c = self.cell
+        for i in range(int(r[0] // c), int(r[2] // c) + 1):
+            for j in range(int(r[1] // c), int(r[3] // c) + 1):
+                yield i, j
+
+    def insert(self, rect):
+        self.rects.append(rect)
+        for k in self._keys(rect):
+            self.cells.setdefault(k, []).append(len(self.rects) - 1)
+
+    def query(self, rect):
+        """Indices of the indexed rects sharing a cell with rect (a superset of those touching it)."""
+        seen = set()
+        for k in self._keys(rect):
+            seen.update(self.cells.get(k, ()))
+        return seen
+
+    def overlap(self, rect):
+        """Total overlap area of rect with everything indexed."""
+        return sum(_overlap(self.rects[i], rect) for i in self.query(rect))
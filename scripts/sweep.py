@@ -0,0 +1,79 @@
+"""Parameter sweeps for arrangement and sizing scripts.
+
+A sweep is a dict of parameter ranges; grid() expands it into flat NumPy
+arrays (one entry per variant), evaluate() runs a vectorized model over them,
+and pareto() keeps the variants no other variant beats on every objective:
+
+    params = grid({"vat_short": "160:200:5", "duct_diam": [30, 40, 50]})
+    metrics = evaluate(model, params, workers=4)
+    keep = pareto(np.column_stack([metrics["footprint"], metrics["height"]]))
+
+The model takes {name: array} and returns {metric: array} of the same length;
+it must be a module-level function so worker processes can import it. With
+workers, the grid is cut into chunks and evaluated in a process pool; each
+chunk is still one vectorized call, so workers only pay off for grids of
+hundreds of thousands of variants.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def parse_range(text):
+    """"160:200:5" -> [160, 165, ..., 200]; "30,40,50" -> [30, 40, 50]; "42" -> [42]."""
+    if ":" in text:
+        lo, hi, step = (float(v) for v in text.split(":"))
+        return list(np.round(np.arange(lo, hi + step / 2, step), 6))
+    return [float(v) for v in text.split(",")]
+
+
+def grid(ranges):
+    """Full factorial over the ranges: {name: flat array}, one entry per combination."""
+    names = list(ranges)
+    values = [parse_range(r) if isinstance(r, str) else list(np.atleast_1d(r)) for r in ranges.values()]
+    mesh = np.meshgrid(*[np.asarray(v, dtype=float) for v in values], indexing="ij")
+    return {n: m.ravel() for n, m in zip(names, mesh)}
+
+
+def _chunks(params, size):
+    n = len(next(iter(params.values())))
+    for lo in range(0, n, size):
+        yield {k: v[lo:lo + size] for k, v in params.items()}
+
+
+def evaluate(model, params, workers=0, chunk=4096):
+    """model(params) over the grid, in chunks across `workers` processes (0: in-process)."""
+    if workers <= 1:
+        return model(params)
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(pool.map(model, _chunks(params, chunk)))
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+def pareto(costs):
+    """Boolean mask of the non-dominated rows of an (n, k) array; every column is minimised.
+
+    Each pass takes one surviving row and drops everything it dominates with a
+    single broadcasted comparison, so the cost scales with the front, not n^2.
+    """
+    costs = np.asarray(costs, dtype=float)
+    n = len(costs)
+    idx = np.arange(n)
+    i = 0
+    while i < len(costs):
+        keep = np.any(costs < costs[i], axis=1)
+        keep[i] = True
+        idx, costs = idx[keep], costs[keep]
+        i = int(keep[:i].sum()) + 1
+    mask = np.zeros(n, dtype=bool)
+    mask[idx] = True
+    return mask
+
+
+def spread(order_by, count):
+    """Up to `count` indices spread evenly along a sort key (for panels of a large front)."""
+    order = np.argsort(order_by, kind="stable")
+    if len(order) <= count:
+        return order
+    return order[np.unique(np.round(np.linspace(0, len(order) - 1, count)).astype(int))]
@@ -0,0 +1,411 @@
+"""Typed tier/component model loaded from a product's system description.
+
+Reads the markdown produced in Phase 4 (templates/system_description_template.md):
+
+  - §3 mermaid graph: each subgraph is a Tier, each node a Component, each
+    edge a Link (the edge label is the protocol, e.g. "BLE", "MQTT over TLS").
+    A "Users" / "Clients" subgraph holds people and apps outside the product
+    and is marked external.
+  - §4 Sensors / Major modules tables
+  - §5 interface tables (From / To / Protocol / Data / Rate / Notes)
+  - §6 power source facts and power budget table, §8 decisions, §9
+    constraint tables and bullets
+
+Deck builders and the block diagram generator share one parsed model per
+document: load() caches on the file's content hash, so every caller after the
+first gets the same object back without re-reading the markdown.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+
+_CACHE = {}
+
+
+@dataclass(frozen=True)
+class Component:
+    id: str
+    name: str
+    tier: str
+
+
+@dataclass(frozen=True)
+class Link:
+    source: str
+    target: str
+    label: str = ""
+
+
+@dataclass(frozen=True)
+class Interface:
+    name: str
+    source: str
+    target: str
+    protocol: str
+    data: str = ""
+    rate: str = ""
+    notes: str = ""
+    external: bool = False
+
+
+@dataclass(frozen=True)
+class Tier:
+    id: str
+    name: str
+    scope: str
+    components: tuple = ()
+    external: bool = False
+
+
+@dataclass(frozen=True)
+class PowerDraw:
+    """One power budget row, currents in microamps."""
+    component: str
+    active_ua: float
+    sleep_ua: float
+    avg_ua: float
+
+
+@dataclass(frozen=True)
+class Decision:
+    title: str
+    chosen: str
+    rationale: str = ""
+    consequences: str = ""
+    risks: str = ""
+
+
+@dataclass(frozen=True)
+class Constraint:
+    name: str
+    value: str
+    note: str = ""
+    category: str = ""
+
+
+@dataclass(frozen=True)
+class SystemModel:
+    product: str
+    short_name: str
+    tiers: tuple = ()
+    links: tuple = ()
+    interfaces: tuple = ()
+    sensors: tuple = ()
+    firmware_modules: tuple = ()
+    power: tuple = ()
+    power_budget: tuple = ()
+    decisions: tuple = ()
+    constraints: tuple = ()
+    bom: tuple = ()
+    digest: str = field(default="", compare=False)
+
+    def tier(self, tier_id):
+        return next(t for t in self.tiers if t.id == tier_id)
+
+    def component(self, comp_id):
+        return next(c for t in self.tiers for c in t.components if c.id == comp_id)
+
+    def tier_of(self, comp_id):
+        for t in self.tiers:
+            if any(c.id == comp_id for c in t.components):
+                return t.id
+        return None
+
+    def tier_links(self, a, b):
+        """Distinct link labels between two tiers, either direction, in document order."""
+        labels = []
+        for link in self.links:
+            ends = {self.tier_of(link.source), self.tier_of(link.target)}
+            if ends == {a, b} and link.label and link.label not in labels:
+                labels.append(link.label)
+        return labels
+
+
+# ================================================================
+# Markdown helpers
+# ================================================================
+
+def md_sections(text, level=2):
+    """{heading: body} for headings of the given level. Numbering ("5. ") is stripped."""
+    marker = "#" * level + " "
+    out, title, body = {}, None, []
+    for line in text.splitlines():
+        if line.startswith(marker):
+            if title is not None:
+                out[title] = "\n".join(body)
+            title = re.sub(r"^\d+(\.\d+)*\.?\s+", "", line[len(marker):].strip())
+            body = []
+        elif line.startswith("#" * (level - 1) + " ") and level > 1:
+            if title is not None:
+                out[title] = "\n".join(body)
+            title, body = None, []
+        elif title is not None:
+            body.append(line)
+    if title is not None:
+        out[title] = "\n".join(body)
+    return out
+
+
+def md_section(text, name, level=2):
+    """Body of the first section whose heading starts with `name` (case-insensitive)."""
+    for title, body in md_sections(text, level).items():
+        if title.lower().startswith(name.lower()):
+            return body
+    return ""
+
+
+def _cells(line):
+    return [c.strip() for c in line.strip().strip("|").split("|")]
+
+
+def md_tables(text):
+    """All pipe tables in text, each as a list of {header: cell} rows."""
+    tables, lines = [], text.splitlines()
+    i = 0
+    while i < len(lines) - 1:
+        if lines[i].lstrip().startswith("|") and re.match(r"^\s*\|?\s*:?-{3,}", lines[i + 1]):
+            header = _cells(lines[i])
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].lstrip().startswith("|"):
+                cells = _cells(lines[i])
+                rows.append(dict(zip(header, cells + [""] * (len(header) - len(cells)))))
+                i += 1
+            tables.append(rows)
+        else:
+            i += 1
+    return tables
+
+
+def plain(cell):
+    """Strip markdown emphasis and code ticks from a table cell."""
+    return re.sub(r"[*`]", "", cell).strip()
+
+
+def _labelled(text):
+    """'- **Label:** value' and '**Label:** value' lines as (label, value) pairs."""
+    return [(m.group(1).strip(), m.group(2).strip())
+            for m in re.finditer(r"^[ \t]*(?:-[ \t]*)?\*\*([^*]+?):\*\*[ \t]*(.*)$", text, re.M)]
+
+
+# ================================================================
+# Section parsers
+# ================================================================
+
+# Subgraphs of people and client apps rather than product hardware or services.
+_EXTERNAL_TIERS = ("users", "clients", "actors")
+
+_SUBGRAPH = re.compile(r'^subgraph\s+(\w+)(?:\s*\["?([^"\]]+)"?\])?')
+_NODE = re.compile(r'(\w+)\s*[\[\(\{]+"?([^\]\)\}"]+)"?[\]\)\}]+')
+_EDGE = re.compile(r'^(\w+)(?:\s*[\[\(\{][^\]\)\}]*[\]\)\}])?\s*<?(?:-->|---|-\.->|==>)\s*'
+                   r'(?:\|([^|]*)\|\s*)?(\w+)')
+
+
+def _mermaid_graph(body):
+    """Tiers and links from the first `graph` mermaid block."""
+    m = re.search(r"```mermaid\s*\n\s*(?:graph|flowchart)[^\n]*\n(.*?)```", body, re.S)
+    if not m:
+        return (), ()
+    tiers, links, names = [], [], {}
+    current = None
+    for raw in m.group(1).splitlines():
+        line = raw.strip()
+        sg = _SUBGRAPH.match(line)
+        if sg:
+            current = {"id": sg.group(1), "label": sg.group(2) or sg.group(1), "members": []}
+            tiers.append(current)
+            continue
+        if line == "end":
+            current = None
+            continue
+        edge = _EDGE.match(line)
+        for node_id, label in _NODE.findall(line):
+            names.setdefault(node_id, label.strip())
+        if edge:
+            links.append(Link(edge.group(1), edge.group(3), (edge.group(2) or "").strip()))
+        elif current is not None:
+            node = _NODE.match(line) or re.match(r"^(\w+)\s*$", line)
+            if node:
+                current["members"].append(node.group(1))
+    out = []
+    for t in tiers:
+        label = t["label"]
+        scope = ""
+        sm = re.match(r"^(.*?)\s*\(([^)]*)\)\s*$", label)
+        if sm:
+            label, scope = sm.group(1), sm.group(2)
+        comps = tuple(Component(n, names.get(n, n), t["id"]) for n in t["members"])
+        external = t["id"].lower() in _EXTERNAL_TIERS or label.lower() in _EXTERNAL_TIERS
+        out.append(Tier(t["id"], label, scope, comps, external))
+    return tuple(out), tuple(links)
+
+
+def _interfaces(body):
+    out = []
+    for sub, text in md_sections(body, 3).items():
+        external = sub.lower().startswith("external")
+        for table in md_tables(text):
+            for row in table:
+                if "From" not in row or "To" not in row:
+                    continue
+                out.append(Interface(plain(row.get("Interface", "")), plain(row["From"]),
+                                     plain(row["To"]), plain(row.get("Protocol", "")),
+                                     plain(row.get("Data", "")), plain(row.get("Rate", "")),
+                                     plain(row.get("Notes", "")), external))
+    return tuple(out)
+
+
+def _table_with(body, column):
+    for table in md_tables(body):
+        if table and column in table[0]:
+            return tuple({k: plain(v) for k, v in row.items()} for row in table)
+    return ()
+
+
+def _decisions(body):
+    """"### Decision N: Title" blocks, or a Decision / Choice / Rationale table."""
+    out = []
+    for table in md_tables(body):
+        for row in table:
+            if "Decision" in row and "Choice" in row:
+                out.append(Decision(plain(row["Decision"]), plain(row["Choice"]),
+                                    plain(row.get("Rationale", ""))))
+    for title, text in md_sections(body, 3).items():
+        facts = dict(_labelled(text))
+        title = re.sub(r"^Decision\s+\d+:\s*", "", title)
+        out.append(Decision(title, facts.get("Chosen", ""), facts.get("Rationale", ""),
+                            facts.get("Consequences", ""), facts.get("Risks", "")))
+    return tuple(out)
+
+
+def _constraints(body):
+    """§9 as Constraint rows, plus the BOM line items if a cost table has them."""
+    rows, bom = [], []
+    for category, text in md_sections(body, 3).items():
+        for table in md_tables(text):
+            cols = list(table[0]) if table else []
+            if len(cols) < 2:
+                continue
+            line_items = cols[1] in ("Cost", "Unit cost")
+            for row in table:
+                name, value = plain(row[cols[0]]), plain(row[cols[1]])
+                note = plain(row[cols[2]]) if len(cols) > 2 else ""
+                if line_items:
+                    bom.append((name, value))
+                else:
+                    rows.append(Constraint(name, value, note, category))
+        for line in text.splitlines():
+            m = re.match(r"^\s*-\s+(.*)$", line)
+            if not m:
+                continue
+            item = plain(m.group(1))
+            key, sep, value = item.partition(": ")
+            if sep and len(key) < 40:
+                rows.append(Constraint(key, value, "", category))
+            else:
+                rows.append(Constraint(category, item, "", category))
+    return tuple(rows), tuple(bom)
+
+
+_STATE = re.compile(r"^(.*?)\s*\(([\d.]+)\s*s\)$")
+
+
+def _microamps(cell):
+    """'3.0 mA' / '~417 µA' -> microamps; '—' or blank -> 0."""
+    m = re.search(r"([\d.]+)\s*(mA|µA|uA)", cell)
+    if not m:
+        return 0.0
+    return float(m.group(1)) * (1000.0 if m.group(2) == "mA" else 1.0)
+
+
+def _power_budget(body):
+    """PowerDraw rows and (state, seconds) columns of the per-component budget table.
+
+    The table is the one whose columns are named with a duration, e.g.
+    "Active (5s)" / "Deep Sleep (294.5s)", plus an "Avg ..." column.
+    """
+    for table in md_tables(body):
+        cols = list(table[0]) if table else []
+        states = [(c, m.group(1), float(m.group(2))) for c in cols for m in [_STATE.match(c)] if m]
+        avg = next((c for c in cols if c.lower().startswith("avg")), None)
+        if not states or avg is None:
+            continue
+        asleep = [c for c, name, _ in states if "sleep" in name.lower()]
+        awake = [c for c, _, _ in states if c not in asleep]
+        draws = []
+        for row in table:
+            name = plain(row[cols[0]])
+            if name.lower().startswith("total"):
+                continue
+            draws.append(PowerDraw(name, max((_microamps(row[c]) for c in awake), default=0.0),
+                                   sum(_microamps(row[c]) for c in asleep), _microamps(row[avg])))
+        return tuple(draws), tuple((name, secs) for _, name, secs in states)
+    return (), ()
+
+
+def _power(body, budget=((), ())):
+    """(label, value) facts: "Power source" bullets, budget figures, then labelled lines."""
+    facts = []
+    m = re.search(r"\*\*Power source:\*\*[ \t]*\n((?:[ \t]*-.*\n?)+)", body)
+    if m:
+        for line in m.group(1).splitlines():
+            key, _, value = plain(line.strip().lstrip("- ")).partition(": ")
+            if value:
+                facts.append((key, value))
+    draws, states = budget
+    if draws:
+        period = sum(secs for _, secs in states)
+        asleep = sum(secs for name, secs in states if "sleep" in name.lower())
+        sleepers = " + ".join(d.component for d in draws if d.sleep_ua)
+        facts.append(("Sleep current", f"~{sum(d.sleep_ua for d in draws):.1f} µA: {sleepers}"))
+        facts.append(("Duty cycle", f"{period - asleep:g} s awake every {period / 60:g} min, "
+                                    f"{100 * asleep / period:.1f}% asleep"))
+        hog = max(draws, key=lambda d: d.avg_ua)
+        facts.append(("Largest draw", f"{hog.component}: {hog.active_ua / 1000:g} mA active, "
+                                      f"~{hog.avg_ua:g} µA average"))
+    for label, value in _labelled(body):
+        if value and label != "Power source":
+            facts.append((label, plain(value)))
+    return tuple(facts)
+
+
+def parse(text, digest=""):
+    """Build a SystemModel from system description markdown."""
+    title = re.search(r"^#\s+(?:System Description:\s*)?(.+)$", text, re.M)
+    product = title.group(1).strip() if title else "Product"
+    short = product.split()[0]
+
+    tiers, links = _mermaid_graph(md_section(text, "System Architecture"))
+    # "AirSense Device" -> "Device": the product name adds nothing on a slide.
+    tiers = tuple(Tier(t.id, t.name[len(short):].strip() if t.name.startswith(short + " ") else t.name,
+                       t.scope, t.components, t.external) for t in tiers)
+    subsystems = md_section(text, "Subsystem Descriptions")
+    constraints, bom = _constraints(md_section(text, "Constraints"))
+    power = md_section(text, "Power Architecture")
+    budget = _power_budget(power)
+    return SystemModel(
+        product=product,
+        short_name=short,
+        tiers=tiers,
+        links=links,
+        interfaces=_interfaces(md_section(text, "Interfaces")),
+        sensors=_table_with(subsystems, "Sensor"),
+        firmware_modules=_table_with(subsystems, "Module"),
+        power=_power(power, budget),
+        power_budget=budget[0],
+        decisions=_decisions(md_section(text, "Key")),
+        constraints=constraints,
+        bom=bom,
+        digest=digest,
+    )
+
+
+def load(path):
+    """Parse a system description, cached by content hash."""
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    if digest not in _CACHE:
+        _CACHE[digest] = parse(data.decode("utf-8"), digest)
+    return _CACHE[digest]
@@ -0,0 +1,59 @@
+"""Cached text measurement shared by the deck and carousel builders.
+
+Widths come from ReportLab's built-in AFM metrics, so no fonts have to be
+installed. Calibri (the PPTX decks) is measured as Helvetica scaled by
+FONT_SCALE, which is close enough for sizing boxes and deciding line breaks.
+All results are memoized: the same string at the same size is measured once
+per process no matter how many slides reuse it.
+"""
+
+from functools import lru_cache
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Width of each deck font relative to the Helvetica metrics used to measure it.
+FONT_SCALE = {
+    "Helvetica": 1.0,
+    "Calibri": 0.9,
+}
+
+LINE_SPACING = 1.2   # PowerPoint single spacing, as a multiple of font size
+PT_PER_INCH = 72.0
+
+
+@lru_cache(maxsize=65536)
+def text_width(text, size, bold=False, font="Calibri"):
+    """Width of a single line of text, in points."""
+    base = "Helvetica-Bold" if bold else "Helvetica"
+    return stringWidth(text, base, size) * FONT_SCALE.get(font, 1.0)
+
+
+@lru_cache(maxsize=16384)
+def wrap_lines(text, size, max_w, bold=False, font="Calibri"):
+    """Greedy word wrap. Returns a tuple of lines; explicit newlines are kept."""
+    lines = []
+    for para in text.split("\n"):
+        current = ""
+        for word in para.split(" "):
+            test = current + (" " if current else "") + word
+            if current and text_width(test, size, bold, font) > max_w:
+                lines.append(current)
+                current = word
+            else:
+                current = test
+        lines.append(current)
+    return tuple(lines)
+
+
+def line_count(text, size, max_w, bold=False, font="Calibri"):
+    return len(wrap_lines(text, size, max_w, bold, font))
+
+
+def text_height(text, size, max_w, bold=False, font="Calibri", spacing=LINE_SPACING):
+    """Height of wrapped text in points (no frame insets)."""
+    return line_count(text, size, max_w, bold, font) * size * spacing
+
+
+def cache_info():
+    """Hit/miss counters for the width and wrap caches."""
+    return {"width": text_width.cache_info(), "wrap": wrap_lines.cache_info()}
@@ -0,0 +1,123 @@
+"""Monte Carlo tolerance stack-up over a dimension model.
+
+Deviations are sampled per dimension; model inputs shift before
+Model.evaluate(), other names reach the checks as extra errors (nominal 0).
+
+    tols = {"vat_depth": normal(0.3), "loop_sag": uniform(1.5, shift=-1.5)}
+    checks = {"shaft over rim": lambda d: d["clearance"] - 3}   # margin, >= 0 passes
+    stacks = run(DIMS, tols, checks, samples=2_000_000)
+    print("\n".join(report(stacks)))
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+Dist = namedtuple("Dist", "kind tol shift")
+Stack = namedtuple("Stack", "check nominal mean std worst fails samples share")
+
+_KINDS = ("normal", "uniform", "triangular")
+
+
+def normal(tol, shift=0.0):
+    """Normal deviation, ±tol at 3 sigma, centred on `shift`."""
+    return Dist("normal", float(tol), float(shift))
+
+
+def uniform(tol, shift=0.0):
+    """Uniform deviation over ±tol about `shift` (worst-case-like: a process with no centring)."""
+    return Dist("uniform", float(tol), float(shift))
+
+
+def triangular(tol, shift=0.0):
+    """Triangular deviation over ±tol about `shift` (the sum of two uniform halves)."""
+    return Dist("triangular", float(tol), float(shift))
+
+
+def sample(dists, n, rng):
+    """{name: (n,) deviations} drawn from each Dist."""
+    out = {}
+    for name, d in dists.items():
+        if d.kind == "normal":
+            x = rng.normal(0.0, d.tol / 3, n)
+        elif d.kind == "uniform":
+            x = rng.uniform(-d.tol, d.tol, n)
+        elif d.kind == "triangular":
+            x = rng.triangular(-d.tol, 0.0, d.tol, n)
+        else:
+            raise ValueError(f"{name}: distribution must be one of {', '.join(_KINDS)}, not {d.kind!r}")
+        out[name] = x + d.shift
+    return out
+
+
+# ================================================================
+# Stack-up
+# ================================================================
+
+def _evaluate(model, nominal, dev):
+    """Model dimensions with the deviations applied, plus the extra deviations; every value (n,)."""
+    d = model.evaluate(**{k: nominal[k] + v for k, v in dev.items() if k in nominal})
+    d.update({k: v for k, v in dev.items() if k not in nominal})
+    return d
+
+
+def _margins(checks, d, n):
+    return np.stack([np.broadcast_to(np.asarray(check(d), dtype=float), (n,)) for check in checks.values()])
+
+
+def run(model, dists, checks, samples=1_000_000, chunk=250_000, probe=100_000, seed=0):
+    """Violation rate, spread and contributors of every check; one Stack per check, in order.
+
+    checks is {name: function(d) -> margin}, d holding the model's
+    dimensions and the extra deviations as (n,) arrays; a margin below 0 is
+    a violation. share is {dimension: fraction of the margin's variance}.
+    """
+    nominal = model.inputs()
+    rng = np.random.default_rng(seed)
+    zero = {k: 0.0 for k in dists if k not in nominal}
+    base = _margins(checks, dict(model.evaluate(), **zero), 1)[:, 0]
+
+    k = len(checks)
+    count, total, square, worst, fails = 0, np.zeros(k), np.zeros(k), np.full(k, np.inf), np.zeros(k, dtype=np.int64)
+    first = None
+    while count < samples:
+        n = min(chunk, samples - count)
+        dev = sample(dists, n, rng)
+        m = _margins(checks, _evaluate(model, nominal, dev), n)
+        # Running sums about the nominal margin keep the variance accurate at any sample count.
+        off = m - base[:, None]
+        total += off.sum(axis=1)
+        square += (off * off).sum(axis=1)
+        worst = np.minimum(worst, m.min(axis=1))
+        fails += (m < 0).sum(axis=1)
+        count += n
+        if first is None:
+            first = {name: v[:probe] for name, v in dev.items()}
+
+    mean = total / count
+    std = np.sqrt(np.maximum(square / count - mean ** 2, 0))
+    # One at a time: each dimension varies alone, the rest stay nominal.
+    n = len(next(iter(first.values()))) if first else 0
+    spread = {name: _margins(checks, _evaluate(model, nominal, dict(zero, **{name: v})), n).var(axis=1)
+              for name, v in first.items()}
+    names = list(spread)
+    var = np.array([spread[name] for name in names]).reshape(len(names), k)
+    share = var / np.maximum(var.sum(axis=0), 1e-300)
+    return [Stack(check, float(base[i]), float(base[i] + mean[i]), float(std[i]), float(worst[i]), int(fails[i]),
+                  count, dict(sorted(zip(names, share[:, i]), key=lambda kv: -kv[1])))
+            for i, check in enumerate(checks)]
+
+
+def report(stacks, top=3):
+    """One line per check: nominal and mean margin, sigma, worst sample, violation rate, top contributors."""
+    lines = [f"{'check':<18} {'nominal':>8} {'mean':>7} {'sigma':>6} {'worst':>7}  {'violations':>13}  "
+             f"{'Cpk':>5}  top contributors"]
+    for s in stacks:
+        rate = s.fails / s.samples
+        ppm = f"{rate * 1e6:9.0f} ppm" if rate < 0.01 else f"{rate * 100:11.2f} %"
+        cpk = s.mean / (3 * s.std) if s.std > 0 else np.inf
+        drivers = ", ".join(f"{name} {share * 100:.0f}%" for name, share in list(s.share.items())[:top]
+                            if share >= 0.005)
+        lines.append(f"{s.check:<18} {s.nominal:8.2f} {s.mean:7.2f} {s.std:6.2f} {s.worst:7.2f}  {ppm}  "
+                     f"{cpk:5.2f}  {drivers}")
+    return lines
@@ -1,9 +1,15 @@
 import os
+import sys
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Arc
+from matplotlib.patches import Circle, Arc
+from matplotlib.transforms import Affine2D
 import numpy as np
 
+import animate
+from primitives import box
+
 _DIR = os.path.dirname(os.path.abspath(__file__))
 
 fig, axes = plt.subplots(1, 3, figsize=(16, 6))
@@ -59,8 +65,8 @@ ax.set_title("Device — Side Cross Section", fontsize=11, fontweight="bold")
 ax.axis("off")
 
 # Enclosure outline
-enclosure_side = FancyBboxPatch((-16, -3), 32, 10, boxstyle="round,pad=1",
-                                 facecolor="#e8e8e8", edgecolor="#1a1a1a", linewidth=2)
+enclosure_side = box(-16, -3, 32, 10, boxstyle="round,pad=1",
+                     facecolor="#e8e8e8", edgecolor="#1a1a1a", linewidth=2)
 ax.add_patch(enclosure_side)
 
 # PCB
@@ -108,27 +114,31 @@ ax.axis("off")
 # Chair legs
 leg_color = "#8B6914"
 leg_width = 2.5
+chair = []  # artists that tilt with the chair in the animation
 # Back legs
-ax.plot([-18, -12], [0, 42], color=leg_color, linewidth=leg_width, solid_capstyle="round")
-ax.plot([18, 12], [0, 42], color=leg_color, linewidth=leg_width, solid_capstyle="round")
+chair += ax.plot([-18, -12], [0, 42], color=leg_color, linewidth=leg_width, solid_capstyle="round")
+chair += ax.plot([18, 12], [0, 42], color=leg_color, linewidth=leg_width, solid_capstyle="round")
 # Front legs
-ax.plot([-20, -14], [0, 28], color=leg_color, linewidth=leg_width, solid_capstyle="round")
-ax.plot([20, 14], [0, 28], color=leg_color, linewidth=leg_width, solid_capstyle="round")
+chair += ax.plot([-20, -14], [0, 28], color=leg_color, linewidth=leg_width, solid_capstyle="round")
+chair += ax.plot([20, 14], [0, 28], color=leg_color, linewidth=leg_width, solid_capstyle="round")
 
 # Seat
-seat = FancyBboxPatch((-15, 27), 30, 2.5, boxstyle="round,pad=0.5",
-                       facecolor="#A0722A", edgecolor="#8B6914", linewidth=2)
+seat = box(-15, 27, 30, 2.5, boxstyle="round,pad=0.5",
+           facecolor="#A0722A", edgecolor="#8B6914", linewidth=2)
 ax.add_patch(seat)
+chair.append(seat)
 
 # Back rest
-backrest = FancyBboxPatch((-11, 32), 22, 12, boxstyle="round,pad=1",
-                           facecolor="#A0722A", edgecolor="#8B6914", linewidth=2)
+backrest = box(-11, 32, 22, 12, boxstyle="round,pad=1",
+               facecolor="#A0722A", edgecolor="#8B6914", linewidth=2)
 ax.add_patch(backrest)
+chair.append(backrest)
 
 # Device under seat
 device = Circle((0, 26.5), 2.5, fill=True, facecolor="#2d2d2d", edgecolor="#cc3333",
                 linewidth=1.5, linestyle="--")
 ax.add_patch(device)
+chair.append(device)
 
 # Arrow pointing to device
 ax.annotate("Chair\nBalancing\nAct", xy=(1.5, 25), xytext=(18, 18),
@@ -136,14 +146,55 @@ ax.annotate("Chair\nBalancing\nAct", xy=(1.5, 25), xytext=(18, 18),
             arrowprops=dict(arrowstyle="->", color="#cc3333", lw=1.5))
 
 # Sound waves
+waves = []
 for r in [5, 7.5, 10]:
     wave = Arc((-3, 26.5), r, r, angle=0, theta1=160, theta2=250,
                color="#cc8833", linewidth=1, linestyle="--", alpha=0.6)
     ax.add_patch(wave)
+    waves.append(wave)
 ax.text(-15, 22, "sound", fontsize=7, color="#cc8833", style="italic", ha="center")
 
 plt.tight_layout()
 plt.savefig(os.path.join(_DIR, "chair_balancing_act_visual.png"),
             dpi=180, bbox_inches="tight", facecolor="white")
-plt.close()
 print("Saved.")
+
+
+# --- Animation: chair tilts back and the tone rises with it (scripts/animate.py) ---
+# python visualize.py --animate [chair_balancing_act_tilt.gif | .mp4]
+DEAD_BAND = 2       # degrees: silent inside it (FW-C-04)
+FALL_POINT = 25     # degrees: maximum alarm (FW-C-05 test sweep)
+TONE_LO, TONE_HI = 500, 4000   # Hz, inside the piezo's ~500 Hz - 5 kHz range
+
+
+def tone(tilt):
+    """Pitch for a tilt angle: silent in the dead-band, then rising exponentially to the fall point."""
+    if tilt < DEAD_BAND:
+        return 0.0
+    t = min((tilt - DEAD_BAND) / (FALL_POINT - DEAD_BAND), 1.0)
+    return TONE_LO * (TONE_HI / TONE_LO) ** t
+
+
+args = sys.argv[1:]
+if "--animate" in args:
+    rest = args[args.index("--animate") + 1:]
+    anim_out = rest[0] if rest else os.path.join(_DIR, "chair_balancing_act_tilt.gif")
+    tilt = Affine2D()
+    for a in chair + waves:
+        a.set_transform(tilt + ax.transData)
+    readout = ax.text(0, -4, "", fontsize=9, color="#cc3333", fontweight="bold", ha="center")
+    # Rocking back on the right-hand feet and down again.
+    angles = np.concatenate([np.linspace(0, FALL_POINT, 40), np.linspace(FALL_POINT, 0, 40)])
+
+    def pose(angle):
+        tilt.clear().rotate_deg_around(20, 0, -angle)
+        hz = tone(angle)
+        level = (np.log(hz / TONE_LO) / np.log(TONE_HI / TONE_LO)) if hz else 0.0
+        for k, wave in enumerate(waves):
+            wave.set_visible(hz > 0 and level >= k / len(waves))
+            wave.set_alpha(0.3 + 0.7 * level)
+        readout.set_text(f"tilt {angle:4.1f}°   " + (f"{hz:,.0f} Hz" if hz else "silent"))
+
+    n = animate.record(fig, chair + waves + [readout], pose, angles, anim_out, fps=20, dpi=80)
+    print(f"Saved: {anim_out} ({n} frames)")
+plt.close()